@@ -1,10 +1,8 @@
 import { Router, Request, Response } from 'express';
-import fs from 'fs/promises';
 import {
   generateReportPdf,
   generateGeoScorePdf,
   generateInsightsPdf,
-  cleanupTempFiles,
   type ReportData,
   type GeoScoreData,
   type InsightsData,
@@ -24,6 +22,13 @@ router.post('/pdf', async (req: Request, res: Response) => {
       });
     }
 
+    // 차트 백엔드는 생략 시 matplotlib
+    if (reportData.chartBackend !== undefined && !['matplotlib', 'vector'].includes(reportData.chartBackend)) {
+      return res.status(400).json({
+        error: 'chartBackend must be "matplotlib" or "vector"',
+      });
+    }
+
     // 기본값 설정
     const fullReportData: ReportData = {
       title: reportData.title,
@@ -47,6 +52,7 @@ router.post('/pdf', async (req: Request, res: Response) => {
       trend: reportData.trend,
       categoryDistribution: reportData.categoryDistribution,
       aiAnalysis: reportData.aiAnalysis || null,
+      chartBackend: reportData.chartBackend,
     };
 
     console.log('Generating PDF report:', fullReportData.title);
@@ -54,14 +60,13 @@ router.post('/pdf', async (req: Request, res: Response) => {
     // PDF 생성
     const result = await generateReportPdf(fullReportData);
 
-    if (!result.success || !result.pdfPath) {
+    if (!result.success || !result.pdf) {
       return res.status(500).json({
         error: result.error || 'Failed to generate PDF',
       });
     }
 
-    // PDF 파일 읽기
-    const pdfBuffer = await fs.readFile(result.pdfPath);
+    const pdfBuffer = result.pdf;
 
     // 파일명 생성
     const filename = `GEO_Report_${reportData.type}_${reportData.period.replace(/\s/g, '_')}.pdf`;
@@ -73,9 +78,6 @@ router.post('/pdf', async (req: Request, res: Response) => {
 
     // PDF 전송
     res.send(pdfBuffer);
-
-    // 임시 파일 정리 (비동기)
-    cleanupTempFiles(result.pdfPath).catch(console.error);
   } catch (error) {
     console.error('PDF generation error:', error);
     res.status(500).json({
@@ -105,19 +107,35 @@ router.post('/geo-score', async (req: Request, res: Response) => {
       });
     }
 
+    // 전체 페이지 목록(full)은 요청에서 명시한 경우에만 사용 (기본: 라우트별 섹션)
+    if (scoreData.pageAnalysis !== undefined && !['routes', 'full'].includes(scoreData.pageAnalysis)) {
+      return res.status(400).json({
+        error: 'pageAnalysis must be "routes" or "full"',
+      });
+    }
+
+    // 라우트 그룹 깊이는 1~3 정수 (생략 시 1)
+    if (
+      scoreData.routeDepth !== undefined &&
+      !(Number.isInteger(scoreData.routeDepth) && scoreData.routeDepth >= 1 && scoreData.routeDepth <= 3)
+    ) {
+      return res.status(400).json({
+        error: 'routeDepth must be an integer between 1 and 3',
+      });
+    }
+
     console.log('Generating GEO Score PDF for:', scoreData.url);
 
     // PDF 생성
     const result = await generateGeoScorePdf(scoreData);
 
-    if (!result.success || !result.pdfPath) {
+    if (!result.success || !result.pdf) {
       return res.status(500).json({
         error: result.error || 'Failed to generate PDF',
       });
     }
 
-    // PDF 파일 읽기
-    const pdfBuffer = await fs.readFile(result.pdfPath);
+    const pdfBuffer = result.pdf;
 
     // 파일명 생성 (URL에서 도메인 추출)
     let domain = 'site';
@@ -135,9 +153,6 @@ router.post('/geo-score', async (req: Request, res: Response) => {
 
     // PDF 전송
     res.send(pdfBuffer);
-
-    // 임시 파일 정리 (비동기)
-    cleanupTempFiles(result.pdfPath).catch(console.error);
   } catch (error) {
     console.error('GEO Score PDF generation error:', error);
     res.status(500).json({
@@ -163,14 +178,13 @@ router.post('/insights', async (req: Request, res: Response) => {
     // PDF 생성
     const result = await generateInsightsPdf(insightsData);
 
-    if (!result.success || !result.pdfPath) {
+    if (!result.success || !result.pdf) {
       return res.status(500).json({
         error: result.error || 'Failed to generate PDF',
       });
     }
 
-    // PDF 파일 읽기
-    const pdfBuffer = await fs.readFile(result.pdfPath);
+    const pdfBuffer = result.pdf;
 
     // 파일명 생성
     const brandName = insightsData.brandName.replace(/[^a-zA-Z0-9가-힣]/g, '_');
@@ -184,9 +198,6 @@ router.post('/insights', async (req: Request, res: Response) => {
 
     // PDF 전송
     res.send(pdfBuffer);
-
-    // 임시 파일 정리 (비동기)
-    cleanupTempFiles(result.pdfPath).catch(console.error);
   } catch (error) {
     console.error('AI Insights PDF generation error:', error);
     res.status(500).json({
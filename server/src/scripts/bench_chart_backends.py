@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Report Chart Backend Benchmark
+같은 리포트 데이터로 matplotlib(PNG) 차트 백엔드와 ReportLab 벡터 차트 백엔드를 비교한다.
+
+백엔드별 측정 항목:
+    chart_ms     차트 5종 렌더 시간 (중앙값, 차트 캐시 사용 안 함)
+    report_ms    차트 + PDF 전체 생성 시간 (중앙값)
+    pdf_bytes    생성된 PDF 크기
+    process_ms   새 인터프리터에서 import부터 PDF 생성까지 걸린 시간
+    imports      새 인터프리터에서 리포트 생성 후 matplotlib/numpy가 로드되었는지 여부
+
+Usage:
+    python bench_chart_backends.py <report_json> [--runs N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+BACKENDS = ('matplotlib', 'vector')
+
+# 벤치마크가 캐시 적중을 측정하지 않도록 차트 캐시 비활성화
+os.environ['GEO_CHART_CACHE_MEM_MB'] = '0'
+os.environ['GEO_CHART_CACHE_MAX_MB'] = '0'
+os.environ.setdefault('GEO_CHART_WORKERS', '1')
+
+# 새 인터프리터에서 리포트 하나를 생성하고 로드된 차트 라이브러리를 보고하는 스크립트
+PROCESS_SCRIPT = '''
+import json, sys, time
+started = time.perf_counter()
+import generate_report
+generate_report.generate_report(json.load(open(sys.argv[1], encoding='utf-8')), sys.argv[2])
+elapsed_ms = (time.perf_counter() - started) * 1000
+print(json.dumps({
+    'process_ms': elapsed_ms,
+    'imports': {name: name in sys.modules for name in ('matplotlib', 'numpy')},
+}))
+'''
+
+
+def median_ms(samples: list) -> float:
+    """초 단위 측정값의 중앙값 (ms)"""
+    return round(statistics.median(samples) * 1000, 1)
+
+
+def measure_in_process(data: dict, backend: str, runs: int, output_path: str) -> dict:
+    """현재 프로세스에서 차트 렌더 / 전체 생성 시간과 PDF 크기 측정 (첫 실행은 준비용으로 버림)"""
+    import generate_report
+
+    payload = {**data, 'chartBackend': backend}
+    chart_data = generate_report.build_chart_data(payload)
+
+    generate_report.generate_report(payload, output_path)
+
+    chart_samples, report_samples = [], []
+    for _ in range(runs):
+        started = time.perf_counter()
+        generate_report.render_charts(chart_data, backend)
+        chart_samples.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        generate_report.generate_report(payload, output_path)
+        report_samples.append(time.perf_counter() - started)
+
+    return {
+        'chart_ms': median_ms(chart_samples),
+        'report_ms': median_ms(report_samples),
+        'pdf_bytes': os.path.getsize(output_path),
+    }
+
+
+def measure_process(data: dict, backend: str, work_dir: str) -> dict:
+    """새 인터프리터에서 리포트 하나 생성 (import 비용 + 로드된 라이브러리 확인)"""
+    input_path = os.path.join(work_dir, f'{backend}.json')
+    with open(input_path, 'w', encoding='utf-8') as f:
+        json.dump({**data, 'chartBackend': backend}, f, ensure_ascii=False)
+
+    proc = subprocess.run(
+        [sys.executable, '-c', PROCESS_SCRIPT, input_path, os.path.join(work_dir, f'{backend}-process.pdf')],
+        cwd=SCRIPTS_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{backend} report failed: {proc.stderr.strip().splitlines()[-1:]}")
+
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result['process_ms'] = round(result['process_ms'], 1)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report chart backend benchmark')
+    parser.add_argument('input', help='리포트 데이터 JSON (ReportData)')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    sys.path.insert(0, SCRIPTS_DIR)
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for backend in BACKENDS:
+            output_path = os.path.join(work_dir, f'{backend}.pdf')
+            # 생성 스크립트의 진행 로그는 결과 JSON과 섞이지 않도록 stderr로
+            stdout, sys.stdout = sys.stdout, sys.stderr
+            try:
+                results[backend] = measure_in_process(data, backend, max(args.runs, 1), output_path)
+            finally:
+                sys.stdout = stdout
+            results[backend].update(measure_process(data, backend, work_dir))
+
+    for backend, measured in results.items():
+        loaded = [name for name, value in measured['imports'].items() if value] or ['-']
+        print(f"{backend:<11} charts {measured['chart_ms']:>7.1f}ms  report {measured['report_ms']:>7.1f}ms  "
+              f"process {measured['process_ms']:>7.1f}ms  pdf {measured['pdf_bytes']:>8} bytes  "
+              f"loaded {', '.join(loaded)}")
+
+    baseline, vector = results['matplotlib'], results['vector']
+    print(json.dumps({
+        'success': not any(results['vector']['imports'].values()),
+        'results': results,
+        'speedup': {
+            'charts': round(baseline['chart_ms'] / vector['chart_ms'], 1) if vector['chart_ms'] else None,
+            'report': round(baseline['report_ms'] / vector['report_ms'], 1) if vector['report_ms'] else None,
+        },
+        'pdfSizeRatio': round(vector['pdf_bytes'] / baseline['pdf_bytes'], 3),
+    }))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""
+Report Generator Benchmark Suite
+합성 payload(synthetic_payloads.py, small / medium / large / huge)로 네 생성기를 측정하고
+generator_baseline.json의 기준값과 비교하여 성능 회귀를 찾는다.
+
+대상:
+    report_charts   generate_report_charts.main()  (입력 JSON 파일 -> 차트 PNG 디렉토리)
+    report_pdf      generate_pdf.generate_pdf()    (차트는 준비 단계에서 미리 생성)
+    geo_score_pdf   generate_geo_score_pdf.generate_pdf()
+    insights_pdf    generate_insights_pdf.generate_pdf()
+
+(대상, 크기)마다 새 인터프리터에서 측정한다 (import/폰트 준비는 한 번 버린 뒤 측정):
+    render_ms     실행 시간 (runs회 중앙값)
+    peak_rss_mb   프로세스 최대 RSS (payload 포함, tracemalloc 없이)
+    py_peak_mb    tracemalloc으로 잰 실행 중 Python 할당 최대량 (별도 1회)
+    payload_mb    payload 생성 직후 RSS (기준선)
+    bytes, pages  출력 크기 / PDF 페이지 수 (render_stats)
+
+회귀 판정: 측정값 > max(기준값 x thresholds[지표], 기준값 + min_slack[지표]) 이면 REGRESSED
+(지표별 허용 배율과 최소 허용 폭은 기준 파일에 기록).
+차트 캐시는 끄고, 차트는 현재 프로세스에서 차례로 그린다 (GEO_CHART_WORKERS=1).
+
+Usage:
+    python bench_generators.py [--targets report_pdf,geo_score_pdf] [--sizes small,medium]
+                               [--runs N] [--baseline PATH] [--output PATH] [--update]
+
+--update: 측정한 (대상, 크기)의 기준값을 다시 기록한다 (나머지 항목은 유지).
+--output: 측정 결과 JSON을 파일로 저장한다 (변경 전후 비교용).
+회귀 항목이 있으면 종료 코드 1을 반환한다.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(SCRIPTS_DIR, 'generator_baseline.json')
+
+# 대상 -> 합성 payload 종류
+TARGETS = {
+    'report_charts': 'charts',
+    'report_pdf': 'report',
+    'geo_score_pdf': 'geo_score',
+    'insights_pdf': 'insights',
+}
+
+DEFAULT_SIZES = ('small', 'medium', 'large', 'huge')
+
+# 기준 파일이 없을 때 쓰는 지표별 허용 배율
+DEFAULT_THRESHOLDS = {
+    'render_ms': 1.25,
+    'peak_rss_mb': 1.15,
+    'py_peak_mb': 1.15,
+}
+
+# 지표별 최소 허용 폭 (작은 측정값이 잡음만으로 회귀로 판정되지 않도록)
+DEFAULT_MIN_SLACK = {
+    'render_ms': 100,
+    'peak_rss_mb': 5,
+    'py_peak_mb': 1,
+}
+
+# 측정 프로세스 환경: 차트 캐시 없이 현재 프로세스에서 차례로 렌더링
+BENCH_ENV = {
+    'GEO_CHART_CACHE_MEM_MB': '0',
+    'GEO_CHART_CACHE_MAX_MB': '0',
+    'GEO_CHART_WORKERS': '1',
+}
+
+# 새 인터프리터에서 (대상, 크기) 하나를 측정하는 스크립트
+PROCESS_SCRIPT = '''
+import sys
+import bench_generators
+bench_generators.measure_here(sys.argv[1], sys.argv[2], int(sys.argv[3]))
+'''
+
+
+# =============================================================================
+# 측정 (자식 프로세스)
+# =============================================================================
+
+def prepare_target(target: str, data: dict, workdir: str):
+    """대상별 준비 (입력 파일, 미리 그린 차트 등) 후 인자 없는 실행 함수 반환"""
+    if target == 'report_charts':
+        import generate_report_charts
+        input_path = os.path.join(workdir, 'charts.json')
+        with open(input_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        argv = ['generate_report_charts.py', input_path, os.path.join(workdir, 'charts')]
+
+        def run():
+            sys.argv = argv
+            generate_report_charts.main()
+        return run
+
+    output_path = os.path.join(workdir, f'{target}.pdf')
+
+    if target == 'report_pdf':
+        import generate_pdf
+        from chart_data import build_chart_data
+        from generate_report_charts import generate_charts
+        charts_dir = os.path.join(workdir, 'charts')
+        generate_charts(build_chart_data(data), charts_dir, generate_pdf.CHART_WIDTHS)
+        return lambda: generate_pdf.generate_pdf(data, charts_dir, output_path)
+
+    if target == 'geo_score_pdf':
+        import generate_geo_score_pdf
+        return lambda: generate_geo_score_pdf.generate_pdf(data, output_path)
+
+    if target == 'insights_pdf':
+        import generate_insights_pdf
+        return lambda: generate_insights_pdf.generate_pdf(data, output_path)
+
+    raise ValueError(f"Unknown benchmark target: {target}")
+
+
+def measure_here(target: str, size: str, runs: int):
+    """현재 프로세스에서 (대상, 크기) 측정 후 결과 JSON 한 줄 출력"""
+    import contextlib
+    import gc
+    import resource
+    import tempfile
+    import time
+    import tracemalloc
+
+    import render_stats
+    import synthetic_payloads
+
+    data = synthetic_payloads.build(TARGETS[target], size)
+    payload_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    with tempfile.TemporaryDirectory(prefix='bench-generators-') as workdir, \
+            contextlib.redirect_stdout(sys.stderr):
+        run = prepare_target(target, data, workdir)
+
+        # 준비 실행 (import, 폰트 등록, 스타일시트)
+        run()
+
+        samples = []
+        for _ in range(runs):
+            gc.collect()
+            started = time.perf_counter()
+            with render_stats.collect() as stats:
+                run()
+            samples.append((time.perf_counter() - started) * 1000)
+        peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        gc.collect()
+        tracemalloc.start()
+        run()
+        py_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    document = stats.as_dict()
+    print(json.dumps({
+        'render_ms': statistics.median(samples),
+        'peak_rss_mb': peak_kb / 1024,
+        'py_peak_mb': py_peak / (1024 * 1024),
+        'payload_mb': payload_kb / 1024,
+        'bytes': document.get('bytes'),
+        'pages': document.get('pages'),
+    }))
+
+
+# =============================================================================
+# 실행 / 비교
+# =============================================================================
+
+def measure(target: str, size: str, runs: int) -> dict:
+    """새 인터프리터에서 (대상, 크기) 하나 측정"""
+    proc = subprocess.run(
+        [sys.executable, '-c', PROCESS_SCRIPT, target, size, str(runs)],
+        cwd=SCRIPTS_DIR,
+        env={**os.environ, **BENCH_ENV},
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{target}/{size} failed: {proc.stderr.strip().splitlines()[-1:]}")
+
+    measured = json.loads(proc.stdout.strip().splitlines()[-1])
+    for name in ('render_ms', 'peak_rss_mb', 'py_peak_mb', 'payload_mb'):
+        measured[name] = round(measured[name], 1)
+    return measured
+
+
+def compare(measured: dict, baseline: dict, thresholds: dict, min_slack: dict) -> list:
+    """허용 범위를 넘은 지표 목록 [(지표, 측정값, 허용 상한)]"""
+    regressions = []
+    for name, ratio in thresholds.items():
+        reference = baseline.get(name)
+        if not reference or measured.get(name) is None:
+            continue
+        limit = round(max(reference * ratio, reference + min_slack.get(name, 0)), 1)
+        if measured[name] > limit:
+            regressions.append((name, measured[name], limit))
+    return regressions
+
+
+def environment_info() -> dict:
+    """측정 환경 정보 (bench_startup과 같은 형식, CPU 수 추가)"""
+    import bench_startup
+    return {**bench_startup.environment_info(), 'cpus': os.cpu_count()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report generator benchmark suite')
+    parser.add_argument('--targets', default=','.join(TARGETS), help='쉼표로 구분한 대상 목록')
+    parser.add_argument('--sizes', default=','.join(DEFAULT_SIZES), help='쉼표로 구분한 크기 목록')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='기준 파일 경로')
+    parser.add_argument('--output', help='측정 결과 JSON 저장 경로')
+    parser.add_argument('--update', action='store_true', help='측정값으로 기준 파일 재기록')
+    args = parser.parse_args()
+
+    targets = [target for target in args.targets.split(',') if target.strip()]
+    sizes = [size for size in args.sizes.split(',') if size.strip()]
+    for target in targets:
+        if target not in TARGETS:
+            parser.error(f"unknown target: {target} (expected one of {', '.join(TARGETS)})")
+
+    baseline = {'thresholds': dict(DEFAULT_THRESHOLDS), 'min_slack': dict(DEFAULT_MIN_SLACK), 'entries': {}}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    thresholds = baseline.get('thresholds') or DEFAULT_THRESHOLDS
+    min_slack = baseline.get('min_slack') or DEFAULT_MIN_SLACK
+    entries = baseline.setdefault('entries', {})
+
+    results = {}
+    regressed = []
+    for target in targets:
+        for size in sizes:
+            key = f'{target}/{size}'
+            measured = results[key] = measure(target, size, max(args.runs, 1))
+
+            reference = entries.get(key)
+            if reference is None:
+                status = 'NO BASELINE'
+            else:
+                regressions = compare(measured, reference, thresholds, min_slack)
+                status = 'OK'
+                if regressions:
+                    regressed.append(key)
+                    status = 'REGRESSED ' + ', '.join(
+                        f"{name} {value} > {limit}" for name, value, limit in regressions
+                    )
+            print(f"{key:<22} render {measured['render_ms']:>9.1f}ms  rss {measured['peak_rss_mb']:>6.1f}MB  "
+                  f"py {measured['py_peak_mb']:>6.1f}MB  (payload {measured['payload_mb']:>6.1f}MB)  {status}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'recorded_with': environment_info(), 'results': results}, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+
+    if args.update:
+        baseline['recorded_with'] = environment_info()
+        baseline['thresholds'] = thresholds
+        baseline['min_slack'] = min_slack
+        entries.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        print(f"Baseline updated: {args.baseline}")
+        return
+
+    print(json.dumps({'success': not regressed, 'regressed': regressed, 'results': results}))
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
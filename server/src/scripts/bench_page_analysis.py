@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+GEO Score Page Analysis Benchmark
+합성 크롤 결과(페이지 1k / 10k / 100k개)로 GEO Score PDF를 생성하여
+전체 페이지 목록(pageAnalysis=full) 렌더 시간과 최대 메모리를 page_analysis_budget.json의 예산과 비교한다.
+
+크기별로 새 인터프리터에서 측정한다:
+    render_ms     generate_pdf() 시간 (payload 생성 이후부터, 중앙값)
+    peak_rss_mb   프로세스 최대 RSS (payload 포함)
+    payload_mb    payload 생성 직후 RSS (렌더 전 기준선)
+    pages         생성된 PDF 페이지 수
+
+Usage:
+    python bench_page_analysis.py [--sizes 1000,10000,100000] [--runs N] [--update]
+
+--update: 현재 측정값에 여유분을 더해 예산 파일을 다시 기록한다.
+예산 초과 항목이 있으면 종료 코드 1을 반환한다.
+"""
+
+import argparse
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+BUDGET_PATH = os.path.join(SCRIPTS_DIR, 'page_analysis_budget.json')
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+# 예산 재기록 시 측정값에 곱하는 여유분
+BUDGET_HEADROOM = 1.3
+
+# 새 인터프리터에서 합성 payload를 만들고 PDF 하나를 메모리에 생성하는 스크립트
+PROCESS_SCRIPT = '''
+import contextlib, io, json, random, resource, sys, time
+import generate_geo_score_pdf
+
+count = int(sys.argv[1])
+rng = random.Random(count)
+sections = ['blog', 'product', 'docs', 'news', 'help', 'shop', 'about', 'careers']
+pages = []
+for index in range(count):
+    scores = {name: rng.randint(0, 20) for name in ('structure', 'schema', 'url', 'meta', 'content')}
+    scores['total'] = sum(scores.values())
+    pages.append({
+        'url': f'https://example.com/{sections[index % len(sections)]}/item-{index}/detail',
+        'title': f'Item {index}',
+        'scores': scores,
+    })
+
+data = {
+    'url': 'https://example.com',
+    'analyzedAt': '2026-01-05T09:00:00Z',
+    'renderedAt': '2026-01-05T09:00:00Z',
+    'totalScore': 50,
+    'grade': 'C',
+    'categories': {},
+    'pages': pages,
+    'recommendations': [],
+    'pageAnalysis': 'full',
+}
+payload_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+buffer = io.BytesIO()
+started = time.perf_counter()
+with contextlib.redirect_stdout(sys.stderr):
+    generate_geo_score_pdf.generate_pdf(data, buffer)
+render_ms = (time.perf_counter() - started) * 1000
+
+print(json.dumps({
+    'render_ms': render_ms,
+    'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'payload_mb': payload_kb / 1024,
+    'pages': buffer.getvalue().count(b'/Type /Page\\n'),
+}))
+'''
+
+
+def measure_size(count: int) -> dict:
+    """새 인터프리터에서 페이지 count개짜리 PDF 하나 생성"""
+    proc = subprocess.run(
+        [sys.executable, '-c', PROCESS_SCRIPT, str(count)],
+        cwd=SCRIPTS_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{count} pages failed: {proc.stderr.strip().splitlines()[-1:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def run_benchmark(sizes: list, runs: int) -> dict:
+    """크기별 runs회 측정 후 시간은 중앙값, 메모리는 최대값 반환"""
+    results = {}
+    for count in sizes:
+        samples = [measure_size(count) for _ in range(runs)]
+        results[str(count)] = {
+            'render_ms': round(statistics.median(s['render_ms'] for s in samples), 1),
+            'peak_rss_mb': round(max(s['peak_rss_mb'] for s in samples), 1),
+            'payload_mb': round(max(s['payload_mb'] for s in samples), 1),
+            'pages': samples[0]['pages'],
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GEO Score page analysis benchmark')
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help='쉼표로 구분한 페이지 수 목록')
+    parser.add_argument('--runs', type=int, default=1)
+    parser.add_argument('--update', action='store_true', help='측정값으로 예산 파일 재기록')
+    args = parser.parse_args()
+
+    with open(BUDGET_PATH, 'r', encoding='utf-8') as f:
+        budget = json.load(f)
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    results = run_benchmark(sizes, max(args.runs, 1))
+
+    entries = budget['entries']
+    over_budget = []
+    for size, measured in results.items():
+        limit = entries.get(size)
+        if limit is None:
+            status = 'NO BUDGET'
+        elif measured['render_ms'] > limit['render_ms'] or measured['peak_rss_mb'] > limit['peak_rss_mb']:
+            status = 'OVER'
+            over_budget.append(size)
+        else:
+            status = 'OK'
+        budget_text = f"(budget {limit['render_ms']}ms / {limit['peak_rss_mb']}MB)" if limit else ''
+        print(f"{size:>7} pages  render {measured['render_ms']:>9.1f}ms  peak {measured['peak_rss_mb']:>6.1f}MB "
+              f"(payload {measured['payload_mb']:>6.1f}MB)  pdf pages {measured['pages']:>5}  {budget_text}  {status}")
+
+    if args.update:
+        import bench_startup
+        budget['recorded_with'] = bench_startup.environment_info()
+        budget['entries'] = {
+            size: {
+                'render_ms': math.ceil(measured['render_ms'] * BUDGET_HEADROOM),
+                'peak_rss_mb': math.ceil(measured['peak_rss_mb'] * BUDGET_HEADROOM),
+                'measured': measured,
+            }
+            for size, measured in results.items()
+        }
+        with open(BUDGET_PATH, 'w', encoding='utf-8') as f:
+            json.dump(budget, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        print(f"Budget updated: {BUDGET_PATH}")
+        return
+
+    print(json.dumps({'success': not over_budget, 'overBudget': over_budget, 'results': results}))
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
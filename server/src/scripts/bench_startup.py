@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Report Script Startup Benchmark
+각 엔트리 포인트를 새 인터프리터에서 `python -X importtime -c "import <module>"`로 import하여
+모듈 import 시간(누적)과 프로세스 전체 시작 시간을 측정하고 startup_budget.json의 예산과 비교한다.
+
+Usage:
+    python bench_startup.py [--runs N] [--update]
+
+--update: 현재 측정값(중앙값)에 여유분을 더해 예산 파일을 다시 기록한다.
+예산 초과 항목이 있으면 종료 코드 1을 반환한다.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from importlib import metadata
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+BUDGET_PATH = os.path.join(SCRIPTS_DIR, 'startup_budget.json')
+
+# 예산 재기록 시 중앙값에 곱하는 여유분
+BUDGET_HEADROOM = 1.3
+
+
+def measure_import(module: str) -> dict:
+    """새 인터프리터에서 모듈 하나를 import하고 import 시간/전체 시간 (ms) 반환"""
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=SCRIPTS_DIR,
+        capture_output=True,
+        text=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed: {proc.stderr.strip().splitlines()[-1:]}")
+
+    import_us = None
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line.split('|')
+        # 들여쓰기 없는 최상위 항목만 대상
+        if len(parts) == 3 and parts[2].rstrip() == f' {module}':
+            import_us = int(parts[1].strip())
+
+    if import_us is None:
+        raise RuntimeError(f"No importtime entry for {module}")
+
+    return {'import_ms': import_us / 1000, 'wall_ms': wall_ms}
+
+
+def run_benchmark(modules: list, runs: int) -> dict:
+    """모듈별 runs회 측정 후 중앙값 반환 (첫 실행은 .pyc 생성용으로 버림)"""
+    results = {}
+    for module in modules:
+        measure_import(module)
+        samples = [measure_import(module) for _ in range(runs)]
+        results[module] = {
+            'import_ms': round(statistics.median(s['import_ms'] for s in samples), 1),
+            'wall_ms': round(statistics.median(s['wall_ms'] for s in samples), 1),
+        }
+    return results
+
+
+def environment_info() -> dict:
+    """측정 환경 정보 (예산 파일에 함께 기록)"""
+    info = {'python': platform.python_version(), 'platform': platform.platform()}
+    for package in ('reportlab', 'matplotlib', 'numpy'):
+        try:
+            info[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            info[package] = None
+    return info
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report script startup benchmark')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--update', action='store_true', help='측정값으로 예산 파일 재기록')
+    args = parser.parse_args()
+
+    with open(BUDGET_PATH, 'r', encoding='utf-8') as f:
+        budget = json.load(f)
+
+    entries = budget['entries']
+    results = run_benchmark(list(entries), max(args.runs, 1))
+
+    over_budget = []
+    for module, measured in results.items():
+        limit = entries[module]['import_ms']
+        status = 'OK' if measured['import_ms'] <= limit else 'OVER'
+        if status == 'OVER':
+            over_budget.append(module)
+        print(f"{module:<26} import {measured['import_ms']:>7.1f}ms "
+              f"(budget {limit:>5}ms)  process {measured['wall_ms']:>7.1f}ms  {status}")
+
+    if args.update:
+        budget['recorded_with'] = environment_info()
+        budget['entries'] = {
+            module: {
+                'import_ms': math.ceil(measured['import_ms'] * BUDGET_HEADROOM),
+                'measured_ms': measured['import_ms'],
+            }
+            for module, measured in results.items()
+        }
+        with open(BUDGET_PATH, 'w', encoding='utf-8') as f:
+            json.dump(budget, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        print(f"Budget updated: {BUDGET_PATH}")
+        return
+
+    print(json.dumps({'success': not over_budget, 'overBudget': over_budget, 'results': results}))
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
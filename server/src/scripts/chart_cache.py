@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Chart Image Cache
+렌더된 차트 PNG를 (차트 종류, 정규화된 차트 데이터, 스타일 버전, 출력 형식) 키로 캐시한다.
+기본 차트 데이터(카테고리 분포 기본값 등)나 바뀌지 않은 트렌드, 같은 리포트 재생성 시 matplotlib 렌더를 건너뛴다.
+
+- 메모리: 프로세스 내 LRU (크기 한도 초과 시 가장 오래 사용되지 않은 항목부터 제거)
+- 디스크: 프로세스/워커 간 공유 LRU (disk_cache, mtime 기준 정리)
+- 적중률: hits / misses 카운터를 stats()로 보고 (snapshot()과 함께 쓰면 작업 단위 적중률)
+
+키의 데이터 정규화는 JSON 키 정렬만 수행한다. 55와 55.0은 레이블이 다르게 그려지므로 같은 키로 보지 않는다.
+
+환경 변수:
+    GEO_CHART_CACHE_DIR      디스크 캐시 디렉토리 (기본: ~/.cache/geo-tracker/charts)
+    GEO_CHART_CACHE_MEM_MB   메모리 캐시 최대 크기 MB (기본: 64, 0 = 사용 안 함)
+    GEO_CHART_CACHE_MAX_MB   디스크 캐시 최대 크기 MB (기본: 256, 0 = 사용 안 함)
+"""
+
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+
+import disk_cache
+
+# =============================================================================
+# 전역 설정
+# =============================================================================
+
+# 키 형식 버전 (키 구성이 바뀌면 올린다)
+CACHE_FORMAT = 2
+
+DEFAULT_MEMORY_MB = 64
+DEFAULT_DISK_MB = 256
+
+
+def normalize_data(data) -> str:
+    """차트 데이터를 키 순서와 무관한 JSON 문자열로 정규화"""
+    return json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+# =============================================================================
+# 캐시
+# =============================================================================
+
+class ChartCache:
+    """차트 PNG 캐시 (메모리 LRU + 디스크 LRU, 스레드 안전)"""
+
+    def __init__(self, style_version: str, memory_bytes: int, disk_bytes: int, cache_dir: str):
+        self.style_version = style_version
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self.cache_dir = cache_dir
+
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._counters = {'memoryHits': 0, 'diskHits': 0, 'misses': 0}
+
+    @classmethod
+    def from_env(cls, style_version: str):
+        """환경 변수 설정으로 캐시 생성"""
+        return cls(
+            style_version,
+            disk_cache.env_megabytes('GEO_CHART_CACHE_MEM_MB', DEFAULT_MEMORY_MB),
+            disk_cache.env_megabytes('GEO_CHART_CACHE_MAX_MB', DEFAULT_DISK_MB),
+            disk_cache.default_cache_dir('GEO_CHART_CACHE_DIR', 'charts'),
+        )
+
+    def key(self, chart_type: str, data, variant: str) -> str:
+        """(차트 종류, 정규화된 데이터, 스타일 버전, 출력 형식(해상도/인코딩)) 캐시 키"""
+        digest = hashlib.sha256()
+        digest.update(f'{CACHE_FORMAT}|{chart_type}|{self.style_version}|{variant}|'.encode('utf-8'))
+        digest.update(normalize_data(data).encode('utf-8'))
+        return digest.hexdigest()
+
+    # -------------------------------------------------------------------------
+    # 조회 / 저장
+    # -------------------------------------------------------------------------
+
+    def get(self, key: str):
+        """캐시된 PNG 바이트 (없으면 None)"""
+        with self._lock:
+            png = self._entries.get(key)
+            if png is not None:
+                self._entries.move_to_end(key)
+                self._counters['memoryHits'] += 1
+                return png
+
+        png = self._read_disk(key)
+
+        with self._lock:
+            if png is None:
+                self._counters['misses'] += 1
+                return None
+            self._counters['diskHits'] += 1
+            self._remember(key, png)
+        return png
+
+    def put(self, key: str, png: bytes):
+        """렌더된 PNG 저장 (메모리 + 디스크)"""
+        with self._lock:
+            self._remember(key, png)
+
+        if self.disk_bytes and len(png) <= self.disk_bytes:
+            try:
+                disk_cache.write_atomic(disk_cache.entry_path(self.cache_dir, key, '.png'), png)
+                disk_cache.after_write(self.cache_dir, self.disk_bytes, '.png', len(png))
+            except OSError as e:
+                print(f"Chart cache write skipped: {e}", file=sys.stderr)
+
+    def _read_disk(self, key: str):
+        """디스크 캐시에서 PNG 읽기 (없으면 None)"""
+        if not self.disk_bytes:
+            return None
+
+        path = disk_cache.entry_path(self.cache_dir, key, '.png')
+        try:
+            with open(path, 'rb') as f:
+                png = f.read()
+        except OSError:
+            return None
+
+        disk_cache.touch(path)
+        return png
+
+    def _remember(self, key: str, png: bytes):
+        """메모리 LRU에 추가하고 한도를 넘으면 오래된 항목 제거 (lock 안에서 호출)"""
+        if not self.memory_bytes or len(png) > self.memory_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+
+        self._entries[key] = png
+        self._size += len(png)
+
+        while self._size > self.memory_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    # -------------------------------------------------------------------------
+    # 적중률
+    # -------------------------------------------------------------------------
+
+    def snapshot(self) -> dict:
+        """현재 카운터 복사본 (stats(since=...)로 구간 적중률 계산)"""
+        with self._lock:
+            return dict(self._counters)
+
+    def stats(self, since: dict = None) -> dict:
+        """적중/미스 수와 적중률 (since가 있으면 그 이후 구간만)"""
+        with self._lock:
+            counters = dict(self._counters)
+            entries, size = len(self._entries), self._size
+
+        if since:
+            counters = {name: value - since.get(name, 0) for name, value in counters.items()}
+
+        hits = counters['memoryHits'] + counters['diskHits']
+        lookups = hits + counters['misses']
+        return {
+            'hits': hits,
+            **counters,
+            'hitRate': round(hits / lookups, 3) if lookups else 0.0,
+            'entries': entries,
+            'memoryBytes': size,
+        }
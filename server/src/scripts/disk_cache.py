@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Disk Cache Helpers
+PDF 캐시(render_cache)와 차트 캐시(chart_cache)가 공유하는 디스크 캐시 공통 함수.
+
+- 항목은 <캐시 디렉토리>/<키 앞 2글자>/<키><확장자> 에 저장한다.
+- 쓰기는 임시 파일 + os.replace로 원자적으로 수행하여 병렬 워커가 반쯤 쓰인 파일을 읽지 않게 한다.
+- 조회 시 mtime을 갱신하고, 전체 크기가 한도를 넘으면 mtime이 오래된 항목부터 삭제한다 (LRU).
+- 전체 크기는 프로세스마다 추정치로 누적하고, 추정치가 한도를 넘거나 RESCAN_WRITES번 쓸 때마다만
+  디렉토리를 다시 훑어 정리한다 (쓰기마다 전체 항목을 stat하지 않음). 다른 워커가 쓴 항목은
+  다음 재조사 때 반영되므로 캐시는 잠시 한도를 조금 넘을 수 있다.
+
+무거운 라이브러리를 import하지 않으므로 차트 전용 CLI에서도 시작 시간에 영향이 없다.
+"""
+
+import os
+import uuid
+
+# 이 횟수만큼 쓰면 추정치와 관계없이 디렉토리를 다시 훑는다 (다른 워커의 쓰기 반영)
+RESCAN_WRITES = 64
+
+# 한도를 넘으면 한도의 이 비율까지 줄인다 (한도 근처에서 쓰기마다 다시 훑지 않도록)
+EVICT_TARGET = 0.9
+
+# (캐시 디렉토리, 확장자) -> [추정 전체 크기, 마지막 재조사 이후 쓰기 수]
+_usage = {}
+
+
+def default_cache_dir(env_name: str, name: str) -> str:
+    """환경 변수 또는 ~/.cache/geo-tracker/<name> 캐시 디렉토리"""
+    cache_dir = os.environ.get(env_name)
+    if cache_dir:
+        return cache_dir
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'geo-tracker', name)
+
+
+def env_megabytes(env_name: str, default_mb: int) -> int:
+    """환경 변수의 MB 값을 bytes로 변환 (잘못된 값이면 기본값)"""
+    try:
+        value = int(os.environ.get(env_name, default_mb))
+    except ValueError:
+        value = default_mb
+    return max(value, 0) * 1024 * 1024
+
+
+def entry_path(cache_dir: str, key: str, suffix: str) -> str:
+    """캐시 항목 경로 (앞 2글자로 하위 디렉토리 분할)"""
+    return os.path.join(cache_dir, key[:2], f'{key}{suffix}')
+
+
+def touch(path: str):
+    """최근 사용 표시 (LRU 정리 기준)"""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def write_atomic(path: str, payload: bytes):
+    """바이트를 임시 파일에 쓴 뒤 원자적으로 교체"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # 같은 프로세스의 여러 스레드가 같은 키를 동시에 써도 임시 파일이 겹치지 않도록 uuid 사용
+    tmp_path = f'{path}.{os.getpid()}.{uuid.uuid4().hex}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def evict(cache_dir: str, max_bytes: int, suffix: str) -> int:
+    """전체 크기가 max_bytes를 넘으면 max_bytes x EVICT_TARGET 이하가 될 때까지 오래 사용되지 않은 항목 삭제
+
+    삭제한 항목 수를 반환한다.
+    """
+    entries = []
+    total = 0
+    for root, _, files in os.walk(cache_dir):
+        for name in files:
+            if not name.endswith(suffix):
+                continue
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+    removed = 0
+    target = max_bytes * EVICT_TARGET if total > max_bytes else max_bytes
+    for _, size, path in sorted(entries):
+        if total <= target:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed += 1
+
+    _usage[(cache_dir, suffix)] = [total, 0]
+    return removed
+
+
+def after_write(cache_dir: str, max_bytes: int, suffix: str, size: int) -> int:
+    """항목 하나를 쓴 뒤 호출: 추정 크기가 한도를 넘었거나 재조사할 때가 되면 evict() (삭제 수 반환)"""
+    usage = _usage.get((cache_dir, suffix))
+    if usage is not None:
+        usage[0] += size
+        usage[1] += 1
+        if usage[0] <= max_bytes and usage[1] < RESCAN_WRITES:
+            return 0
+    return evict(cache_dir, max_bytes, suffix)
@@ -4,22 +4,30 @@ GEO Score Audit Report PDF Generator
 좌우 분리 레이아웃: 왼쪽(섹션 설명) / 오른쪽(데이터/시각자료)
 """
 
-import json
 import sys
-import os
 from datetime import datetime
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import mm, cm
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle,
-    PageBreak, HRFlowable, KeepTogether
+    SimpleDocTemplate, Paragraph, Spacer, Image, TableStyle,
+    PageBreak, HRFlowable, KeepTogether, Indenter
+)
+
+import pdf_fonts
+import pdf_styles
+import render_io
+import render_stats
+import route_index
+from pdf_styles import FrozenParagraphStyle
+from pdf_components import (
+    COLORS, CENTER_ALL, CENTER_AFTER_FIRST_COLUMN, LEFT_COL_WIDTH, RIGHT_COL_WIDTH, PagedTable, data_table_style,
+    build_document,
+    create_two_column_section, create_left_column, create_page_header, create_header_row, create_data_table,
+    get_render_time, is_deterministic,
 )
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 
 # =============================================================================
 # 전역 설정
@@ -28,26 +36,6 @@ from reportlab.pdfbase.ttfonts import TTFont
 FONT_NAME = 'Helvetica'
 FONT_NAME_BOLD = 'Helvetica-Bold'
 
-# 레이아웃 설정
-LEFT_COL_WIDTH = 5 * cm
-RIGHT_COL_WIDTH = 11.5 * cm
-
-# 컬러 시스템: 흑백 + 회색 기반, 판단 지표만 색상 사용
-COLORS = {
-    'black': '#000000',
-    'dark': '#1a1a1a',
-    'gray_dark': '#343a40',
-    'gray': '#6c757d',
-    'gray_light': '#adb5bd',
-    'gray_lighter': '#dee2e6',
-    'gray_lightest': '#f8f9fa',
-    'white': '#ffffff',
-    # 판단 색상
-    'pass': '#28a745',
-    'fail': '#dc3545',
-    'warning': '#ffc107',
-}
-
 # 등급별 색상 (판단 색상 사용)
 GRADE_COLORS = {
     'A+': COLORS['pass'],
@@ -69,46 +57,46 @@ CATEGORY_LABELS = {
     'content': 'CONTENT',
 }
 
+# 판단 기준 점수 (이상이면 PASS / WARN, 미만이면 FAIL)
+PASS_SCORE = 70
+WARN_SCORE = 50
 
-def register_korean_fonts():
-    """한글 폰트 등록"""
-    global FONT_NAME, FONT_NAME_BOLD
+# 점수 분포 섹션의 백분위수
+DISTRIBUTION_PERCENTILES = (10, 25, 50, 75, 90)
 
-    try:
-        font_paths = [
-            ("C:/Windows/Fonts/malgun.ttf", "C:/Windows/Fonts/malgunbd.ttf"),
-            ("C:/Windows/Fonts/NanumGothic.ttf", "C:/Windows/Fonts/NanumGothicBold.ttf"),
-        ]
+# 페이지 분석 표시 방식 (payload의 pageAnalysis)
+#   routes: 라우트별 섹션 (라우트당 최대 ROUTE_SECTION_MAX_PAGES개)
+#   full:   전체 페이지 목록 (필요한 만큼 페이지를 넘기며 모두 표시, 명시적으로 지정할 때만)
+# 지정하지 않으면 routes (큰 사이트에서 수백~수천 쪽짜리 문서가 되지 않도록).
+PAGE_ANALYSIS_MODES = ('routes', 'full')
+ROUTE_SECTION_MAX_PAGES = 8
 
-        for regular, bold in font_paths:
-            if os.path.exists(regular):
-                pdfmetrics.registerFont(TTFont('KoreanFont', regular))
-                if os.path.exists(bold):
-                    pdfmetrics.registerFont(TTFont('KoreanFontBold', bold))
-                else:
-                    pdfmetrics.registerFont(TTFont('KoreanFontBold', regular))
+# 페이지 테이블 열 / 전체 목록의 고정 행 높이 (pt)
+PAGES_COLUMNS = ["PATH", "STR", "SCH", "URL", "META", "TOTAL", "STATUS"]
+PAGES_COL_WIDTHS = [3.5*cm, 1.2*cm, 1.2*cm, 1.2*cm, 1.2*cm, 1.5*cm, 1.7*cm]
+PAGE_LIST_HEADER_HEIGHT = 18
+PAGE_LIST_ROW_HEIGHT = 12
 
-                FONT_NAME = 'KoreanFont'
-                FONT_NAME_BOLD = 'KoreanFontBold'
-                return True
 
-    except Exception as e:
-        print(f"Font registration error: {e}")
+def register_korean_fonts():
+    """한글 폰트 등록 (프로세스당 한 번만 수행, 파싱 결과는 pdf_fonts 캐시 사용)"""
+    global FONT_NAME, FONT_NAME_BOLD
 
-    return False
+    FONT_NAME, FONT_NAME_BOLD = pdf_fonts.register_korean_fonts()
+    return FONT_NAME != pdf_fonts.DEFAULT_FONT_NAME
 
 
 # =============================================================================
 # 스타일 시스템
 # =============================================================================
 
-def create_styles():
+def create_styles(font_name: str, font_name_bold: str) -> list:
     """감사 문서 스타일 생성"""
-    styles = getSampleStyleSheet()
+    styles = []
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='DocTitle',
-        fontName=FONT_NAME_BOLD,
+        fontName=font_name_bold,
         fontSize=18,
         leading=22,
         alignment=TA_LEFT,
@@ -116,9 +104,9 @@ def create_styles():
         textColor=colors.HexColor(COLORS['black']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='DocSubtitle',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=9,
         leading=12,
         alignment=TA_LEFT,
@@ -126,9 +114,9 @@ def create_styles():
         textColor=colors.HexColor(COLORS['gray']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='SectionTitle',
-        fontName=FONT_NAME_BOLD,
+        fontName=font_name_bold,
         fontSize=12,
         leading=16,
         alignment=TA_LEFT,
@@ -136,18 +124,18 @@ def create_styles():
         textColor=colors.HexColor(COLORS['black']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='SectionDesc',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=8,
         leading=12,
         alignment=TA_LEFT,
         textColor=colors.HexColor(COLORS['gray']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='SubSection',
-        fontName=FONT_NAME_BOLD,
+        fontName=font_name_bold,
         fontSize=10,
         leading=14,
         spaceBefore=12,
@@ -155,97 +143,97 @@ def create_styles():
         textColor=colors.HexColor(COLORS['gray_dark']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='Body',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=9,
         leading=13,
         spaceAfter=6,
         textColor=colors.HexColor(COLORS['dark']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='TableHeader',
-        fontName=FONT_NAME_BOLD,
+        fontName=font_name_bold,
         fontSize=8,
         leading=11,
         alignment=TA_CENTER,
         textColor=colors.HexColor(COLORS['white']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='TableCell',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=8,
         leading=11,
         alignment=TA_LEFT,
         textColor=colors.HexColor(COLORS['dark']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='TableCellCenter',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=8,
         leading=11,
         alignment=TA_CENTER,
         textColor=colors.HexColor(COLORS['dark']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='ScoreValue',
-        fontName=FONT_NAME_BOLD,
+        fontName=font_name_bold,
         fontSize=36,
         leading=40,
         alignment=TA_CENTER,
         textColor=colors.HexColor(COLORS['black']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='MetricValue',
-        fontName=FONT_NAME_BOLD,
+        fontName=font_name_bold,
         fontSize=20,
         leading=24,
         alignment=TA_CENTER,
         textColor=colors.HexColor(COLORS['black']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='GradeValue',
-        fontName=FONT_NAME_BOLD,
+        fontName=font_name_bold,
         fontSize=18,
         leading=22,
         alignment=TA_CENTER,
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='PageHeader',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=8,
         leading=10,
         alignment=TA_LEFT,
         textColor=colors.HexColor(COLORS['gray']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='Verdict',
-        fontName=FONT_NAME_BOLD,
+        fontName=font_name_bold,
         fontSize=9,
         leading=12,
         alignment=TA_CENTER,
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='Footer',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=7,
         leading=10,
         alignment=TA_CENTER,
         textColor=colors.HexColor(COLORS['gray_light']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='Certification',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=9,
         leading=13,
         alignment=TA_CENTER,
@@ -255,6 +243,71 @@ def create_styles():
     return styles
 
 
+pdf_styles.register_stylesheet('geo_score', create_styles)
+
+
+def get_styles():
+    """현재 폰트 설정에 맞는 공유 스타일시트 반환 (폰트 조합별로 한 번만 생성)"""
+    return pdf_styles.get_stylesheet('geo_score', FONT_NAME, FONT_NAME_BOLD)
+
+
+# =============================================================================
+# 테이블 스타일 (모듈 로드 시 한 번만 생성)
+# =============================================================================
+
+SCORE_SUMMARY_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['black'])),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
+    ('VALIGN', (0, 1), (-1, 1), 'BOTTOM'),
+    ('VALIGN', (0, 2), (-1, 2), 'TOP'),
+    ('TOPPADDING', (0, 0), (-1, 0), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('TOPPADDING', (0, 1), (-1, 1), 6),
+    ('BOTTOMPADDING', (0, 1), (-1, 1), 0),
+    ('TOPPADDING', (0, 2), (-1, 2), 0),
+    ('BOTTOMPADDING', (0, 2), (-1, 2), 6),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
+])
+
+CATEGORY_TABLE_STYLE = data_table_style(extra=CENTER_AFTER_FIRST_COLUMN)
+
+DETAIL_TABLE_STYLE = data_table_style(
+    header_color=COLORS['gray_dark'], padding=6, left_padding=6,
+    extra=(('ALIGN', (1, 0), (2, -1), 'CENTER'),),
+)
+
+RECOMMENDATION_TABLE_STYLE = data_table_style(
+    left_padding=6,
+    extra=(('ALIGN', (0, 0), (1, -1), 'CENTER'),),
+)
+
+PAGES_TABLE_STYLE = data_table_style(
+    header_color=COLORS['gray_dark'], padding=5, left_padding=4,
+    extra=CENTER_AFTER_FIRST_COLUMN + (('FONTSIZE', (0, 0), (-1, -1), 7),),
+)
+
+DISTRIBUTION_TABLE_STYLE = data_table_style(
+    header_color=COLORS['gray_dark'], padding=4, left_padding=2, zebra=False,
+    extra=CENTER_ALL + (('RIGHTPADDING', (0, 0), (-1, -1), 2),),
+)
+
+PAGE_STATS_STYLE = data_table_style(
+    header_color=COLORS['gray_dark'], padding=5, left_padding=None, zebra=False, extra=CENTER_ALL,
+)
+
+CERTIFICATION_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['black'])),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor(COLORS['gray_lightest'])),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('BOX', (0, 0), (-1, -1), 1, colors.HexColor(COLORS['gray_lighter'])),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+])
+
+
 # =============================================================================
 # 유틸리티 함수
 # =============================================================================
@@ -283,9 +336,9 @@ def create_thick_divider():
 
 def get_score_verdict(percentage):
     """점수에 따른 판단"""
-    if percentage >= 70:
+    if percentage >= PASS_SCORE:
         return "PASS", COLORS['pass']
-    elif percentage >= 50:
+    elif percentage >= WARN_SCORE:
         return "WARN", COLORS['warning']
     return "FAIL", COLORS['fail']
 
@@ -295,44 +348,30 @@ def get_grade_color(grade):
     return GRADE_COLORS.get(grade, COLORS['gray'])
 
 
-def create_two_column_section(left_content, right_content):
-    """좌우 2단 레이아웃 생성"""
-    layout_table = Table(
-        [[left_content, right_content]],
-        colWidths=[LEFT_COL_WIDTH, RIGHT_COL_WIDTH]
-    )
-    layout_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ('TOPPADDING', (0, 0), (-1, -1), 0),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-    ]))
-    return layout_table
-
-
-def create_left_column(section_title, description, styles):
-    """왼쪽 컬럼 (제목 + 설명) 생성"""
-    content = []
-    content.append(Paragraph(f"<b>{section_title}</b>", styles['SectionTitle']))
-    content.append(Spacer(1, 4))
-    content.append(Paragraph(description, styles['SectionDesc']))
-
-    left_table = Table([[c] for c in content], colWidths=[LEFT_COL_WIDTH - 0.5*cm])
-    left_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 0),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-    ]))
-    return left_table
+# 판단 -> 글자색 (전체 페이지 목록의 셀별 TEXTCOLOR 명령용)
+VERDICT_TEXT_COLORS = {
+    verdict: colors.HexColor(get_score_verdict(percentage)[1])
+    for verdict, percentage in (("PASS", 100), ("WARN", 50), ("FAIL", 0))
+}
+
+
+def format_score(value) -> str:
+    """점수 표시 (정수 점수는 소수점 없이)"""
+    return f"{value:g}"
+
+
+def shorten_path(path: str) -> str:
+    """테이블 PATH 열에 맞게 경로 축약 (20자 초과 시 앞부분 생략)"""
+    if len(path) > 20:
+        return '...' + path[-17:]
+    return path
 
 
 # =============================================================================
 # 섹션 생성 함수
 # =============================================================================
 
+@render_stats.timed()
 def create_header(data: dict, styles) -> list:
     """문서 헤더"""
     elements = []
@@ -347,20 +386,10 @@ def create_header(data: dict, styles) -> list:
         except:
             formatted_date = analyzed_at
     else:
-        formatted_date = datetime.now().strftime('%Y-%m-%d')
+        formatted_date = get_render_time(data).strftime('%Y-%m-%d')
 
     # 상단 헤더 라인
-    header_data = [[
-        Paragraph(f"<b>GEO SCORE</b>", styles['DocSubtitle']),
-        Paragraph("SITE OPTIMIZATION AUDIT", styles['DocSubtitle']),
-    ]]
-    header_table = Table(header_data, colWidths=[8*cm, 8.5*cm])
-    header_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    elements.append(header_table)
+    elements.append(create_page_header(f"<b>GEO SCORE</b>", "SITE OPTIMIZATION AUDIT", styles['DocSubtitle']))
     elements.append(Spacer(1, 20))
 
     # 메인 타이틀
@@ -374,6 +403,7 @@ def create_header(data: dict, styles) -> list:
     return elements
 
 
+@render_stats.timed()
 def create_score_summary(data: dict, styles) -> list:
     """01. SCORE SUMMARY 섹션 - 좌우 분리"""
     elements = []
@@ -426,22 +456,9 @@ def create_score_summary(data: dict, styles) -> list:
         ],
     ]
 
-    right_table = Table(score_data, colWidths=[2.8*cm, 2.8*cm, 2.8*cm, 2.8*cm], rowHeights=[None, 40, 16])
-    right_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['black'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
-        ('VALIGN', (0, 1), (-1, 1), 'BOTTOM'),
-        ('VALIGN', (0, 2), (-1, 2), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, 0), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-        ('TOPPADDING', (0, 1), (-1, 1), 6),
-        ('BOTTOMPADDING', (0, 1), (-1, 1), 0),
-        ('TOPPADDING', (0, 2), (-1, 2), 0),
-        ('BOTTOMPADDING', (0, 2), (-1, 2), 6),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-    ]))
+    right_table = create_data_table(
+        score_data, [2.8*cm, 2.8*cm, 2.8*cm, 2.8*cm], SCORE_SUMMARY_STYLE, row_heights=[None, 40, 16]
+    )
 
     elements.append(create_two_column_section(left, right_table))
     elements.append(Spacer(1, 20))
@@ -449,6 +466,7 @@ def create_score_summary(data: dict, styles) -> list:
     return elements
 
 
+@render_stats.timed()
 def create_category_section(data: dict, styles) -> list:
     """02. CATEGORY ANALYSIS 섹션 - 좌우 분리"""
     elements = []
@@ -463,13 +481,7 @@ def create_category_section(data: dict, styles) -> list:
     )
 
     # 오른쪽: 카테고리 테이블
-    header_row = [
-        Paragraph("CATEGORY", styles['TableHeader']),
-        Paragraph("SCORE", styles['TableHeader']),
-        Paragraph("RATE", styles['TableHeader']),
-        Paragraph("STATUS", styles['TableHeader']),
-    ]
-    table_data = [header_row]
+    table_data = [create_header_row(["CATEGORY", "SCORE", "RATE", "STATUS"], styles)]
 
     for key, cat in categories.items():
         label = CATEGORY_LABELS.get(key, key.upper())
@@ -487,18 +499,7 @@ def create_category_section(data: dict, styles) -> list:
         ]
         table_data.append(row)
 
-    right_table = Table(table_data, colWidths=[3.5*cm, 3*cm, 2.5*cm, 2.5*cm])
-    right_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['black'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(COLORS['gray_lightest'])]),
-    ]))
+    right_table = create_data_table(table_data, [3.5*cm, 3*cm, 2.5*cm, 2.5*cm], CATEGORY_TABLE_STYLE)
 
     elements.append(create_two_column_section(left, right_table))
     elements.append(Spacer(1, 20))
@@ -506,6 +507,7 @@ def create_category_section(data: dict, styles) -> list:
     return elements
 
 
+@render_stats.timed()
 def create_detail_section(data: dict, styles) -> list:
     """03. DETAILED ANALYSIS 섹션 - 좌우 분리"""
     elements = []
@@ -536,13 +538,7 @@ def create_detail_section(data: dict, styles) -> list:
         )
 
         # 오른쪽: 항목 테이블
-        header_row = [
-            Paragraph("ITEM", styles['TableHeader']),
-            Paragraph("SCORE", styles['TableHeader']),
-            Paragraph("STATUS", styles['TableHeader']),
-            Paragraph("DETAIL", styles['TableHeader']),
-        ]
-        table_data = [header_row]
+        table_data = [create_header_row(["ITEM", "SCORE", "STATUS", "DETAIL"], styles)]
 
         for item in items:
             passed = item.get('passed', False)
@@ -561,18 +557,7 @@ def create_detail_section(data: dict, styles) -> list:
             ]
             table_data.append(row)
 
-        right_table = Table(table_data, colWidths=[3*cm, 1.8*cm, 1.8*cm, 4.9*cm])
-        right_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['gray_dark'])),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (1, 0), (2, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(COLORS['gray_lightest'])]),
-        ]))
+        right_table = create_data_table(table_data, [3*cm, 1.8*cm, 1.8*cm, 4.9*cm], DETAIL_TABLE_STYLE)
 
         elements.append(create_two_column_section(left, right_table))
         elements.append(Spacer(1, 15))
@@ -580,6 +565,7 @@ def create_detail_section(data: dict, styles) -> list:
     return elements
 
 
+@render_stats.timed()
 def create_recommendations_section(data: dict, styles) -> list:
     """04. RECOMMENDATIONS 섹션 - 좌우 분리"""
     elements = []
@@ -602,12 +588,7 @@ def create_recommendations_section(data: dict, styles) -> list:
     )
 
     # 오른쪽: 권장사항 테이블
-    header_row = [
-        Paragraph("우선순위", styles['TableHeader']),
-        Paragraph("카테고리", styles['TableHeader']),
-        Paragraph("이슈", styles['TableHeader']),
-    ]
-    table_data = [header_row]
+    table_data = [create_header_row(["우선순위", "카테고리", "이슈"], styles)]
 
     for rec in recommendations[:8]:
         priority = rec.get('priority', 'low')
@@ -626,18 +607,7 @@ def create_recommendations_section(data: dict, styles) -> list:
         ]
         table_data.append(row)
 
-    right_table = Table(table_data, colWidths=[2.2*cm, 2.5*cm, 6.8*cm])
-    right_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['black'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(COLORS['gray_lightest'])]),
-    ]))
+    right_table = create_data_table(table_data, [2.2*cm, 2.5*cm, 6.8*cm], RECOMMENDATION_TABLE_STYLE)
 
     elements.append(create_two_column_section(left, right_table))
     elements.append(Spacer(1, 20))
@@ -645,120 +615,226 @@ def create_recommendations_section(data: dict, styles) -> list:
     return elements
 
 
-def extract_route_from_url(url: str) -> str:
-    """URL에서 라우트 경로 추출"""
-    try:
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        path = parsed.path
-        if not path or path == '/':
-            return '/'
-        # 마지막 슬래시 제거
-        path = path.rstrip('/')
-        return path
-    except:
-        return url
-
-
-def group_pages_by_route(pages: list) -> dict:
-    """페이지를 라우트별로 그룹화"""
-    grouped = {}
-    for page in pages:
-        url = page.get('url', '')
-        route = extract_route_from_url(url)
-
-        # 라우트의 첫 번째 세그먼트로 그룹화
-        segments = route.split('/')
-        if len(segments) > 1 and segments[1]:
-            group_key = '/' + segments[1]
-        else:
-            group_key = '/'
+def route_depth(data: dict) -> int:
+    """라우트 그룹 깊이 (payload의 routeDepth, 기본 1 = 첫 번째 세그먼트)"""
+    depth = data.get('routeDepth', 1)
+    if not isinstance(depth, int) or not 1 <= depth <= route_index.DEFAULT_MAX_DEPTH:
+        raise ValueError(f"routeDepth must be an integer between 1 and {route_index.DEFAULT_MAX_DEPTH}: {depth}")
+    return depth
 
-        if group_key not in grouped:
-            grouped[group_key] = []
-        grouped[group_key].append(page)
 
-    return grouped
+def page_analysis_mode(data: dict) -> str:
+    """페이지 분석 표시 방식 (지정값 검증, 미지정이면 routes)"""
+    mode = data.get('pageAnalysis') or 'routes'
+    if mode not in PAGE_ANALYSIS_MODES:
+        raise ValueError(f"Unknown page analysis mode: {mode} (expected one of {', '.join(PAGE_ANALYSIS_MODES)})")
+    return mode
 
 
-def create_pages_section(data: dict, styles) -> list:
-    """05. PAGE ANALYSIS 섹션 - 좌우 분리"""
-    elements = []
+@render_stats.timed()
+def analyze_pages(data: dict):
+    """페이지 분석 데이터 구성 (라우트 그룹 rollup + 열 기반 점수 저장소, 페이지가 1개 이하면 None)
 
+    URL은 라우트 인덱스를 만드는 한 번의 순회에서만 파싱하고, 같은 순회에서 채운 열을 점수 저장소가 넘겨받는다.
+    집계와 테이블 행은 모두 점수 저장소의 배열에서 얻는다.
+    """
     pages = data.get('pages', [])
     if len(pages) <= 1:
-        return elements
+        return None
 
-    # 페이지를 라우트별로 그룹화
-    grouped_pages = group_pages_by_route(pages)
+    import page_scores  # NumPy는 페이지 분석이 필요할 때만 로드
 
-    for route, route_pages in grouped_pages.items():
-        route_display = route if route != '/' else '/ (root)'
+    depth = route_depth(data)
+    index = route_index.RouteIndex(pages, max_depth=depth)
+    return {
+        'groups': index.groups(depth),
+        'scores': page_scores.PageScores.from_index(index, depth),
+    }
 
-        # 왼쪽: 라우트 설명
-        left = create_left_column(
-            f"Route: {route_display}",
-            f"해당 경로의 {len(route_pages)}개 페이지별 카테고리 점수입니다.",
-            styles
-        )
 
-        # 오른쪽: 페이지 테이블
-        header_row = [
-            Paragraph("PATH", styles['TableHeader']),
-            Paragraph("STR", styles['TableHeader']),
-            Paragraph("SCH", styles['TableHeader']),
-            Paragraph("URL", styles['TableHeader']),
-            Paragraph("META", styles['TableHeader']),
-            Paragraph("TOTAL", styles['TableHeader']),
-            Paragraph("STATUS", styles['TableHeader']),
-        ]
-        table_data = [header_row]
+@render_stats.timed()
+def create_distribution_section(analysis, styles) -> list:
+    """PAGE SCORE DISTRIBUTION 섹션 - 좌우 분리 (구간별 페이지 수, 백분위수, 카테고리 평균)"""
+    if analysis is None:
+        return []
 
-        for page in route_pages[:8]:  # 라우트당 최대 8개
-            url = page.get('url', '')
-            path = extract_route_from_url(url)
+    scores = analysis['scores']
+    cell_style = styles['TableCellCenter']
 
-            # 경로 표시 (너무 길면 축약)
-            if len(path) > 20:
-                path_display = '...' + path[-17:]
-            else:
-                path_display = path
+    left = create_left_column(
+        "Score Distribution",
+        f"전체 {len(scores)}개 페이지의 총점 분포와 백분위수, 카테고리별 평균 점수입니다.",
+        styles
+    )
 
-            scores = page.get('scores', {})
-            total = scores.get('total', 0)
+    histogram = scores.histogram()
+    share = 100 / len(scores)
+    histogram_table = create_data_table(
+        [
+            create_header_row([f"{start}-{end}" for start, end, _ in histogram], styles),
+            [Paragraph(f"<b>{count}</b>", cell_style) for _, _, count in histogram],
+            [Paragraph(f"{count * share:.0f}%", cell_style) for _, _, count in histogram],
+        ],
+        [RIGHT_COL_WIDTH / len(histogram)] * len(histogram),
+        DISTRIBUTION_TABLE_STYLE,
+    )
+
+    percentiles = scores.percentiles(DISTRIBUTION_PERCENTILES)
+    verdicts = scores.verdict_counts(PASS_SCORE, WARN_SCORE)
+    percentile_labels = [f"P{q}" for q in percentiles] + ["MEAN", "PASS", "WARN", "FAIL"]
+    percentile_values = [f"{value:.1f}" for value in percentiles.values()] + [
+        f"{scores.mean():.1f}", verdicts["PASS"], verdicts["WARN"], verdicts["FAIL"],
+    ]
+    percentile_table = create_data_table(
+        [
+            create_header_row(percentile_labels, styles),
+            [Paragraph(f"<b>{value}</b>", cell_style) for value in percentile_values],
+        ],
+        [RIGHT_COL_WIDTH / len(percentile_labels)] * len(percentile_labels),
+        DISTRIBUTION_TABLE_STYLE,
+    )
+
+    category_means = scores.category_means()
+    category_table = create_data_table(
+        [
+            create_header_row([CATEGORY_LABELS.get(field, field.upper()) for field in category_means], styles),
+            [Paragraph(f"{value:.1f}", cell_style) for value in category_means.values()],
+        ],
+        [RIGHT_COL_WIDTH / len(category_means)] * len(category_means),
+        DISTRIBUTION_TABLE_STYLE,
+    )
+
+    right = [histogram_table, Spacer(1, 6), percentile_table, Spacer(1, 6), category_table]
+    return [create_two_column_section(left, right), Spacer(1, 20)]
+
+
+@render_stats.timed()
+def create_pages_section(data: dict, analysis, styles) -> list:
+    """05. PAGE ANALYSIS 섹션 - 좌우 분리"""
+    if analysis is None:
+        return []
+
+    if page_analysis_mode(data) == 'full':
+        return create_page_list_section(analysis, styles)
+    return create_route_sections(analysis, styles)
+
+
+def create_route_sections(analysis, styles):
+    """라우트별 페이지 테이블 (라우트당 최대 ROUTE_SECTION_MAX_PAGES개, 라우트마다 차례로 생성)"""
+    # 라우트 ID = 그룹 순서이므로 배열 위치로 바로 조회
+    scores = analysis['scores']
+    means = scores.route_means()
+    mins = scores.route_mins()
+
+    for route_id, (route, group) in enumerate(analysis['groups'].items()):
+        start, stop = scores.route_range(route_id)
+        route_display = route if route != '/' else '/ (root)'
+
+        # 왼쪽: 라우트 설명 + 점수 요약 (잘린 경우 표시 개수 명시)
+        if group.count > ROUTE_SECTION_MAX_PAGES:
+            description = f"해당 경로의 {group.count}개 페이지 중 {ROUTE_SECTION_MAX_PAGES}개의 카테고리 점수입니다."
+        else:
+            description = f"해당 경로의 {group.count}개 페이지별 카테고리 점수입니다."
+        if group.count > 1:
+            description += f" 평균 {means[route_id]:.1f}점, 최저 {mins[route_id]:g}점."
+        left = create_left_column(f"Route: {route_display}", description, styles)
+
+        # 오른쪽: 페이지 테이블
+        table_data = [create_header_row(PAGES_COLUMNS, styles)]
+
+        for path, structure, schema, url, meta, _, total in scores.rows(start, min(stop, start + ROUTE_SECTION_MAX_PAGES)):
             verdict, verdict_color = get_score_verdict(total)
 
             row = [
-                Paragraph(path_display, styles['TableCell']),
-                Paragraph(str(scores.get('structure', 0)), styles['TableCellCenter']),
-                Paragraph(str(scores.get('schema', 0)), styles['TableCellCenter']),
-                Paragraph(str(scores.get('url', 0)), styles['TableCellCenter']),
-                Paragraph(str(scores.get('meta', 0)), styles['TableCellCenter']),
-                Paragraph(f"<b>{total}</b>", styles['TableCellCenter']),
+                Paragraph(shorten_path(path), styles['TableCell']),
+                Paragraph(format_score(structure), styles['TableCellCenter']),
+                Paragraph(format_score(schema), styles['TableCellCenter']),
+                Paragraph(format_score(url), styles['TableCellCenter']),
+                Paragraph(format_score(meta), styles['TableCellCenter']),
+                Paragraph(f"<b>{format_score(total)}</b>", styles['TableCellCenter']),
                 Paragraph(f"<font color='{verdict_color}'><b>{verdict}</b></font>", styles['TableCellCenter']),
             ]
             table_data.append(row)
 
-        right_table = Table(table_data, colWidths=[3.5*cm, 1.2*cm, 1.2*cm, 1.2*cm, 1.2*cm, 1.5*cm, 1.7*cm])
-        right_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['gray_dark'])),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('FONTSIZE', (0, 0), (-1, -1), 7),
-            ('TOPPADDING', (0, 0), (-1, -1), 5),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-            ('LEFTPADDING', (0, 0), (-1, -1), 4),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(COLORS['gray_lightest'])]),
-        ]))
+        right_table = create_data_table(table_data, PAGES_COL_WIDTHS, PAGES_TABLE_STYLE)
 
-        elements.append(create_two_column_section(left, right_table))
-        elements.append(Spacer(1, 15))
+        yield create_two_column_section(left, right_table)
+        yield Spacer(1, 15)
 
-    return elements
+
+def page_list_style():
+    """전체 페이지 목록 스타일 (현재 폰트 기준, 폰트 조합별로 한 번만 생성)"""
+    return data_table_style(
+        header_color=COLORS['gray_dark'], padding=2, left_padding=4,
+        extra=CENTER_AFTER_FIRST_COLUMN + (
+            ('FONT', (0, 1), (-1, -1), FONT_NAME, 7),
+            ('FONT', (5, 1), (6, -1), FONT_NAME_BOLD, 7),
+            ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor(COLORS['dark'])),
+        ),
+    )
 
 
+def verdict_commands(rows: list) -> list:
+    """페이지 분량 행의 STATUS 셀 글자색 (헤더가 0행이므로 본문은 1행부터)"""
+    return [
+        ('TEXTCOLOR', (6, index), (6, index), VERDICT_TEXT_COLORS[row[6]])
+        for index, row in enumerate(rows, start=1)
+    ]
+
+
+def page_list_rows(scores):
+    """전체 페이지 목록의 행 (라우트 순서, PagedTable이 페이지 분량씩 꺼내 쓴다)"""
+    for path, structure, schema, url, meta, _, total in scores.rows():
+        yield (
+            shorten_path(path),
+            format_score(structure), format_score(schema), format_score(url), format_score(meta),
+            format_score(total),
+            get_score_verdict(total)[0],
+        )
+
+
+def create_page_list_section(analysis, styles) -> list:
+    """전체 페이지 목록 (라우트 순서, 고정 행 높이, 페이지마다 헤더 반복)
+
+    셀은 Paragraph 대신 문자열로 두어 페이지 수만큼의 Flowable을 만들지 않고,
+    행은 그려질 페이지 분량씩만 만든다.
+    """
+    scores = analysis['scores']
+
+    # 왼쪽: 섹션 설명 / 오른쪽: 요약 지표
+    left = create_left_column(
+        "Page Analysis",
+        f"분석한 전체 {len(scores)}개 페이지의 카테고리 점수입니다. 라우트별로 묶어 표시합니다.",
+        styles
+    )
+
+    verdict_counts = scores.verdict_counts(PASS_SCORE, WARN_SCORE)
+    stats_data = [
+        create_header_row(["PAGES", "ROUTES", "AVG", "PASS", "WARN", "FAIL"], styles),
+        [Paragraph(f"<b>{value}</b>", styles['TableCellCenter']) for value in (
+            len(scores), len(scores.routes), f"{scores.mean():.1f}",
+            verdict_counts["PASS"], verdict_counts["WARN"], verdict_counts["FAIL"],
+        )],
+    ]
+    stats_table = create_data_table(stats_data, [RIGHT_COL_WIDTH / 6] * 6, PAGE_STATS_STYLE)
+
+    page_list = PagedTable(
+        create_header_row(PAGES_COLUMNS, styles), page_list_rows(scores), PAGES_COL_WIDTHS, page_list_style(),
+        PAGE_LIST_ROW_HEIGHT, PAGE_LIST_HEADER_HEIGHT, row_commands=verdict_commands, count=len(scores),
+    )
+
+    # 목록은 오른쪽 컬럼 위치에 맞춰 왼쪽 컬럼 폭만큼 들여쓴다
+    return [
+        create_two_column_section(left, stats_table),
+        Spacer(1, 10),
+        Indenter(left=LEFT_COL_WIDTH),
+        page_list,
+        Indenter(left=-LEFT_COL_WIDTH),
+        Spacer(1, 15),
+    ]
+
+
+@render_stats.timed()
 def create_certification_section(data: dict, styles) -> list:
     """06. CERTIFICATION 섹션 - 좌우 분리"""
     elements = []
@@ -766,6 +842,7 @@ def create_certification_section(data: dict, styles) -> list:
     total_score = data.get('totalScore', 0)
     grade = data.get('grade', 'F')
     grade_color = get_grade_color(grade)
+    render_time = get_render_time(data)
 
     # 왼쪽: 섹션 설명
     left = create_left_column(
@@ -781,26 +858,18 @@ def create_certification_section(data: dict, styles) -> list:
         [Paragraph(f"<font size='16'><b>Final Score: {total_score}/100</b></font>", styles['Certification'])],
         [Paragraph(f"<font size='14' color='{grade_color}'><b>Grade: {grade}</b></font>", styles['Certification'])],
         [Paragraph(" ", styles['Body'])],
-        [Paragraph(f"Document ID: GEO-{datetime.now().strftime('%Y%m%d%H%M%S')}", styles['Certification'])],
-        [Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}", styles['Certification'])],
+        [Paragraph(f"Document ID: GEO-{render_time.strftime('%Y%m%d%H%M%S')}", styles['Certification'])],
+        [Paragraph(f"Generated: {render_time.strftime('%Y-%m-%d %H:%M')}", styles['Certification'])],
     ]
 
-    right_table = Table(cert_data, colWidths=[11.5*cm])
-    right_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['black'])),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor(COLORS['gray_lightest'])),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('BOX', (0, 0), (-1, -1), 1, colors.HexColor(COLORS['gray_lighter'])),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
+    right_table = create_data_table(cert_data, [11.5*cm], CERTIFICATION_STYLE)
 
     elements.append(create_two_column_section(left, right_table))
 
     return elements
 
 
+@render_stats.timed()
 def create_footer(styles) -> list:
     """푸터"""
     elements = []
@@ -826,7 +895,7 @@ def create_footer(styles) -> list:
 def generate_pdf(data: dict, output_path: str):
     """PDF 문서 생성"""
     register_korean_fonts()
-    styles = create_styles()
+    styles = get_styles()
 
     doc = SimpleDocTemplate(
         output_path,
@@ -837,52 +906,48 @@ def generate_pdf(data: dict, output_path: str):
         bottomMargin=1.5*cm,
         title='GEO Score Audit Report',
         author='GEO Tracker',
+        invariant=is_deterministic(data) or None,
     )
 
-    elements = []
+    build_document(doc, build_story(data, styles))
+    return output_path
 
+
+def build_story(data: dict, styles):
+    """문서 Flowable을 순서대로 생성 (doc.build가 배치하는 만큼만 섹션이 진행된다)"""
     # Header
-    elements.extend(create_header(data, styles))
+    yield from create_header(data, styles)
 
     # Score Summary
-    elements.extend(create_score_summary(data, styles))
+    yield from create_score_summary(data, styles)
 
     # Category Analysis
-    elements.extend(create_category_section(data, styles))
+    yield from create_category_section(data, styles)
 
     # Detailed Analysis
-    elements.extend(create_detail_section(data, styles))
+    yield from create_detail_section(data, styles)
 
     # Page Break
-    elements.append(PageBreak())
+    yield PageBreak()
 
     # 상단 헤더 반복
-    header_data = [[
-        Paragraph(f"<b>GEO SCORE</b>", styles['PageHeader']),
-        Paragraph("SITE OPTIMIZATION AUDIT", styles['PageHeader']),
-    ]]
-    header_table = Table(header_data, colWidths=[8*cm, 8.5*cm])
-    header_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-    ]))
-    elements.append(header_table)
-    elements.append(Spacer(1, 20))
+    yield create_page_header(f"<b>GEO SCORE</b>", "SITE OPTIMIZATION AUDIT", styles['PageHeader'])
+    yield Spacer(1, 20)
 
     # Recommendations
-    elements.extend(create_recommendations_section(data, styles))
+    yield from create_recommendations_section(data, styles)
 
-    # Page Analysis
-    elements.extend(create_pages_section(data, styles))
+    # Page Analysis (라우트 인덱스 + 점수 저장소를 두 섹션이 공유)
+    analysis = analyze_pages(data)
+    yield from create_distribution_section(analysis, styles)
+    yield from create_pages_section(data, analysis, styles)
 
     # Certification
-    elements.extend(create_certification_section(data, styles))
+    yield from create_certification_section(data, styles)
 
     # Footer
-    elements.extend(create_footer(styles))
+    yield from create_footer(styles)
 
-    doc.build(elements)
-    return output_path
 
 
 def main():
@@ -890,34 +955,10 @@ def main():
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
     if len(sys.argv) < 3:
-        print("Usage: python generate_geo_score_pdf.py <input_json> <output_pdf>")
+        print("Usage: python generate_geo_score_pdf.py <input_json|-> <output_pdf|->")
         sys.exit(1)
 
-    input_path = sys.argv[1]
-    output_path = sys.argv[2]
-
-    try:
-        with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except Exception as e:
-        print(json.dumps({
-            'success': False,
-            'error': f"Error loading JSON: {str(e)}"
-        }, ensure_ascii=False))
-        sys.exit(1)
-
-    try:
-        result_path = generate_pdf(data, output_path)
-        print(json.dumps({
-            'success': True,
-            'path': result_path
-        }, ensure_ascii=False))
-    except Exception as e:
-        print(json.dumps({
-            'success': False,
-            'error': str(e)
-        }, ensure_ascii=False))
-        sys.exit(1)
+    render_io.run_cli(sys.argv[1], sys.argv[2], generate_pdf, job='geo_score_pdf')
 
 
 if __name__ == '__main__':
@@ -5,22 +5,29 @@ AI 인사이트 분석 리포트를 PDF 문서로 생성한다.
 좌우 분리 레이아웃: 왼쪽(섹션 설명) / 오른쪽(데이터 테이블)
 """
 
-import json
 import sys
-import os
 from datetime import datetime
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import mm, cm
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+    SimpleDocTemplate, Paragraph, Spacer,
     PageBreak, HRFlowable, KeepTogether, ListFlowable, ListItem
 )
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+
+import pdf_fonts
+import pdf_styles
+import render_io
+import render_stats
+from pdf_styles import FrozenParagraphStyle
+import pdf_components
+from pdf_components import (
+    CENTER_ALL, data_table_style, build_document,
+    create_two_column_section, create_left_column, create_page_header, create_header_row, create_data_table,
+    get_render_time, is_deterministic,
+)
 
 # =============================================================================
 # 전역 설정
@@ -29,26 +36,12 @@ from reportlab.pdfbase.ttfonts import TTFont
 FONT_NAME = 'Helvetica'
 FONT_NAME_BOLD = 'Helvetica-Bold'
 
-# 레이아웃 설정
-LEFT_COL_WIDTH = 5 * cm
-RIGHT_COL_WIDTH = 11.5 * cm
-
-# 컬러 시스템
+# 컬러 시스템 (공통 팔레트 + 인사이트 리포트 전용 색상)
 COLORS = {
-    'black': '#000000',
-    'dark': '#1a1a1a',
-    'gray_dark': '#343a40',
-    'gray': '#6c757d',
-    'gray_light': '#adb5bd',
-    'gray_lighter': '#dee2e6',
-    'gray_lightest': '#f8f9fa',
-    'white': '#ffffff',
+    **pdf_components.COLORS,
     'violet': '#7c3aed',
     'grape': '#9333ea',
     'purple': '#a855f7',
-    'pass': '#28a745',
-    'fail': '#dc3545',
-    'warning': '#ffc107',
     'info': '#17a2b8',
 }
 
@@ -66,44 +59,24 @@ IMPORTANCE_COLORS = {
 
 
 def register_korean_fonts():
-    """한글 폰트 등록"""
+    """한글 폰트 등록 (프로세스당 한 번만 수행, 파싱 결과는 pdf_fonts 캐시 사용)"""
     global FONT_NAME, FONT_NAME_BOLD
 
-    try:
-        font_paths = [
-            ("C:/Windows/Fonts/malgun.ttf", "C:/Windows/Fonts/malgunbd.ttf"),
-            ("C:/Windows/Fonts/NanumGothic.ttf", "C:/Windows/Fonts/NanumGothicBold.ttf"),
-        ]
-
-        for regular, bold in font_paths:
-            if os.path.exists(regular):
-                pdfmetrics.registerFont(TTFont('KoreanFont', regular))
-                if os.path.exists(bold):
-                    pdfmetrics.registerFont(TTFont('KoreanFontBold', bold))
-                else:
-                    pdfmetrics.registerFont(TTFont('KoreanFontBold', regular))
-
-                FONT_NAME = 'KoreanFont'
-                FONT_NAME_BOLD = 'KoreanFontBold'
-                return True
-
-    except Exception as e:
-        print(f"Font registration error: {e}")
-
-    return False
+    FONT_NAME, FONT_NAME_BOLD = pdf_fonts.register_korean_fonts()
+    return FONT_NAME != pdf_fonts.DEFAULT_FONT_NAME
 
 
 # =============================================================================
 # 스타일 시스템
 # =============================================================================
 
-def create_styles():
+def create_styles(font_name: str, font_name_bold: str) -> list:
     """문서 스타일 생성"""
-    styles = getSampleStyleSheet()
+    styles = []
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='DocTitle',
-        fontName=FONT_NAME_BOLD,
+        fontName=font_name_bold,
         fontSize=18,
         leading=22,
         alignment=TA_LEFT,
@@ -111,9 +84,9 @@ def create_styles():
         textColor=colors.HexColor(COLORS['black']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='DocSubtitle',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=9,
         leading=12,
         alignment=TA_LEFT,
@@ -121,18 +94,18 @@ def create_styles():
         textColor=colors.HexColor(COLORS['gray']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='SectionNumber',
-        fontName=FONT_NAME_BOLD,
+        fontName=font_name_bold,
         fontSize=9,
         leading=12,
         alignment=TA_LEFT,
         textColor=colors.HexColor(COLORS['gray']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='SectionTitle',
-        fontName=FONT_NAME_BOLD,
+        fontName=font_name_bold,
         fontSize=12,
         leading=16,
         alignment=TA_LEFT,
@@ -140,81 +113,81 @@ def create_styles():
         textColor=colors.HexColor(COLORS['black']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='SectionDesc',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=8,
         leading=12,
         alignment=TA_LEFT,
         textColor=colors.HexColor(COLORS['gray']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='Body',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=9,
         leading=13,
         spaceAfter=6,
         textColor=colors.HexColor(COLORS['dark']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='TableHeader',
-        fontName=FONT_NAME_BOLD,
+        fontName=font_name_bold,
         fontSize=8,
         leading=11,
         alignment=TA_LEFT,
         textColor=colors.HexColor(COLORS['white']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='TableCell',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=8,
         leading=11,
         alignment=TA_LEFT,
         textColor=colors.HexColor(COLORS['dark']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='TableCellCenter',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=8,
         leading=11,
         alignment=TA_CENTER,
         textColor=colors.HexColor(COLORS['dark']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='MetricValue',
-        fontName=FONT_NAME_BOLD,
+        fontName=font_name_bold,
         fontSize=20,
         leading=24,
         alignment=TA_CENTER,
         textColor=colors.HexColor(COLORS['black']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='MetricLabel',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=7,
         leading=10,
         alignment=TA_CENTER,
         textColor=colors.HexColor(COLORS['gray']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='Footer',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=7,
         leading=10,
         alignment=TA_CENTER,
         textColor=colors.HexColor(COLORS['gray_light']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='PageHeader',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=8,
         leading=10,
         alignment=TA_LEFT,
@@ -224,6 +197,31 @@ def create_styles():
     return styles
 
 
+pdf_styles.register_stylesheet('insights', create_styles)
+
+
+def get_styles():
+    """현재 폰트 설정에 맞는 공유 스타일시트 반환 (폰트 조합별로 한 번만 생성)"""
+    return pdf_styles.get_stylesheet('insights', FONT_NAME, FONT_NAME_BOLD)
+
+
+# =============================================================================
+# 테이블 스타일 (모듈 로드 시 한 번만 생성)
+# =============================================================================
+
+SUMMARY_TABLE_STYLE = data_table_style(padding=10, left_padding=None, zebra=False, extra=CENTER_ALL)
+
+PATTERNS_TABLE_STYLE = data_table_style(
+    header_color=None, valign='TOP', zebra=False,
+    extra=(
+        ('BACKGROUND', (0, 0), (0, 0), colors.HexColor(COLORS['pass'])),
+        ('BACKGROUND', (1, 0), (1, 0), colors.HexColor(COLORS['fail'])),
+    ),
+)
+
+CONTENT_GAPS_TABLE_STYLE = data_table_style(header_color=COLORS['warning'], header_text_color=COLORS['dark'])
+
+
 # =============================================================================
 # 유틸리티 함수
 # =============================================================================
@@ -238,45 +236,11 @@ def get_importance_label(importance):
     return labels.get(importance, importance)
 
 
-def create_two_column_section(left_content, right_content):
-    """좌우 2단 레이아웃 생성"""
-    layout_table = Table(
-        [[left_content, right_content]],
-        colWidths=[LEFT_COL_WIDTH, RIGHT_COL_WIDTH]
-    )
-    layout_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ('TOPPADDING', (0, 0), (-1, -1), 0),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-    ]))
-    return layout_table
-
-
-def create_left_column(section_title, description, styles):
-    """왼쪽 컬럼 (제목 + 설명) 생성"""
-    content = []
-    content.append(Paragraph(f"<b>{section_title}</b>", styles['SectionTitle']))
-    content.append(Spacer(1, 4))
-    content.append(Paragraph(description, styles['SectionDesc']))
-
-    # Table로 감싸서 반환
-    left_table = Table([[c] for c in content], colWidths=[LEFT_COL_WIDTH - 0.5*cm])
-    left_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 0),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-    ]))
-    return left_table
-
-
 # =============================================================================
 # 섹션 생성 함수
 # =============================================================================
 
+@render_stats.timed()
 def create_header(data: dict, styles) -> list:
     """문서 헤더"""
     elements = []
@@ -291,20 +255,10 @@ def create_header(data: dict, styles) -> list:
         except:
             formatted_date = analyzed_at
     else:
-        formatted_date = datetime.now().strftime('%Y-%m-%d')
+        formatted_date = get_render_time(data).strftime('%Y-%m-%d')
 
     # 상단 헤더 라인
-    header_data = [[
-        Paragraph(f"<b>{brand_name}</b>", styles['PageHeader']),
-        Paragraph("AI INSIGHTS REPORT", styles['PageHeader']),
-    ]]
-    header_table = Table(header_data, colWidths=[8*cm, 8.5*cm])
-    header_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    elements.append(header_table)
+    elements.append(create_page_header(f"<b>{brand_name}</b>", "AI INSIGHTS REPORT", styles['PageHeader']))
     elements.append(Spacer(1, 20))
 
     # 메인 타이틀
@@ -315,6 +269,7 @@ def create_header(data: dict, styles) -> list:
     return elements
 
 
+@render_stats.timed()
 def create_summary_section(data: dict, styles) -> list:
     """01. SUMMARY 섹션 - 좌우 분리"""
     elements = []
@@ -351,16 +306,7 @@ def create_summary_section(data: dict, styles) -> list:
         ],
     ]
 
-    right_table = Table(summary_data, colWidths=[2.2*cm, 2.2*cm, 2.2*cm, 2.2*cm, 2.2*cm])
-    right_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['black'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-    ]))
+    right_table = create_data_table(summary_data, [2.2*cm, 2.2*cm, 2.2*cm, 2.2*cm, 2.2*cm], SUMMARY_TABLE_STYLE)
 
     elements.append(create_two_column_section(left, right_table))
     elements.append(Spacer(1, 20))
@@ -368,6 +314,7 @@ def create_summary_section(data: dict, styles) -> list:
     return elements
 
 
+@render_stats.timed()
 def create_keywords_section(data: dict, styles) -> list:
     """02. KEYWORDS 섹션 - 좌우 분리"""
     elements = []
@@ -384,11 +331,7 @@ def create_keywords_section(data: dict, styles) -> list:
     )
 
     # 오른쪽: 키워드 테이블
-    header_row = [
-        Paragraph("키워드", styles['TableHeader']),
-        Paragraph("설명", styles['TableHeader']),
-    ]
-    table_data = [header_row]
+    table_data = [create_header_row(["키워드", "설명"], styles)]
 
     for kw in keywords[:10]:
         description = kw.get('description', '')
@@ -401,17 +344,7 @@ def create_keywords_section(data: dict, styles) -> list:
         ]
         table_data.append(row)
 
-    right_table = Table(table_data, colWidths=[3.5*cm, 8*cm])
-    right_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['black'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(COLORS['gray_lightest'])]),
-    ]))
+    right_table = create_data_table(table_data, [3.5*cm, 8*cm])
 
     elements.append(create_two_column_section(left, right_table))
     elements.append(Spacer(1, 20))
@@ -419,6 +352,7 @@ def create_keywords_section(data: dict, styles) -> list:
     return elements
 
 
+@render_stats.timed()
 def create_category_section(data: dict, styles) -> list:
     """03. CATEGORY INSIGHTS 섹션 - 좌우 분리"""
     elements = []
@@ -435,11 +369,7 @@ def create_category_section(data: dict, styles) -> list:
     )
 
     # 오른쪽: 카테고리 테이블
-    header_row = [
-        Paragraph("카테고리", styles['TableHeader']),
-        Paragraph("권장사항", styles['TableHeader']),
-    ]
-    table_data = [header_row]
+    table_data = [create_header_row(["카테고리", "권장사항"], styles)]
 
     for cat in categories[:8]:
         recommendation = cat.get('recommendation', '')
@@ -452,17 +382,7 @@ def create_category_section(data: dict, styles) -> list:
         ]
         table_data.append(row)
 
-    right_table = Table(table_data, colWidths=[3.5*cm, 8*cm])
-    right_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['black'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(COLORS['gray_lightest'])]),
-    ]))
+    right_table = create_data_table(table_data, [3.5*cm, 8*cm])
 
     elements.append(create_two_column_section(left, right_table))
     elements.append(Spacer(1, 20))
@@ -470,6 +390,7 @@ def create_category_section(data: dict, styles) -> list:
     return elements
 
 
+@render_stats.timed()
 def create_patterns_section(data: dict, styles) -> list:
     """04. CITATION PATTERNS 섹션 - 좌우 분리"""
     elements = []
@@ -489,11 +410,7 @@ def create_patterns_section(data: dict, styles) -> list:
     )
 
     # 오른쪽: 패턴 테이블
-    header_row = [
-        Paragraph("인용 성공 패턴", styles['TableHeader']),
-        Paragraph("인용 실패 패턴", styles['TableHeader']),
-    ]
-    table_data = [header_row]
+    table_data = [create_header_row(["인용 성공 패턴", "인용 실패 패턴"], styles)]
 
     max_rows = max(len(cited), len(uncited), 1)
     for i in range(min(max_rows, 5)):
@@ -511,17 +428,7 @@ def create_patterns_section(data: dict, styles) -> list:
         ]
         table_data.append(row)
 
-    right_table = Table(table_data, colWidths=[5.75*cm, 5.75*cm])
-    right_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, 0), colors.HexColor(COLORS['pass'])),
-        ('BACKGROUND', (1, 0), (1, 0), colors.HexColor(COLORS['fail'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-    ]))
+    right_table = create_data_table(table_data, [5.75*cm, 5.75*cm], PATTERNS_TABLE_STYLE)
 
     elements.append(create_two_column_section(left, right_table))
     elements.append(Spacer(1, 20))
@@ -529,6 +436,7 @@ def create_patterns_section(data: dict, styles) -> list:
     return elements
 
 
+@render_stats.timed()
 def create_content_gaps_section(data: dict, styles) -> list:
     """05. CONTENT GAPS 섹션 - 좌우 분리"""
     elements = []
@@ -545,11 +453,7 @@ def create_content_gaps_section(data: dict, styles) -> list:
     )
 
     # 오른쪽: 갭 테이블
-    header_row = [
-        Paragraph("영역", styles['TableHeader']),
-        Paragraph("권장사항", styles['TableHeader']),
-    ]
-    table_data = [header_row]
+    table_data = [create_header_row(["영역", "권장사항"], styles)]
 
     for gap in gaps[:6]:
         recommendation = gap.get('recommendation', '')
@@ -562,17 +466,7 @@ def create_content_gaps_section(data: dict, styles) -> list:
         ]
         table_data.append(row)
 
-    right_table = Table(table_data, colWidths=[3.5*cm, 8*cm])
-    right_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['warning'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor(COLORS['dark'])),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(COLORS['gray_lightest'])]),
-    ]))
+    right_table = create_data_table(table_data, [3.5*cm, 8*cm], CONTENT_GAPS_TABLE_STYLE)
 
     elements.append(create_two_column_section(left, right_table))
     elements.append(Spacer(1, 20))
@@ -580,6 +474,7 @@ def create_content_gaps_section(data: dict, styles) -> list:
     return elements
 
 
+@render_stats.timed()
 def create_actions_section(data: dict, styles) -> list:
     """06. ACTION GUIDE 섹션 - 좌우 분리"""
     elements = []
@@ -596,12 +491,7 @@ def create_actions_section(data: dict, styles) -> list:
     )
 
     # 오른쪽: 액션 테이블
-    header_row = [
-        Paragraph("액션", styles['TableHeader']),
-        Paragraph("설명", styles['TableHeader']),
-        Paragraph("우선순위", styles['TableHeader']),
-    ]
-    table_data = [header_row]
+    table_data = [create_header_row(["액션", "설명", "우선순위"], styles)]
 
     for action in actions[:6]:
         priority = action.get('priority', 'low')
@@ -619,17 +509,7 @@ def create_actions_section(data: dict, styles) -> list:
         ]
         table_data.append(row)
 
-    right_table = Table(table_data, colWidths=[4*cm, 5.5*cm, 2*cm])
-    right_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['black'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(COLORS['gray_lightest'])]),
-    ]))
+    right_table = create_data_table(table_data, [4*cm, 5.5*cm, 2*cm])
 
     elements.append(create_two_column_section(left, right_table))
     elements.append(Spacer(1, 20))
@@ -637,12 +517,13 @@ def create_actions_section(data: dict, styles) -> list:
     return elements
 
 
-def create_footer(styles) -> list:
+@render_stats.timed()
+def create_footer(data: dict, styles) -> list:
     """푸터"""
     elements = []
     elements.append(Spacer(1, 30))
     elements.append(Paragraph(
-        f"Generated by GEO Tracker | {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+        f"Generated by GEO Tracker | {get_render_time(data).strftime('%Y-%m-%d %H:%M')}",
         styles['Footer']
     ))
     return elements
@@ -655,7 +536,7 @@ def create_footer(styles) -> list:
 def generate_pdf(data: dict, output_path: str):
     """PDF 문서 생성"""
     register_korean_fonts()
-    styles = create_styles()
+    styles = get_styles()
 
     doc = SimpleDocTemplate(
         output_path,
@@ -666,53 +547,46 @@ def generate_pdf(data: dict, output_path: str):
         bottomMargin=1.5*cm,
         title='AI Insights Report',
         author='GEO Tracker',
+        invariant=is_deterministic(data) or None,
     )
 
-    elements = []
+    build_document(doc, build_story(data, styles))
+    return output_path
 
+
+def build_story(data: dict, styles):
+    """문서 Flowable을 순서대로 생성 (doc.build가 배치하는 만큼만 섹션이 진행된다)"""
     # Header
-    elements.extend(create_header(data, styles))
+    yield from create_header(data, styles)
 
     # 01. Summary
-    elements.extend(create_summary_section(data, styles))
+    yield from create_summary_section(data, styles)
 
     # 02. Keywords
-    elements.extend(create_keywords_section(data, styles))
+    yield from create_keywords_section(data, styles)
 
     # 03. Category Insights
-    elements.extend(create_category_section(data, styles))
+    yield from create_category_section(data, styles)
 
     # Page Break
-    elements.append(PageBreak())
+    yield PageBreak()
 
     # 상단 헤더 반복
     brand_name = data.get('brandName', '')
-    header_data = [[
-        Paragraph(f"<b>{brand_name}</b>", styles['PageHeader']),
-        Paragraph("AI INSIGHTS REPORT", styles['PageHeader']),
-    ]]
-    header_table = Table(header_data, colWidths=[8*cm, 8.5*cm])
-    header_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-    ]))
-    elements.append(header_table)
-    elements.append(Spacer(1, 20))
+    yield create_page_header(f"<b>{brand_name}</b>", "AI INSIGHTS REPORT", styles['PageHeader'])
+    yield Spacer(1, 20)
 
     # 04. Citation Patterns
-    elements.extend(create_patterns_section(data, styles))
+    yield from create_patterns_section(data, styles)
 
     # 05. Content Gaps
-    elements.extend(create_content_gaps_section(data, styles))
+    yield from create_content_gaps_section(data, styles)
 
     # 06. Action Guide
-    elements.extend(create_actions_section(data, styles))
+    yield from create_actions_section(data, styles)
 
     # Footer
-    elements.extend(create_footer(styles))
-
-    doc.build(elements)
-    return output_path
+    yield from create_footer(data, styles)
 
 
 def main():
@@ -720,34 +594,10 @@ def main():
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
     if len(sys.argv) < 3:
-        print("Usage: python generate_insights_pdf.py <input_json> <output_pdf>")
+        print("Usage: python generate_insights_pdf.py <input_json|-> <output_pdf|->")
         sys.exit(1)
 
-    input_path = sys.argv[1]
-    output_path = sys.argv[2]
-
-    try:
-        with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except Exception as e:
-        print(json.dumps({
-            'success': False,
-            'error': f"Error loading JSON: {str(e)}"
-        }, ensure_ascii=False))
-        sys.exit(1)
-
-    try:
-        result_path = generate_pdf(data, output_path)
-        print(json.dumps({
-            'success': True,
-            'path': result_path
-        }, ensure_ascii=False))
-    except Exception as e:
-        print(json.dumps({
-            'success': False,
-            'error': str(e)
-        }, ensure_ascii=False))
-        sys.exit(1)
+    render_io.run_cli(sys.argv[1], sys.argv[2], generate_pdf, job='insights_pdf')
 
 
 if __name__ == '__main__':
@@ -4,23 +4,32 @@ GEO Visibility Audit Report PDF Generator
 좌우 분리 레이아웃: 왼쪽(섹션 설명) / 오른쪽(데이터/차트)
 """
 
-import json
 import sys
 import os
 from pathlib import Path
-from datetime import datetime
 
+from reportlab.graphics.shapes import Drawing
 from reportlab.lib import colors
+from reportlab.lib.utils import ImageReader
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import mm, cm
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle,
+    SimpleDocTemplate, Paragraph, Spacer, Image,
     PageBreak, HRFlowable, KeepTogether
 )
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+
+import pdf_fonts
+import pdf_styles
+import render_io
+import render_stats
+from pdf_styles import FrozenParagraphStyle
+from pdf_components import (
+    COLORS, RIGHT_COL_WIDTH, CENTER_FIRST_COLUMN, METRIC_TABLE_STYLE,
+    build_document,
+    data_table_style, create_two_column_section, create_left_column, create_text_column,
+    create_page_header, create_header_row, create_data_table, get_render_time, is_deterministic,
+)
 
 # =============================================================================
 # 전역 설정
@@ -29,65 +38,35 @@ from reportlab.pdfbase.ttfonts import TTFont
 FONT_NAME = 'Helvetica'
 FONT_NAME_BOLD = 'Helvetica-Bold'
 
-# 레이아웃 설정
-LEFT_COL_WIDTH = 5 * cm
-RIGHT_COL_WIDTH = 11.5 * cm
-
-# 컬러 시스템
-COLORS = {
-    'black': '#000000',
-    'dark': '#1a1a1a',
-    'gray_dark': '#343a40',
-    'gray': '#6c757d',
-    'gray_light': '#adb5bd',
-    'gray_lighter': '#dee2e6',
-    'gray_lightest': '#f8f9fa',
-    'white': '#ffffff',
-    'pass': '#28a745',
-    'fail': '#dc3545',
-    'warning': '#ffc107',
+# 차트별 배치 폭 (pt). 차트 렌더러는 이 폭에 맞는 해상도로만 래스터화한다.
+CHART_WIDTHS = {
+    'citation_trend': RIGHT_COL_WIDTH,
+    'engine_performance': RIGHT_COL_WIDTH,
+    'category_distribution': 9 * cm,
+    'top_queries': RIGHT_COL_WIDTH,
+    'metrics_summary': RIGHT_COL_WIDTH,
 }
 
 
 def register_korean_fonts():
-    """한글 폰트 등록"""
+    """한글 폰트 등록 (프로세스당 한 번만 수행, 파싱 결과는 pdf_fonts 캐시 사용)"""
     global FONT_NAME, FONT_NAME_BOLD
 
-    try:
-        font_paths = [
-            ("C:/Windows/Fonts/malgun.ttf", "C:/Windows/Fonts/malgunbd.ttf"),
-            ("C:/Windows/Fonts/NanumGothic.ttf", "C:/Windows/Fonts/NanumGothicBold.ttf"),
-        ]
-
-        for regular, bold in font_paths:
-            if os.path.exists(regular):
-                pdfmetrics.registerFont(TTFont('KoreanFont', regular))
-                if os.path.exists(bold):
-                    pdfmetrics.registerFont(TTFont('KoreanFontBold', bold))
-                else:
-                    pdfmetrics.registerFont(TTFont('KoreanFontBold', regular))
-
-                FONT_NAME = 'KoreanFont'
-                FONT_NAME_BOLD = 'KoreanFontBold'
-                return True
-
-    except Exception as e:
-        print(f"Font registration error: {e}")
-
-    return False
+    FONT_NAME, FONT_NAME_BOLD = pdf_fonts.register_korean_fonts()
+    return FONT_NAME != pdf_fonts.DEFAULT_FONT_NAME
 
 
 # =============================================================================
 # 스타일 시스템
 # =============================================================================
 
-def create_styles():
+def create_styles(font_name: str, font_name_bold: str) -> list:
     """문서 스타일 생성"""
-    styles = getSampleStyleSheet()
+    styles = []
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='DocTitle',
-        fontName=FONT_NAME_BOLD,
+        fontName=font_name_bold,
         fontSize=18,
         leading=22,
         alignment=TA_LEFT,
@@ -95,9 +74,9 @@ def create_styles():
         textColor=colors.HexColor(COLORS['black']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='DocSubtitle',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=9,
         leading=12,
         alignment=TA_LEFT,
@@ -105,9 +84,9 @@ def create_styles():
         textColor=colors.HexColor(COLORS['gray']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='SectionTitle',
-        fontName=FONT_NAME_BOLD,
+        fontName=font_name_bold,
         fontSize=12,
         leading=16,
         alignment=TA_LEFT,
@@ -115,81 +94,81 @@ def create_styles():
         textColor=colors.HexColor(COLORS['black']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='SectionDesc',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=8,
         leading=12,
         alignment=TA_LEFT,
         textColor=colors.HexColor(COLORS['gray']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='Body',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=9,
         leading=13,
         spaceAfter=6,
         textColor=colors.HexColor(COLORS['dark']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='TableHeader',
-        fontName=FONT_NAME_BOLD,
+        fontName=font_name_bold,
         fontSize=8,
         leading=11,
         alignment=TA_LEFT,
         textColor=colors.HexColor(COLORS['white']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='TableCell',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=8,
         leading=11,
         alignment=TA_LEFT,
         textColor=colors.HexColor(COLORS['dark']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='TableCellCenter',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=8,
         leading=11,
         alignment=TA_CENTER,
         textColor=colors.HexColor(COLORS['dark']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='MetricValue',
-        fontName=FONT_NAME_BOLD,
+        fontName=font_name_bold,
         fontSize=18,
         leading=22,
         alignment=TA_CENTER,
         textColor=colors.HexColor(COLORS['black']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='MetricLabel',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=7,
         leading=10,
         alignment=TA_CENTER,
         textColor=colors.HexColor(COLORS['gray']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='Footer',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=7,
         leading=10,
         alignment=TA_CENTER,
         textColor=colors.HexColor(COLORS['gray_light']),
     ))
 
-    styles.add(ParagraphStyle(
+    styles.append(FrozenParagraphStyle(
         name='PageHeader',
-        fontName=FONT_NAME,
+        fontName=font_name,
         fontSize=8,
         leading=10,
         alignment=TA_LEFT,
@@ -199,6 +178,24 @@ def create_styles():
     return styles
 
 
+pdf_styles.register_stylesheet('report', create_styles)
+
+
+def get_styles():
+    """현재 폰트 설정에 맞는 공유 스타일시트 반환 (폰트 조합별로 한 번만 생성)"""
+    return pdf_styles.get_stylesheet('report', FONT_NAME, FONT_NAME_BOLD)
+
+
+# =============================================================================
+# 테이블 스타일 (모듈 로드 시 한 번만 생성)
+# =============================================================================
+
+FINDINGS_TABLE_STYLE = data_table_style(extra=CENTER_FIRST_COLUMN)
+WORST_QUERY_TABLE_STYLE = data_table_style(header_color=COLORS['fail'])
+AI_CATEGORY_TABLE_STYLE = data_table_style(header_color='#4c1d95')
+ACTION_ITEMS_TABLE_STYLE = data_table_style(header_color='#065f46', extra=CENTER_FIRST_COLUMN)
+
+
 # =============================================================================
 # 유틸리티 함수
 # =============================================================================
@@ -223,64 +220,52 @@ def get_change_display(change):
     return "0", COLORS['gray']
 
 
-def create_two_column_section(left_content, right_content):
-    """좌우 2단 레이아웃 생성"""
-    layout_table = Table(
-        [[left_content, right_content]],
-        colWidths=[LEFT_COL_WIDTH, RIGHT_COL_WIDTH]
-    )
-    layout_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ('TOPPADDING', (0, 0), (-1, -1), 0),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-    ]))
-    return layout_table
-
-
-def create_left_column(section_title, description, styles):
-    """왼쪽 컬럼 (제목 + 설명) 생성"""
-    content = []
-    content.append(Paragraph(f"<b>{section_title}</b>", styles['SectionTitle']))
-    content.append(Spacer(1, 4))
-    content.append(Paragraph(description, styles['SectionDesc']))
-
-    left_table = Table([[c] for c in content], colWidths=[LEFT_COL_WIDTH - 0.5*cm])
-    left_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 0),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-    ]))
-    return left_table
+def load_chart_images(charts_dir: str) -> dict:
+    """차트 디렉토리의 PNG 파일을 차트 이름별로 수집"""
+    if not charts_dir or not os.path.isdir(charts_dir):
+        return {}
+    return {path.stem: str(path) for path in Path(charts_dir).glob('*.png')}
+
+
+def create_chart_image(source, width=RIGHT_COL_WIDTH):
+    """차트 flowable 생성 (파일 경로, 메모리 버퍼 또는 벡터 Drawing, 원본 비율 유지)"""
+    if isinstance(source, Drawing):
+        # 벡터 백엔드(chartBackend=vector)에서만 필요하므로 여기서 import
+        import pdf_charts
+        return pdf_charts.fit_drawing(source, width)
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    img_width, img_height = ImageReader(source).getSize()
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    return Image(source, width=width, height=width * img_height / img_width)
+
+
+def with_chart(right_content, charts: dict, name: str):
+    """오른쪽 컬럼 콘텐츠 아래에 차트 추가 (차트가 없으면 그대로 반환)"""
+    chart = charts.get(name)
+    if chart is None:
+        return right_content
+    return [right_content, Spacer(1, 10), create_chart_image(chart, CHART_WIDTHS[name])]
 
 
 # =============================================================================
 # 섹션 생성 함수
 # =============================================================================
 
+@render_stats.timed()
 def create_header(data: dict, styles) -> list:
     """문서 헤더"""
     elements = []
 
     report_type = "MONTHLY" if data.get('type') == 'monthly' else "WEEKLY"
     period = data.get('period', '')
-    generated_at = data.get('generatedAt', datetime.now().strftime('%Y-%m-%d'))
+    generated_at = data.get('generatedAt', get_render_time(data).strftime('%Y-%m-%d'))
 
     # 상단 헤더 라인
-    header_data = [[
-        Paragraph(f"<b>{report_type} REPORT</b>", styles['PageHeader']),
-        Paragraph("GEO VISIBILITY AUDIT", styles['PageHeader']),
-    ]]
-    header_table = Table(header_data, colWidths=[8*cm, 8.5*cm])
-    header_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    elements.append(header_table)
+    elements.append(create_page_header(
+        f"<b>{report_type} REPORT</b>", "GEO VISIBILITY AUDIT", styles['PageHeader']
+    ))
     elements.append(Spacer(1, 20))
 
     # 메인 타이틀
@@ -291,7 +276,8 @@ def create_header(data: dict, styles) -> list:
     return elements
 
 
-def create_summary_section(data: dict, styles) -> list:
+@render_stats.timed()
+def create_summary_section(data: dict, styles, charts: dict) -> list:
     """Executive Summary 섹션 - 좌우 분리"""
     elements = []
 
@@ -334,23 +320,60 @@ def create_summary_section(data: dict, styles) -> list:
         ],
     ]
 
-    right_table = Table(summary_data, colWidths=[2.8*cm, 2.8*cm, 2.8*cm, 2.8*cm])
-    right_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['black'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-    ]))
+    right_table = create_data_table(summary_data, [2.8*cm, 2.8*cm, 2.8*cm, 2.8*cm], METRIC_TABLE_STYLE)
 
-    elements.append(create_two_column_section(left, right_table))
+    right = with_chart(right_table, charts, 'metrics_summary')
+    elements.append(create_two_column_section(left, right))
+    elements.append(Spacer(1, 20))
+
+    return elements
+
+
+@render_stats.timed()
+def create_trend_section(data: dict, styles, charts: dict) -> list:
+    """Citation Trend 섹션 - 좌우 분리"""
+    elements = []
+
+    chart = charts.get('citation_trend')
+    if chart is None:
+        return elements
+
+    # 왼쪽: 섹션 설명
+    left = create_left_column(
+        "Citation Trend",
+        "기간별 인용률 추이입니다. 점선은 PASS 기준선(50%)입니다.",
+        styles
+    )
+
+    elements.append(create_two_column_section(left, create_chart_image(chart, CHART_WIDTHS['citation_trend'])))
     elements.append(Spacer(1, 20))
 
     return elements
 
 
+@render_stats.timed()
+def create_category_distribution_section(data: dict, styles, charts: dict) -> list:
+    """Query Categories 섹션 - 좌우 분리"""
+    elements = []
+
+    chart = charts.get('category_distribution')
+    if chart is None:
+        return elements
+
+    # 왼쪽: 섹션 설명
+    left = create_left_column(
+        "Query Categories",
+        "테스트한 쿼리의 카테고리별 분포입니다.",
+        styles
+    )
+
+    elements.append(create_two_column_section(left, create_chart_image(chart, CHART_WIDTHS['category_distribution'])))
+    elements.append(Spacer(1, 20))
+
+    return elements
+
+
+@render_stats.timed()
 def create_findings_section(data: dict, styles) -> list:
     """Key Findings 섹션 - 좌우 분리"""
     elements = []
@@ -367,11 +390,7 @@ def create_findings_section(data: dict, styles) -> list:
     )
 
     # 오른쪽: 파인딩 테이블
-    header_row = [
-        Paragraph("No.", styles['TableHeader']),
-        Paragraph("Finding", styles['TableHeader']),
-    ]
-    table_data = [header_row]
+    table_data = [create_header_row(["No.", "Finding"], styles)]
 
     for i, highlight in enumerate(highlights[:5], 1):
         row = [
@@ -380,18 +399,7 @@ def create_findings_section(data: dict, styles) -> list:
         ]
         table_data.append(row)
 
-    right_table = Table(table_data, colWidths=[1.2*cm, 10.3*cm])
-    right_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['black'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(COLORS['gray_lightest'])]),
-    ]))
+    right_table = create_data_table(table_data, [1.2*cm, 10.3*cm], FINDINGS_TABLE_STYLE)
 
     elements.append(create_two_column_section(left, right_table))
     elements.append(Spacer(1, 20))
@@ -399,7 +407,8 @@ def create_findings_section(data: dict, styles) -> list:
     return elements
 
 
-def create_engine_section(data: dict, styles, charts_dir: str) -> list:
+@render_stats.timed()
+def create_engine_section(data: dict, styles, charts: dict) -> list:
     """Engine Performance 섹션 - 좌우 분리"""
     elements = []
 
@@ -415,14 +424,7 @@ def create_engine_section(data: dict, styles, charts_dir: str) -> list:
     )
 
     # 오른쪽: 엔진 테이블
-    header_row = [
-        Paragraph("Engine", styles['TableHeader']),
-        Paragraph("Rate", styles['TableHeader']),
-        Paragraph("Tests", styles['TableHeader']),
-        Paragraph("Change", styles['TableHeader']),
-        Paragraph("Status", styles['TableHeader']),
-    ]
-    table_data = [header_row]
+    table_data = [create_header_row(["Engine", "Rate", "Tests", "Change", "Status"], styles)]
 
     for engine in engine_data[:5]:
         rate = engine.get('citationRate', 0)
@@ -440,25 +442,17 @@ def create_engine_section(data: dict, styles, charts_dir: str) -> list:
         ]
         table_data.append(row)
 
-    right_table = Table(table_data, colWidths=[3*cm, 2*cm, 2*cm, 2.2*cm, 2.3*cm])
-    right_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['black'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(COLORS['gray_lightest'])]),
-    ]))
+    right_table = create_data_table(table_data, [3*cm, 2*cm, 2*cm, 2.2*cm, 2.3*cm])
 
-    elements.append(create_two_column_section(left, right_table))
+    right = with_chart(right_table, charts, 'engine_performance')
+    elements.append(create_two_column_section(left, right))
     elements.append(Spacer(1, 20))
 
     return elements
 
 
-def create_query_section(data: dict, styles, charts_dir: str) -> list:
+@render_stats.timed()
+def create_query_section(data: dict, styles, charts: dict) -> list:
     """Query Analysis 섹션 - 좌우 분리"""
     elements = []
 
@@ -474,12 +468,7 @@ def create_query_section(data: dict, styles, charts_dir: str) -> list:
     )
 
     # 오른쪽: 쿼리 테이블
-    header_row = [
-        Paragraph("Query", styles['TableHeader']),
-        Paragraph("Rate", styles['TableHeader']),
-        Paragraph("Status", styles['TableHeader']),
-    ]
-    table_data = [header_row]
+    table_data = [create_header_row(["Query", "Rate", "Status"], styles)]
 
     for q in top_queries[:6]:
         query_text = q.get('query', '')
@@ -497,24 +486,16 @@ def create_query_section(data: dict, styles, charts_dir: str) -> list:
         ]
         table_data.append(row)
 
-    right_table = Table(table_data, colWidths=[7.5*cm, 2*cm, 2*cm])
-    right_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['black'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(COLORS['gray_lightest'])]),
-    ]))
+    right_table = create_data_table(table_data, [7.5*cm, 2*cm, 2*cm])
 
-    elements.append(create_two_column_section(left, right_table))
+    right = with_chart(right_table, charts, 'top_queries')
+    elements.append(create_two_column_section(left, right))
     elements.append(Spacer(1, 20))
 
     return elements
 
 
+@render_stats.timed()
 def create_worst_query_section(data: dict, styles) -> list:
     """Improvement Required 섹션 - 좌우 분리"""
     elements = []
@@ -531,12 +512,7 @@ def create_worst_query_section(data: dict, styles) -> list:
     )
 
     # 오른쪽: 쿼리 테이블
-    header_row = [
-        Paragraph("Query", styles['TableHeader']),
-        Paragraph("Rate", styles['TableHeader']),
-        Paragraph("Status", styles['TableHeader']),
-    ]
-    table_data = [header_row]
+    table_data = [create_header_row(["Query", "Rate", "Status"], styles)]
 
     for q in worst_queries[:6]:
         query_text = q.get('query', '')
@@ -552,17 +528,7 @@ def create_worst_query_section(data: dict, styles) -> list:
         ]
         table_data.append(row)
 
-    right_table = Table(table_data, colWidths=[7.5*cm, 2*cm, 2*cm])
-    right_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['fail'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(COLORS['gray_lightest'])]),
-    ]))
+    right_table = create_data_table(table_data, [7.5*cm, 2*cm, 2*cm], WORST_QUERY_TABLE_STYLE)
 
     elements.append(create_two_column_section(left, right_table))
     elements.append(Spacer(1, 20))
@@ -570,6 +536,7 @@ def create_worst_query_section(data: dict, styles) -> list:
     return elements
 
 
+@render_stats.timed()
 def create_ai_summary_section(data: dict, styles) -> list:
     """AI 종합 분석 섹션 - 좌우 분리"""
     elements = []
@@ -597,14 +564,7 @@ def create_ai_summary_section(data: dict, styles) -> list:
                 styles['Body']
             ))
 
-    right_table = Table([[c] for c in right_elements], colWidths=[RIGHT_COL_WIDTH - 0.5*cm])
-    right_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ('TOPPADDING', (0, 0), (-1, -1), 0),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-    ]))
+    right_table = create_text_column(right_elements)
 
     elements.append(create_two_column_section(left, right_table))
     elements.append(Spacer(1, 20))
@@ -612,6 +572,7 @@ def create_ai_summary_section(data: dict, styles) -> list:
     return elements
 
 
+@render_stats.timed()
 def create_ai_category_section(data: dict, styles) -> list:
     """AI 카테고리별 분석 섹션 - 좌우 분리"""
     elements = []
@@ -630,12 +591,7 @@ def create_ai_category_section(data: dict, styles) -> list:
         styles
     )
 
-    header_row = [
-        Paragraph("Category", styles['TableHeader']),
-        Paragraph("Rate", styles['TableHeader']),
-        Paragraph("Insight", styles['TableHeader']),
-    ]
-    table_data = [header_row]
+    table_data = [create_header_row(["Category", "Rate", "Insight"], styles)]
 
     for ca in cat_analysis[:6]:
         category = ca.get('category', '')
@@ -653,17 +609,7 @@ def create_ai_category_section(data: dict, styles) -> list:
         ]
         table_data.append(row)
 
-    right_table = Table(table_data, colWidths=[2.5*cm, 1.8*cm, 7.2*cm])
-    right_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4c1d95')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(COLORS['gray_lightest'])]),
-    ]))
+    right_table = create_data_table(table_data, [2.5*cm, 1.8*cm, 7.2*cm], AI_CATEGORY_TABLE_STYLE)
 
     elements.append(create_two_column_section(left, right_table))
     elements.append(Spacer(1, 20))
@@ -671,6 +617,7 @@ def create_ai_category_section(data: dict, styles) -> list:
     return elements
 
 
+@render_stats.timed()
 def create_ai_competitor_section(data: dict, styles) -> list:
     """AI 경쟁사 분석 섹션 - 좌우 분리"""
     elements = []
@@ -688,14 +635,7 @@ def create_ai_competitor_section(data: dict, styles) -> list:
     right_elements = []
     right_elements.append(Paragraph(ai['competitorAnalysis'], styles['Body']))
 
-    right_table = Table([[c] for c in right_elements], colWidths=[RIGHT_COL_WIDTH - 0.5*cm])
-    right_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ('TOPPADDING', (0, 0), (-1, -1), 0),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-    ]))
+    right_table = create_text_column(right_elements)
 
     elements.append(create_two_column_section(left, right_table))
     elements.append(Spacer(1, 20))
@@ -703,6 +643,7 @@ def create_ai_competitor_section(data: dict, styles) -> list:
     return elements
 
 
+@render_stats.timed()
 def create_ai_action_items_section(data: dict, styles) -> list:
     """AI 개선 제안 섹션 - 좌우 분리"""
     elements = []
@@ -721,11 +662,7 @@ def create_ai_action_items_section(data: dict, styles) -> list:
         styles
     )
 
-    header_row = [
-        Paragraph("No.", styles['TableHeader']),
-        Paragraph("Action Item", styles['TableHeader']),
-    ]
-    table_data = [header_row]
+    table_data = [create_header_row(["No.", "Action Item"], styles)]
 
     for i, item in enumerate(action_items[:7], 1):
         if len(item) > 100:
@@ -736,18 +673,7 @@ def create_ai_action_items_section(data: dict, styles) -> list:
         ]
         table_data.append(row)
 
-    right_table = Table(table_data, colWidths=[1.2*cm, 10.3*cm])
-    right_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#065f46')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(COLORS['gray_lightest'])]),
-    ]))
+    right_table = create_data_table(table_data, [1.2*cm, 10.3*cm], ACTION_ITEMS_TABLE_STYLE)
 
     elements.append(create_two_column_section(left, right_table))
     elements.append(Spacer(1, 20))
@@ -755,6 +681,7 @@ def create_ai_action_items_section(data: dict, styles) -> list:
     return elements
 
 
+@render_stats.timed()
 def create_recommendation_section(data: dict, styles) -> list:
     """Recommendations 섹션 - 좌우 분리"""
     elements = []
@@ -795,11 +722,7 @@ def create_recommendation_section(data: dict, styles) -> list:
         "LOW": COLORS['pass'],
     }
 
-    header_row = [
-        Paragraph("Priority", styles['TableHeader']),
-        Paragraph("Recommendation", styles['TableHeader']),
-    ]
-    table_data = [header_row]
+    table_data = [create_header_row(["Priority", "Recommendation"], styles)]
 
     for priority, rec in recommendations[:5]:
         color = priority_colors.get(priority, COLORS['gray'])
@@ -809,17 +732,7 @@ def create_recommendation_section(data: dict, styles) -> list:
         ]
         table_data.append(row)
 
-    right_table = Table(table_data, colWidths=[2.5*cm, 9*cm])
-    right_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(COLORS['black'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(COLORS['gray_lighter'])),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(COLORS['gray_lightest'])]),
-    ]))
+    right_table = create_data_table(table_data, [2.5*cm, 9*cm])
 
     elements.append(create_two_column_section(left, right_table))
     elements.append(Spacer(1, 20))
@@ -827,12 +740,13 @@ def create_recommendation_section(data: dict, styles) -> list:
     return elements
 
 
-def create_footer(styles) -> list:
+@render_stats.timed()
+def create_footer(data: dict, styles) -> list:
     """푸터"""
     elements = []
     elements.append(Spacer(1, 30))
     elements.append(Paragraph(
-        f"Generated by GEO Tracker | {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+        f"Generated by GEO Tracker | {get_render_time(data).strftime('%Y-%m-%d %H:%M')}",
         styles['Footer']
     ))
     return elements
@@ -842,10 +756,13 @@ def create_footer(styles) -> list:
 # 메인 PDF 생성 함수
 # =============================================================================
 
-def generate_pdf(data: dict, charts_dir: str, output_path: str):
-    """PDF 문서 생성"""
+def generate_pdf(data: dict, charts, output_path: str):
+    """PDF 문서 생성 (charts: 차트 이름별 이미지 dict 또는 PNG 차트 디렉토리 경로)"""
     register_korean_fonts()
-    styles = create_styles()
+    styles = get_styles()
+
+    if not isinstance(charts, dict):
+        charts = load_chart_images(charts)
 
     doc = SimpleDocTemplate(
         output_path,
@@ -856,74 +773,68 @@ def generate_pdf(data: dict, charts_dir: str, output_path: str):
         bottomMargin=1.5*cm,
         title='GEO Visibility Audit Report',
         author='GEO Tracker',
+        invariant=is_deterministic(data) or None,
     )
 
-    elements = []
+    build_document(doc, build_story(data, styles, charts))
+    return output_path
+
 
+def build_story(data: dict, styles, charts: dict):
+    """문서 Flowable을 순서대로 생성 (doc.build가 배치하는 만큼만 섹션이 진행된다)"""
     # Header
-    elements.extend(create_header(data, styles))
+    yield from create_header(data, styles)
 
     # Summary
-    elements.extend(create_summary_section(data, styles))
+    yield from create_summary_section(data, styles, charts)
 
     # Key Findings
-    elements.extend(create_findings_section(data, styles))
+    yield from create_findings_section(data, styles)
+
+    # Citation Trend
+    yield from create_trend_section(data, styles, charts)
 
     # Engine Performance
-    elements.extend(create_engine_section(data, styles, charts_dir))
+    yield from create_engine_section(data, styles, charts)
 
     # Page Break
-    elements.append(PageBreak())
+    yield PageBreak()
 
     # 상단 헤더 반복
     report_type = "MONTHLY" if data.get('type') == 'monthly' else "WEEKLY"
-    header_data = [[
-        Paragraph(f"<b>{report_type} REPORT</b>", styles['PageHeader']),
-        Paragraph("GEO VISIBILITY AUDIT", styles['PageHeader']),
-    ]]
-    header_table = Table(header_data, colWidths=[8*cm, 8.5*cm])
-    header_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-    ]))
-    elements.append(header_table)
-    elements.append(Spacer(1, 20))
+    yield create_page_header(
+        f"<b>{report_type} REPORT</b>", "GEO VISIBILITY AUDIT", styles['PageHeader']
+    )
+    yield Spacer(1, 20)
 
     # AI Analysis Sections (aiAnalysis가 있을 때만 렌더링)
     if data.get('aiAnalysis'):
-        elements.extend(create_ai_summary_section(data, styles))
-        elements.extend(create_ai_category_section(data, styles))
-        elements.extend(create_ai_competitor_section(data, styles))
-        elements.extend(create_ai_action_items_section(data, styles))
+        yield from create_ai_summary_section(data, styles)
+        yield from create_ai_category_section(data, styles)
+        yield from create_ai_competitor_section(data, styles)
+        yield from create_ai_action_items_section(data, styles)
 
         # AI 섹션이 있으면 새 페이지에서 쿼리 섹션 시작
-        elements.append(PageBreak())
-        header_data2 = [[
-            Paragraph(f"<b>{report_type} REPORT</b>", styles['PageHeader']),
-            Paragraph("GEO VISIBILITY AUDIT", styles['PageHeader']),
-        ]]
-        header_table2 = Table(header_data2, colWidths=[8*cm, 8.5*cm])
-        header_table2.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-            ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-        ]))
-        elements.append(header_table2)
-        elements.append(Spacer(1, 20))
+        yield PageBreak()
+        yield create_page_header(
+            f"<b>{report_type} REPORT</b>", "GEO VISIBILITY AUDIT", styles['PageHeader']
+        )
+        yield Spacer(1, 20)
 
     # Top Queries
-    elements.extend(create_query_section(data, styles, charts_dir))
+    yield from create_query_section(data, styles, charts)
+
+    # Query Categories
+    yield from create_category_distribution_section(data, styles, charts)
 
     # Worst Queries
-    elements.extend(create_worst_query_section(data, styles))
+    yield from create_worst_query_section(data, styles)
 
     # Recommendations
-    elements.extend(create_recommendation_section(data, styles))
+    yield from create_recommendation_section(data, styles)
 
     # Footer
-    elements.extend(create_footer(styles))
-
-    doc.build(elements)
-    return output_path
+    yield from create_footer(data, styles)
 
 
 def main():
@@ -932,35 +843,11 @@ def main():
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
     if len(sys.argv) < 4:
-        print("Usage: python generate_pdf.py <input_json> <charts_dir> <output_pdf>")
+        print("Usage: python generate_pdf.py <input_json|-> <charts_dir> <output_pdf|->")
         sys.exit(1)
 
-    input_path = sys.argv[1]
     charts_dir = sys.argv[2]
-    output_path = sys.argv[3]
-
-    try:
-        with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except Exception as e:
-        print(json.dumps({
-            'success': False,
-            'error': f"Error loading JSON: {str(e)}"
-        }, ensure_ascii=False))
-        sys.exit(1)
-
-    try:
-        result_path = generate_pdf(data, charts_dir, output_path)
-        print(json.dumps({
-            'success': True,
-            'path': result_path
-        }, ensure_ascii=False))
-    except Exception as e:
-        print(json.dumps({
-            'success': False,
-            'error': str(e)
-        }, ensure_ascii=False))
-        sys.exit(1)
+    render_io.run_cli(sys.argv[1], sys.argv[3], lambda data, output: generate_pdf(data, charts_dir, output))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+GEO Visibility Audit Report Pipeline
+리포트 데이터 하나로 차트 5종을 메모리에서 렌더링하고 같은 프로세스에서 PDF에 삽입한다.
+PNG 파일이나 두 번째 인터프리터 실행 없이 차트 + PDF를 한 번에 생성한다.
+
+차트 백엔드 (payload의 chartBackend):
+    matplotlib  PNG 차트 (기본값, generate_report_charts)
+    vector      reportlab.graphics 벡터 차트 (pdf_charts, matplotlib/numpy를 import하지 않음)
+"""
+
+import sys
+
+import generate_pdf
+import render_io
+from chart_data import build_chart_data
+
+CHART_BACKENDS = ('matplotlib', 'vector')
+DEFAULT_CHART_BACKEND = 'matplotlib'
+
+
+def chart_backend(data: dict) -> str:
+    """payload의 차트 백엔드 (잘못된 값이면 ValueError)"""
+    backend = data.get('chartBackend') or DEFAULT_CHART_BACKEND
+    if backend not in CHART_BACKENDS:
+        raise ValueError(f"Unknown chartBackend: {backend} (expected one of {', '.join(CHART_BACKENDS)})")
+    return backend
+
+
+def render_charts(chart_data: dict, backend: str) -> dict:
+    """선택한 백엔드로 차트 렌더링 (백엔드 모듈은 필요할 때만 import)"""
+    if backend == 'vector':
+        import pdf_charts
+        return pdf_charts.render_chart_drawings(chart_data)
+
+    # PDF 배치 폭에 맞춘 해상도로 그리고, ReportLab이 다시 압축하므로 PNG 압축은 생략
+    import generate_report_charts
+    return generate_report_charts.render_chart_buffers(chart_data, generate_pdf.CHART_WIDTHS, encoding='raw')
+
+
+def generate_report(data: dict, output_path: str):
+    """차트 렌더링 + PDF 생성"""
+    charts = render_charts(build_chart_data(data), chart_backend(data))
+    return generate_pdf.generate_pdf(data, charts, output_path)
+
+
+def main():
+    """메인 함수"""
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+    if len(sys.argv) < 3:
+        print("Usage: python generate_report.py <input_json|-> <output_pdf|->")
+        sys.exit(1)
+
+    render_io.run_cli(sys.argv[1], sys.argv[2], generate_report)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,23 +3,52 @@
 GEO Visibility Audit Report Chart Generator
 감사 인증 문서 스타일의 차트를 생성한다.
 흑백 + 회색 기반, 성과 지표만 색상 사용.
+렌더된 차트는 chart_cache로 캐시하여 같은 차트 데이터는 다시 그리지 않는다.
+캐시에 없는 차트는 프로세스 풀에서 동시에 렌더링하고 결과는 CHART_SPECS 순서로 반환한다
+(GEO_CHART_WORKERS로 동시 렌더 수 지정, 1이면 차례로 렌더링).
+
+출력 단계(encode_figure)는 PDF에 배치될 폭(pt)을 받아 그 폭에서 GEO_CHART_PPI(기본 200) 해상도가 되는
+DPI로만 래스터화하고, 회색 + 판단 색상 위주의 차트를 8비트 인덱스(팔레트) PNG로 인코딩한다.
+    png  zlib 압축한 인덱스 PNG (차트 파일, 메일 첨부용)
+    raw  압축하지 않은 인덱스 PNG (ReportLab처럼 어차피 다시 압축하는 소비자용, 압축 단계 생략)
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.cm as cm
-import numpy as np
+import io
 import json
 import sys
 import os
+import time
 from pathlib import Path
 
+# pyplot(전역 figure 관리자) 없이 Figure + Agg 캔버스를 직접 사용한다.
+# 작업마다 독립된 Figure를 만들므로 여러 스레드에서 동시에 호출해도 안전하다.
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
+
+import chart_cache
+import payload_io
+import render_stats
+
 # =============================================================================
 # 스타일 설정
 # =============================================================================
 
-# 한글 폰트 설정
-plt.rcParams['font.family'] = 'Malgun Gothic'
-plt.rcParams['axes.unicode_minus'] = False
+# 차트 모양(스타일/레이아웃/색상)을 바꾸면 올린다 (차트 캐시 키에 포함)
+CHART_STYLE_VERSION = 3
+
+# 배치 폭을 모를 때의 출력 해상도
+CHART_DPI = 150
+
+# 배치 폭 기준 목표 해상도 (pixel per inch, GEO_CHART_PPI로 변경)
+DEFAULT_CHART_PPI = 200
+
+# 출력 인코딩 -> PNG zlib 압축 수준 (raw: 저장만 하고 압축하지 않음)
+CHART_ENCODINGS = {'png': 6, 'raw': 0}
+
+# 인덱스 PNG 팔레트 양자화 방식 (흰 배경과 옅은 영역 채우기 색을 보존, 픽셀 오차 3 이하)
+PALETTE_QUANTIZE = Image.Quantize.MAXCOVERAGE
 
 # 컬러 시스템: 흑백 + 회색 기반
 COLORS = {
@@ -46,45 +75,98 @@ ENGINE_COLORS = {
     'copilot': '#aaaaaa',
 }
 
+# 감사 문서 스타일
+AUDIT_STYLE = {
+    # 한글 폰트 설정
+    'font.family': 'Malgun Gothic',
+    'axes.unicode_minus': False,
+    'figure.facecolor': 'white',
+    'font.size': 9,
+    'axes.titlesize': 11,
+    'axes.titleweight': 'bold',
+    'axes.labelsize': 9,
+    'axes.labelweight': 'normal',
+    'axes.facecolor': 'white',
+    'axes.edgecolor': COLORS['gray_lighter'],
+    'axes.linewidth': 0.8,
+    'axes.spines.top': False,
+    'axes.spines.right': False,
+    'axes.grid': True,
+    'grid.color': COLORS['gray_lighter'],
+    'grid.alpha': 0.5,
+    'grid.linestyle': '-',
+    'grid.linewidth': 0.5,
+    'lines.linewidth': 2,
+    'lines.markersize': 6,
+    'xtick.color': COLORS['gray'],
+    'ytick.color': COLORS['gray'],
+    'legend.frameon': False,
+    'legend.fontsize': 8,
+}
+
+# 모듈 로드 시 한 번만 적용한다. rcParams는 프로세스 전역이므로 차트마다 바꾸면
+# 동시에 렌더링하는 스레드끼리 스타일이 섞인다. 이후 렌더는 rcParams를 읽기만 한다.
+matplotlib.rcParams.update(AUDIT_STYLE)
+
+# 차트별 고정 여백 (figure 비율). bbox_inches='tight' / tight_layout의 추가 draw 없이 한 번에 그린다.
+LINE_CHART_MARGINS = dict(left=0.08, right=0.97, top=0.88, bottom=0.12)
+HBAR_CHART_MARGINS = dict(left=0.1, right=0.9, top=0.88, bottom=0.12)
+PIE_CHART_MARGINS = dict(left=0.04, right=0.96, top=0.9, bottom=0.04)
+BAR_CHART_MARGINS = dict(left=0.08, right=0.97, top=0.88, bottom=0.22)
+SUMMARY_CHART_MARGINS = dict(left=0.02, right=0.98, top=0.9, bottom=0.02, wspace=0.1, hspace=0.2)
+
+
+def new_figure(figsize: tuple, margins: dict) -> Figure:
+    """Agg 캔버스에 연결된 독립 Figure 생성 (pyplot 전역 상태 미사용)"""
+    fig = Figure(figsize=figsize, dpi=CHART_DPI)
+    FigureCanvasAgg(fig)
+    fig.subplots_adjust(**margins)
+    return fig
+
+
+def chart_ppi() -> int:
+    """배치 폭 기준 목표 해상도 (GEO_CHART_PPI, 잘못된 값이면 기본값)"""
+    try:
+        ppi = int(os.environ.get('GEO_CHART_PPI', DEFAULT_CHART_PPI))
+    except ValueError:
+        ppi = DEFAULT_CHART_PPI
+    return ppi if ppi > 0 else DEFAULT_CHART_PPI
+
+
+def encode_figure(fig: Figure, width: float = None, encoding: str = 'png') -> bytes:
+    """Figure를 배치 폭(pt)에 맞는 해상도로 그려 8비트 인덱스 PNG로 인코딩 (draw 한 번)
+
+    width가 없으면 CHART_DPI로 그린다. figure 크기(inch)는 그대로 두고 DPI만 바꾸므로
+    글자/선 굵기 비율은 같고 픽셀 수만 배치 크기에 맞춰진다.
+    """
+    if width:
+        fig.set_dpi(chart_ppi() * (width / 72) / fig.get_figwidth())
+    fig.canvas.draw()
 
-def setup_audit_style():
-    """감사 문서 스타일 설정"""
-    plt.rcParams.update({
-        'figure.figsize': (10, 5),
-        'figure.dpi': 150,
-        'figure.facecolor': 'white',
-        'font.size': 9,
-        'axes.titlesize': 11,
-        'axes.titleweight': 'bold',
-        'axes.labelsize': 9,
-        'axes.labelweight': 'normal',
-        'axes.facecolor': 'white',
-        'axes.edgecolor': COLORS['gray_lighter'],
-        'axes.linewidth': 0.8,
-        'axes.spines.top': False,
-        'axes.spines.right': False,
-        'axes.grid': True,
-        'grid.color': COLORS['gray_lighter'],
-        'grid.alpha': 0.5,
-        'grid.linestyle': '-',
-        'grid.linewidth': 0.5,
-        'lines.linewidth': 2,
-        'lines.markersize': 6,
-        'xtick.color': COLORS['gray'],
-        'ytick.color': COLORS['gray'],
-        'legend.frameon': False,
-        'legend.fontsize': 8,
-    })
+    # 흰 배경 불투명 차트이므로 알파 채널은 버린다 (PDF에 SMask가 생기지 않음)
+    image = Image.frombuffer('RGBA', fig.canvas.get_width_height(), fig.canvas.buffer_rgba()).convert('RGB')
+    indexed = image.quantize(256, method=PALETTE_QUANTIZE, dither=Image.Dither.NONE)
+
+    buffer = io.BytesIO()
+    indexed.save(buffer, 'PNG', compress_level=CHART_ENCODINGS[encoding])
+    return buffer.getvalue()
+
+
+def rate_color(rate) -> str:
+    """성과에 따른 판단 색상"""
+    if rate >= 50:
+        return COLORS['pass']
+    if rate >= 30:
+        return COLORS['warning']
+    return COLORS['fail']
 
 
 # =============================================================================
 # 차트 생성 함수
 # =============================================================================
 
-def create_citation_trend_chart(data: dict, output_path: str):
+def create_citation_trend_chart(data: dict) -> Figure:
     """인용률 트렌드 라인 차트 - 감사 문서 스타일"""
-    setup_audit_style()
-
     dates = data.get('dates', [])
     citation_rates = data.get('citationRates', [])
 
@@ -92,7 +174,8 @@ def create_citation_trend_chart(data: dict, output_path: str):
         dates = ['Week 1', 'Week 2', 'Week 3', 'Week 4']
         citation_rates = [45, 52, 48, 55]
 
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig = new_figure((10, 5), LINE_CHART_MARGINS)
+    ax = fig.add_subplot()
 
     # 라인 차트: 회색 톤 메인, 마커는 검정
     ax.plot(dates, citation_rates,
@@ -108,7 +191,7 @@ def create_citation_trend_chart(data: dict, output_path: str):
     ax.fill_between(dates, citation_rates, alpha=0.1, color=COLORS['gray'])
 
     # 값 레이블
-    for i, (x, y) in enumerate(zip(dates, citation_rates)):
+    for x, y in zip(dates, citation_rates):
         ax.annotate(f'{y}%',
                     (x, y),
                     textcoords="offset points",
@@ -128,35 +211,22 @@ def create_citation_trend_chart(data: dict, output_path: str):
     ax.text(dates[-1], 52, 'PASS threshold', ha='right', va='bottom',
             fontsize=7, color=COLORS['gray'], style='italic')
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
+    return fig
 
 
-def create_engine_performance_chart(data: dict, output_path: str):
+def create_engine_performance_chart(data: dict) -> Figure:
     """엔진별 성과 가로 막대 차트 - 감사 문서 스타일"""
-    setup_audit_style()
-
     engines = data.get('engines', ['GPT', 'Gemini', 'Claude', 'Perplexity'])
     citation_rates = data.get('citationRates', [65, 58, 72, 45])
 
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig = new_figure((10, 5), HBAR_CHART_MARGINS)
+    ax = fig.add_subplot()
 
-    y_pos = np.arange(len(engines))
+    y_pos = list(range(len(engines)))
 
     # 막대 색상: 성과에 따라 결정
-    bar_colors = []
-    for rate in citation_rates:
-        if rate >= 50:
-            bar_colors.append(COLORS['pass'])
-        elif rate >= 30:
-            bar_colors.append(COLORS['warning'])
-        else:
-            bar_colors.append(COLORS['fail'])
-
     bars = ax.barh(y_pos, citation_rates,
-                   color=bar_colors,
+                   color=[rate_color(rate) for rate in citation_rates],
                    edgecolor=COLORS['white'],
                    height=0.5)
 
@@ -179,23 +249,19 @@ def create_engine_performance_chart(data: dict, output_path: str):
     # 50% 기준선
     ax.axvline(x=50, color=COLORS['gray_light'], linestyle='--', linewidth=1)
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
+    return fig
 
 
-def create_category_distribution_chart(data: dict, output_path: str):
+def create_category_distribution_chart(data: dict) -> Figure:
     """카테고리별 분포 파이 차트 - 감사 문서 스타일"""
-    setup_audit_style()
-
     categories = data.get('categories', ['Product', 'Service', 'Technical', 'Other'])
     values = data.get('values', [35, 28, 22, 15])
 
     # 회색 톤 팔레트
     gray_palette = [COLORS['gray_dark'], COLORS['gray'], COLORS['gray_light'], COLORS['gray_lighter']]
 
-    fig, ax = plt.subplots(figsize=(8, 6))
+    fig = new_figure((6, 6), PIE_CHART_MARGINS)
+    ax = fig.add_subplot()
 
     wedges, texts, autotexts = ax.pie(
         values,
@@ -219,16 +285,11 @@ def create_category_distribution_chart(data: dict, output_path: str):
 
     ax.set_title('QUERY CATEGORY DISTRIBUTION', pad=15, color=COLORS['black'])
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
+    return fig
 
 
-def create_top_queries_chart(data: dict, output_path: str):
+def create_top_queries_chart(data: dict) -> Figure:
     """상위 쿼리 성과 막대 차트 - 감사 문서 스타일"""
-    setup_audit_style()
-
     queries = data.get('queries', [
         'Query 1',
         'Query 2',
@@ -241,28 +302,19 @@ def create_top_queries_chart(data: dict, output_path: str):
     # 쿼리 텍스트 길이 제한
     queries = [q[:18] + '...' if len(q) > 18 else q for q in queries]
 
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig = new_figure((10, 5), BAR_CHART_MARGINS)
+    ax = fig.add_subplot()
 
-    x_pos = np.arange(len(queries))
+    x_pos = list(range(len(queries)))
 
     # 막대 색상: 성과에 따라 결정
-    bar_colors = []
-    for rate in citation_rates:
-        if rate >= 50:
-            bar_colors.append(COLORS['pass'])
-        elif rate >= 30:
-            bar_colors.append(COLORS['warning'])
-        else:
-            bar_colors.append(COLORS['fail'])
-
     bars = ax.bar(x_pos, citation_rates,
-                  color=bar_colors,
+                  color=[rate_color(rate) for rate in citation_rates],
                   edgecolor=COLORS['white'],
                   width=0.6)
 
     # 값 레이블
     for bar, val in zip(bars, citation_rates):
-        verdict = "P" if val >= 50 else "F"
         ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 2,
                 f'{val}%',
                 ha='center', va='bottom',
@@ -278,25 +330,21 @@ def create_top_queries_chart(data: dict, output_path: str):
     # 50% 기준선
     ax.axhline(y=50, color=COLORS['gray_light'], linestyle='--', linewidth=1)
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
+    return fig
 
 
-def create_metrics_summary_chart(data: dict, output_path: str):
+def create_metrics_summary_chart(data: dict) -> Figure:
     """주요 지표 요약 차트 - 감사 문서 스타일"""
-    setup_audit_style()
-
-    metrics = data.get('metrics', {
+    # data는 차트 데이터의 'metrics' 값 자체
+    metrics = data or {
         'citationRate': 58,
         'citationRateChange': 5.2,
         'totalTests': 156,
         'avgRank': 3.2,
-    })
+    }
 
-    fig, axes = plt.subplots(2, 2, figsize=(10, 8))
-    axes = axes.flatten()
+    fig = new_figure((10, 8), SUMMARY_CHART_MARGINS)
+    axes = fig.subplots(2, 2).flatten()
 
     # 1. 인용률 게이지
     ax = axes[0]
@@ -308,8 +356,8 @@ def create_metrics_summary_chart(data: dict, output_path: str):
     color = COLORS['pass'] if value >= 50 else COLORS['fail']
     wedge_colors = [color, COLORS['gray_lightest']]
 
-    wedges, _ = ax.pie(sizes, colors=wedge_colors, startangle=90,
-                       wedgeprops=dict(width=0.35, edgecolor=COLORS['white']))
+    ax.pie(sizes, colors=wedge_colors, startangle=90,
+           wedgeprops=dict(width=0.35, edgecolor=COLORS['white']))
 
     change_text = f'+{change}%p' if change > 0 else f'{change}%p'
     change_color = COLORS['pass'] if change > 0 else COLORS['fail']
@@ -352,92 +400,196 @@ def create_metrics_summary_chart(data: dict, output_path: str):
     color = COLORS['gray_dark']
     wedge_colors = [color, COLORS['gray_lightest']]
 
-    wedges, _ = ax.pie(sizes, colors=wedge_colors, startangle=90,
-                       wedgeprops=dict(width=0.35, edgecolor=COLORS['white']))
+    ax.pie(sizes, colors=wedge_colors, startangle=90,
+           wedgeprops=dict(width=0.35, edgecolor=COLORS['white']))
 
     ax.text(0, 0, f'{sov}%', ha='center', va='center',
             fontsize=24, fontweight='bold', color=COLORS['black'])
     ax.set_title('SHARE OF VOICE', pad=10, fontsize=10, color=COLORS['black'])
 
-    plt.suptitle('KEY METRICS SUMMARY', fontsize=12, fontweight='bold',
-                 color=COLORS['black'], y=1.02)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
+    fig.suptitle('KEY METRICS SUMMARY', fontsize=12, fontweight='bold',
+                 color=COLORS['black'], y=0.97)
+
+    return fig
 
 
 # =============================================================================
 # 메인 함수
 # =============================================================================
 
-def main():
-    """메인 함수"""
-    if len(sys.argv) < 3:
-        print("Usage: python generate_report_charts.py <input_json_path> <output_dir>")
-        sys.exit(1)
+# 차트 이름, 차트 데이터 키, 생성 함수
+CHART_SPECS = [
+    ('citation_trend', 'trend', create_citation_trend_chart),
+    ('engine_performance', 'enginePerformance', create_engine_performance_chart),
+    ('category_distribution', 'categoryDistribution', create_category_distribution_chart),
+    ('top_queries', 'topQueries', create_top_queries_chart),
+    ('metrics_summary', 'metrics', create_metrics_summary_chart),
+]
 
-    input_path = sys.argv[1]
-    output_dir = sys.argv[2]
 
-    # 출력 디렉토리 생성
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+# 차트 이름 -> 생성 함수 (풀 작업자가 이름으로 찾는다)
+CHART_FUNCTIONS = {name: create_chart for name, _, create_chart in CHART_SPECS}
+
+# 렌더된 차트 PNG 캐시 (프로세스 내 메모리 + 디스크 공유)
+CHART_CACHE = chart_cache.ChartCache.from_env(f'{CHART_STYLE_VERSION}/mpl-{matplotlib.__version__}')
 
-    # JSON 데이터 로드
+
+def chart_workers(pending: int) -> int:
+    """동시에 렌더링할 차트 수 (GEO_CHART_WORKERS, 기본: 사용 가능한 CPU 코어 수)"""
     try:
-        with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except Exception as e:
-        print(f"Error loading JSON: {e}")
-        data = {}
+        workers = int(os.environ.get('GEO_CHART_WORKERS', 0))
+    except ValueError:
+        workers = 0
+    if workers <= 0:
+        workers = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count() or 1
+    return max(1, min(workers, pending))
+
+
+def output_variant(width, encoding: str) -> str:
+    """출력 형식 식별자 (배치 폭/해상도/인코딩, 차트 캐시 키에 포함)"""
+    if width:
+        return f'{width:.2f}pt@{chart_ppi()}ppi/{encoding}'
+    return f'{CHART_DPI}dpi/{encoding}'
+
+
+def draw_chart(name: str, chart_data, width: float = None, encoding: str = 'png') -> bytes:
+    """차트 하나를 인덱스 PNG 바이트로 렌더링 (캐시 미사용, 풀 작업 단위)"""
+    return encode_figure(CHART_FUNCTIONS[name](chart_data), width, encoding)
+
+
+def draw_chart_timed(name: str, chart_data, width: float = None, encoding: str = 'png') -> tuple:
+    """draw_chart() + 렌더 시간(ms) (풀 작업자에서 잰 시간을 부모가 render_stats에 기록)"""
+    started = time.perf_counter()
+    png = draw_chart(name, chart_data, width, encoding)
+    return png, (time.perf_counter() - started) * 1000
+
+
+def draw_charts(pending: dict, placements: dict, encoding: str) -> dict:
+    """차트들을 렌더링하여 차트 이름 -> PNG 바이트 또는 예외 반환
+
+    matplotlib 렌더링은 GIL을 잡고 있으므로 스레드가 아닌 프로세스 풀(fork)로 나눈다.
+    준비된 부모 프로세스를 fork하므로 자식은 import/폰트 준비 없이 바로 그린다.
+    CPU가 하나이거나 fork가 없는 환경, 메모리 계측 모드에서는 현재 프로세스에서 차례로 그린다.
+    차트별 렌더 시간은 그린 프로세스에서 재어 render_stats에 chart.<이름>으로 기록한다.
+    """
+    outcomes = {}
+    workers = chart_workers(len(pending))
+
+    if workers <= 1 or render_stats.tracing_memory() or not hasattr(os, 'fork'):
+        for name, chart_data in pending.items():
+            try:
+                with render_stats.stage(f'chart.{name}'):
+                    outcomes[name] = draw_chart(name, chart_data, placements.get(name), encoding)
+            except Exception as e:
+                outcomes[name] = e
+        return outcomes
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork')) as pool:
+        futures = {
+            name: pool.submit(draw_chart_timed, name, chart_data, placements.get(name), encoding)
+            for name, chart_data in pending.items()
+        }
+        for name, future in futures.items():
+            try:
+                outcomes[name], elapsed = future.result()
+                render_stats.record(f'chart.{name}', elapsed)
+            except Exception as e:
+                outcomes[name] = e
+
+    return outcomes
+
+
+@render_stats.timed('charts')
+def render_charts(data: dict, placements: dict = None, encoding: str = 'png') -> dict:
+    """5종 차트를 PNG 바이트로 생성 (차트 이름 -> bytes, CHART_SPECS 순서, 실패한 차트는 제외)
+
+    placements: 차트 이름 -> PDF 배치 폭(pt). 있으면 그 폭에 맞는 해상도로 렌더링한다.
+    캐시에 없는 차트만 동시에 렌더링하고, 결과는 부모 프로세스의 캐시에 저장한다.
+    """
+    if encoding not in CHART_ENCODINGS:
+        raise ValueError(f"Unknown chart encoding: {encoding}")
+    placements = placements or {}
+
+    pngs = {}
+    pending = {}
+    cache_keys = {}
+
+    for name, key, _ in CHART_SPECS:
+        chart_data = data.get(key, {})
+        cache_keys[name] = CHART_CACHE.key(name, chart_data, output_variant(placements.get(name), encoding))
+        png = CHART_CACHE.get(cache_keys[name])
+        if png is None:
+            pending[name] = chart_data
+        else:
+            pngs[name] = png
+
+    if pending:
+        for name, outcome in draw_charts(pending, placements, encoding).items():
+            # 차트 하나의 실패는 해당 차트만 제외 (나머지 차트는 정상 생성)
+            if isinstance(outcome, Exception):
+                print(f"Error creating {name}: {outcome}")
+                continue
+            CHART_CACHE.put(cache_keys[name], outcome)
+            pngs[name] = outcome
+
+    return {name: pngs[name] for name, _, _ in CHART_SPECS if name in pngs}
+
+
+def render_chart_buffers(data: dict, placements: dict = None, encoding: str = 'png') -> dict:
+    """5종 차트를 메모리 버퍼(PNG)로 생성 (차트 이름 -> BytesIO)"""
+    return {name: io.BytesIO(png) for name, png in render_charts(data, placements, encoding).items()}
+
+
+def generate_charts(data: dict, output_dir: str, placements: dict = None) -> list:
+    """차트 데이터로 5종 차트를 생성하고 생성된 파일 경로 목록을 반환"""
+    # 출력 디렉토리 생성
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-    # 차트 생성
     charts = []
 
-    try:
-        chart_path = os.path.join(output_dir, 'citation_trend.png')
-        create_citation_trend_chart(data.get('trend', {}), chart_path)
-        charts.append(chart_path)
-        print(f"Created: citation_trend.png")
-    except Exception as e:
-        print(f"Error creating citation_trend: {e}")
+    for name, png in render_charts(data, placements).items():
+        try:
+            chart_path = os.path.join(output_dir, f'{name}.png')
+            with open(chart_path, 'wb') as f:
+                f.write(png)
+            charts.append(chart_path)
+            print(f"Created: {name}.png")
+        except Exception as e:
+            print(f"Error creating {name}: {e}")
 
-    try:
-        chart_path = os.path.join(output_dir, 'engine_performance.png')
-        create_engine_performance_chart(data.get('enginePerformance', {}), chart_path)
-        charts.append(chart_path)
-        print(f"Created: engine_performance.png")
-    except Exception as e:
-        print(f"Error creating engine_performance: {e}")
+    return charts
 
-    try:
-        chart_path = os.path.join(output_dir, 'category_distribution.png')
-        create_category_distribution_chart(data.get('categoryDistribution', {}), chart_path)
-        charts.append(chart_path)
-        print(f"Created: category_distribution.png")
-    except Exception as e:
-        print(f"Error creating category_distribution: {e}")
 
-    try:
-        chart_path = os.path.join(output_dir, 'top_queries.png')
-        create_top_queries_chart(data.get('topQueries', {}), chart_path)
-        charts.append(chart_path)
-        print(f"Created: top_queries.png")
-    except Exception as e:
-        print(f"Error creating top_queries: {e}")
+def main():
+    """메인 함수"""
+    if len(sys.argv) < 3:
+        print("Usage: python generate_report_charts.py <input_json_path> <output_dir>")
+        sys.exit(1)
 
-    try:
-        chart_path = os.path.join(output_dir, 'metrics_summary.png')
-        create_metrics_summary_chart(data.get('metrics', {}), chart_path)
-        charts.append(chart_path)
-        print(f"Created: metrics_summary.png")
-    except Exception as e:
-        print(f"Error creating metrics_summary: {e}")
+    input_path = sys.argv[1]
+    output_dir = sys.argv[2]
+
+    with render_stats.collect() as stats:
+        # JSON 데이터 로드
+        try:
+            with render_stats.stage('load'):
+                data = payload_io.load_payload(input_path)
+        except Exception as e:
+            print(f"Error loading JSON: {e}")
+            data = {}
+
+        # 차트 생성
+        charts = generate_charts(data, output_dir)
 
     # 결과 출력
     result = {
         'success': True,
-        'charts': charts
+        'charts': charts,
+        'chartCache': CHART_CACHE.stats(),
+        'stats': stats.as_dict(),
     }
     print(json.dumps(result))
 
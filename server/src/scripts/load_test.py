@@ -0,0 +1,524 @@
+# -*- coding: utf-8 -*-
+"""
+Report Render Load Test
+운영처럼 여러 렌더 작업을 동시에 흘려 보내며 지연 시간 분포, 처리량, CPU/RSS 추이를 측정한다.
+렌더 호스트 크기를 정하고, 스케줄러가 작업을 몰아 보낼 때 대기열이 폭증하는 지점을 찾는 데 쓴다.
+
+실행 방식 (--mode):
+    warm    render_server.py 프로세스 풀을 띄우고 소켓으로 작업 전송 (운영 렌더 워커 경로)
+    spawn   작업마다 생성 스크립트 CLI를 새 프로세스로 실행 (콜드 스타트 경로)
+
+작업 구성 (--mix, 합성 payload는 synthetic_payloads.py):
+    weekly    주간 리포트 (차트 + PDF, small)       monthly    월간 리포트 (medium)
+    geo       GEO Score 감사 (페이지 500개)          geo_large  GEO Score 감사 (페이지 1만 개)
+    insights  AI 인사이트 PDF
+
+도착: 평균 --rate 건/초의 포아송 도착 (개방형, 이전 작업의 완료를 기다리지 않음).
+--burst N 이면 단계 시작 시점에 N건이 한꺼번에 도착한다 (스케줄러 일괄 발송).
+--rates 1,2,4 처럼 여러 도착률을 주면 단계별로 차례로 측정하고, 처리량이 도착률을 따라가지 못하거나
+p95 지연이 첫 단계의 SATURATION_FACTOR배를 넘는 첫 단계를 포화 지점으로 표시한다.
+
+측정 항목:
+    latency   도착(예정) 시각부터 완료까지 (대기 + 렌더), p50/p95/p99
+    render    생성기가 보고한 렌더 시간 (결과 JSON의 stats.totalMs), wait = latency - render
+    offered     도착 건수 / 도착 구간(--duration)
+    throughput  도착 구간 안에 완료된 건수 / 도착 구간 (offered와 같은 구간, 포화되지 않으면 offered에 가깝다)
+    drain       도착 구간이 끝난 뒤 남은 작업이 모두 끝나기까지 걸린 시간
+    timeline  1초 단위 도착/완료/진행 중 작업 수, 호스트 CPU 사용률, 렌더 프로세스 RSS 합계 (Linux /proc)
+
+Usage:
+    python load_test.py [--mode warm|spawn] [--rates 1,2] [--duration SEC] [--burst N]
+                        [--mix weekly=40,monthly=20,geo=25,insights=15] [--workers N]
+                        [--concurrency N] [--chart-cache] [--output PATH]
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import synthetic_payloads
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 작업 종류 -> (렌더 작업, 합성 payload 종류, 크기, CLI 스크립트)
+JOB_TYPES = {
+    'weekly': ('report', 'report', 'small', 'generate_report.py'),
+    'monthly': ('report', 'report', 'medium', 'generate_report.py'),
+    'geo': ('geo_score_pdf', 'geo_score', 'medium', 'generate_geo_score_pdf.py'),
+    'geo_large': ('geo_score_pdf', 'geo_score', 'large', 'generate_geo_score_pdf.py'),
+    'insights': ('insights_pdf', 'insights', 'medium', 'generate_insights_pdf.py'),
+}
+
+DEFAULT_MIX = 'weekly=40,monthly=20,geo=25,insights=15'
+
+PERCENTILES = (50, 95, 99)
+
+# p95 지연이 첫 단계의 몇 배를 넘으면 포화로 보는지
+SATURATION_FACTOR = 3.0
+# 처리량이 도착률의 몇 배 아래로 떨어지면 포화로 보는지
+THROUGHPUT_FLOOR = 0.9
+
+# 자원 사용량 샘플링 주기 (초)
+SAMPLE_INTERVAL = 1.0
+
+# 렌더 서버 준비 대기 시간 (초)
+SERVER_START_TIMEOUT = 120
+
+
+# =============================================================================
+# 작업 구성
+# =============================================================================
+
+def parse_mix(text: str) -> dict:
+    """'weekly=40,geo=25' -> {종류: 비율} (알 수 없는 종류면 ValueError)"""
+    mix = {}
+    for part in text.split(','):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in JOB_TYPES:
+            raise ValueError(f"Unknown job type in mix: {name} (expected one of {', '.join(JOB_TYPES)})")
+        mix[name] = float(weight or 1)
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("Job mix is empty")
+    return mix
+
+
+def arrival_schedule(rate: float, duration: float, burst: int, mix: dict, rng: random.Random) -> list:
+    """[(도착 시각(초), 작업 종류)] (burst건은 0초, 나머지는 포아송 도착)"""
+    names = list(mix)
+    weights = [mix[name] for name in names]
+
+    arrivals = [0.0] * burst
+    at = 0.0
+    while rate > 0:
+        at += rng.expovariate(rate)
+        if at >= duration:
+            break
+        arrivals.append(at)
+    return [(at, rng.choices(names, weights)[0]) for at in arrivals]
+
+
+# =============================================================================
+# 실행 방식
+# =============================================================================
+
+class WarmRunner:
+    """render_server.py 프로세스 풀에 소켓으로 작업 전송"""
+
+    def __init__(self, workdir: str, workers: int, env: dict):
+        self.workdir = workdir
+        self.payloads = {}
+        self.socket_path = os.path.join(workdir, 'render.sock')
+        self.proc = subprocess.Popen(
+            [sys.executable, 'render_server.py', self.socket_path, '--workers', str(workers)],
+            cwd=SCRIPTS_DIR,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        self.wait_ready()
+
+    def wait_ready(self):
+        """서버가 준비 완료 줄을 출력할 때까지 대기"""
+        deadline = time.monotonic() + SERVER_START_TIMEOUT
+        while time.monotonic() < deadline:
+            line = self.proc.stdout.readline()
+            if not line:
+                break
+            if json.loads(line).get('ready'):
+                return
+        self.close()
+        raise RuntimeError("Render server did not start")
+
+    @property
+    def root_pids(self) -> list:
+        return [self.proc.pid]
+
+    def prepare(self, job_type: str):
+        _, kind, size, _ = JOB_TYPES[job_type]
+        self.payloads[job_type] = synthetic_payloads.build(kind, size)
+
+    def run(self, number: int, job_type: str) -> dict:
+        import render_server
+        output = os.path.join(self.workdir, f'job-{number}.pdf')
+        request = {
+            'id': str(number),
+            'job': JOB_TYPES[job_type][0],
+            'data': self.payloads[job_type],
+            'output': output,
+            'cache': False,
+        }
+        try:
+            return render_server.send_request(self.socket_path, request)
+        finally:
+            if os.path.exists(output):
+                os.unlink(output)
+
+    def close(self):
+        if self.proc.poll() is None:
+            self.proc.terminate()
+            self.proc.wait()
+
+
+class SpawnRunner:
+    """작업마다 생성 스크립트 CLI를 새 프로세스로 실행"""
+
+    def __init__(self, workdir: str, env: dict):
+        self.workdir = workdir
+        self.env = env
+        self.paths = {}
+        self.children = set()
+        self.lock = threading.Lock()
+
+    @property
+    def root_pids(self) -> list:
+        with self.lock:
+            return list(self.children)
+
+    def prepare(self, job_type: str):
+        _, kind, size, _ = JOB_TYPES[job_type]
+        path = self.paths[job_type] = os.path.join(self.workdir, f'{job_type}.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(synthetic_payloads.build(kind, size), f, ensure_ascii=False)
+
+    def run(self, number: int, job_type: str) -> dict:
+        output = os.path.join(self.workdir, f'job-{number}.pdf')
+        proc = subprocess.Popen(
+            [sys.executable, JOB_TYPES[job_type][3], self.paths[job_type], output],
+            cwd=SCRIPTS_DIR,
+            env=self.env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        with self.lock:
+            self.children.add(proc.pid)
+        try:
+            stdout, _ = proc.communicate()
+        finally:
+            with self.lock:
+                self.children.discard(proc.pid)
+            if os.path.exists(output):
+                os.unlink(output)
+
+        # 마지막 줄이 상태 JSON (앞줄은 진행 로그)
+        for line in reversed(stdout.strip().splitlines()):
+            try:
+                return json.loads(line)
+            except ValueError:
+                continue
+        return {'success': False, 'error': f"exit code {proc.returncode}"}
+
+    def close(self):
+        pass
+
+
+# =============================================================================
+# 자원 사용량 샘플링 (Linux /proc)
+# =============================================================================
+
+def cpu_ticks() -> tuple:
+    """호스트 전체 (사용, 전체) CPU tick (/proc/stat이 없으면 None)"""
+    try:
+        with open('/proc/stat', 'r') as f:
+            values = [int(value) for value in f.readline().split()[1:]]
+    except (OSError, ValueError):
+        return None
+    idle = values[3] + (values[4] if len(values) > 4 else 0)
+    return sum(values) - idle, sum(values)
+
+
+def process_tree(roots: list) -> set:
+    """roots와 그 자손 프로세스 pid 집합"""
+    parents = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # comm에 공백/괄호가 있을 수 있으므로 마지막 ')' 뒤에서 ppid를 읽는다
+        parents[int(entry)] = int(stat.rsplit(')', 1)[1].split()[1])
+
+    tree = set(pid for pid in roots if pid in parents)
+    added = True
+    while added:
+        added = False
+        for pid, parent in parents.items():
+            if parent in tree and pid not in tree:
+                tree.add(pid)
+                added = True
+    return tree
+
+
+class ResourceSampler(threading.Thread):
+    """주기적으로 호스트 CPU 사용률과 렌더 프로세스 RSS 합계를 기록"""
+
+    def __init__(self, runner, started: float):
+        super().__init__(daemon=True)
+        self.runner = runner
+        self.started = started
+        self.samples = []
+        self.stopped = threading.Event()
+        self.enabled = os.path.isdir('/proc')
+
+    def run(self):
+        if not self.enabled:
+            return
+        import render_stats
+
+        previous = cpu_ticks()
+        while not self.stopped.wait(SAMPLE_INTERVAL):
+            current = cpu_ticks()
+            cpu = None
+            if previous and current and current[1] > previous[1]:
+                cpu = 100.0 * (current[0] - previous[0]) / (current[1] - previous[1])
+            previous = current
+
+            rss = sum(render_stats.current_rss(pid) for pid in process_tree(self.runner.root_pids))
+            self.samples.append({
+                't': round(time.monotonic() - self.started, 1),
+                'cpu_pct': round(cpu, 1) if cpu is not None else None,
+                'rss_mb': round(rss / (1024 * 1024), 1),
+            })
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+# =============================================================================
+# 단계 실행 / 집계
+# =============================================================================
+
+def percentiles(values: list) -> dict:
+    """p50/p95/p99 (ms, 값이 없으면 None)"""
+    if not values:
+        return {f'p{q}': None for q in PERCENTILES}
+    ordered = sorted(values)
+    result = {}
+    for q in PERCENTILES:
+        # nearest-rank
+        index = max(math.ceil(q / 100 * len(ordered)) - 1, 0)
+        result[f'p{q}'] = round(ordered[index], 1)
+    return result
+
+
+def run_stage(runner, schedule: list, concurrency: int, timeout: float) -> dict:
+    """도착 일정대로 작업을 보내고 작업별 기록과 자원 샘플 반환"""
+    records = []
+    lock = threading.Lock()
+    started = time.monotonic()
+    sampler = ResourceSampler(runner, started)
+    sampler.start()
+
+    def execute(number: int, arrival: float, job_type: str):
+        begin = time.monotonic() - started
+        try:
+            result = runner.run(number, job_type)
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        end = time.monotonic() - started
+        record = {
+            'type': job_type,
+            'arrival': arrival,
+            'start': begin,
+            'end': end,
+            'latency_ms': (end - arrival) * 1000,
+            'render_ms': (result.get('stats') or {}).get('totalMs'),
+            'success': bool(result.get('success')),
+            'error': result.get('error'),
+        }
+        with lock:
+            records.append(record)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = []
+        for number, (arrival, job_type) in enumerate(schedule):
+            delay = arrival - (time.monotonic() - started)
+            if delay > 0:
+                time.sleep(delay)
+            futures.append(pool.submit(execute, number, arrival, job_type))
+        for future in futures:
+            future.result(timeout=timeout)
+
+    sampler.stop()
+    return {'records': records, 'samples': sampler.samples, 'elapsed': time.monotonic() - started}
+
+
+def timeline(records: list, samples: list) -> list:
+    """1초 단위 도착/완료/진행 중 작업 수 + 자원 샘플"""
+    if not records:
+        return []
+    seconds = int(max(record['end'] for record in records)) + 1
+    rows = []
+    for second in range(seconds):
+        rows.append({
+            't': second,
+            'arrived': sum(1 for r in records if second <= r['arrival'] < second + 1),
+            'completed': sum(1 for r in records if second <= r['end'] < second + 1),
+            'in_flight': sum(1 for r in records if r['arrival'] <= second + 1 and r['end'] > second + 1),
+        })
+    for sample in samples:
+        # t초에 잰 샘플은 직전 1초 구간의 값
+        index = min(max(int(sample['t']) - 1, 0), seconds - 1)
+        rows[index].update({'cpu_pct': sample['cpu_pct'], 'rss_mb': sample['rss_mb']})
+    return rows
+
+
+def summarize(rate: float, duration: float, stage: dict) -> dict:
+    """단계 하나의 지연 분포 / 처리량 / 자원 요약"""
+    records = stage['records']
+    done = [r for r in records if r['success']]
+    latencies = [r['latency_ms'] for r in done]
+    renders = [r['render_ms'] for r in done if r['render_ms'] is not None]
+    waits = [r['latency_ms'] - r['render_ms'] for r in done if r['render_ms'] is not None]
+
+    # offered와 throughput은 같은 도착 구간 [0, duration)에서 센다 (구간 뒤 잔여 작업 처리 시간은 drain)
+    completed = sum(1 for r in done if r['end'] <= duration)
+    drain = max(max(r['end'] for r in records) - duration, 0.0) if records else 0.0
+    samples = stage['samples']
+    cpu = [s['cpu_pct'] for s in samples if s['cpu_pct'] is not None]
+    rss = [s['rss_mb'] for s in samples]
+
+    by_type = {}
+    for job_type in sorted({r['type'] for r in done}):
+        values = [r['latency_ms'] for r in done if r['type'] == job_type]
+        by_type[job_type] = {'count': len(values), **percentiles(values)}
+
+    return {
+        'rate': rate,
+        'offered': round(len(records) / duration, 2) if duration else None,
+        'jobs': len(records),
+        'failed': len(records) - len(done),
+        'errors': sorted({r['error'] for r in records if not r['success'] and r['error']})[:5],
+        'throughput': round(completed / duration, 2) if duration else 0.0,
+        'drain_s': round(drain, 2),
+        'latency_ms': {**percentiles(latencies), 'mean': round(statistics.mean(latencies), 1) if latencies else None},
+        'render_ms': percentiles(renders),
+        'wait_ms': percentiles(waits),
+        'by_type': by_type,
+        'cpu_pct': {'mean': round(statistics.mean(cpu), 1) if cpu else None, 'max': max(cpu) if cpu else None},
+        'rss_mb': {'max': max(rss) if rss else None},
+        'timeline': timeline(records, samples),
+    }
+
+
+def find_saturation(stages: list) -> float:
+    """처리량이 도착률을 못 따라가거나 p95가 첫 단계의 SATURATION_FACTOR배를 넘는 첫 도착률 (없으면 None)"""
+    if not stages:
+        return None
+    base_p95 = stages[0]['latency_ms']['p95']
+    for stage in stages:
+        p95 = stage['latency_ms']['p95']
+        slow = bool(base_p95 and p95 and p95 > base_p95 * SATURATION_FACTOR)
+        behind = bool(stage['offered'] and stage['throughput'] < stage['offered'] * THROUGHPUT_FLOOR)
+        if slow or behind or stage['failed']:
+            return stage['rate']
+    return None
+
+
+def print_stage(stage: dict):
+    """단계 요약 출력"""
+    latency, wait = stage['latency_ms'], stage['wait_ms']
+    print(f"rate {stage['rate']:>5}/s (offered {stage['offered']}/s)  jobs {stage['jobs']:>4} (failed {stage['failed']})  "
+          f"throughput {stage['throughput']:>5.2f}/s (drain {stage['drain_s']}s)  "
+          f"latency p50 {latency['p50']}ms p95 {latency['p95']}ms p99 {latency['p99']}ms  "
+          f"wait p95 {wait['p95']}ms  cpu {stage['cpu_pct']['mean']}%  rss max {stage['rss_mb']['max']}MB")
+    for job_type, values in stage['by_type'].items():
+        print(f"    {job_type:<10} {values['count']:>4} jobs  p50 {values['p50']}ms  p95 {values['p95']}ms  "
+              f"p99 {values['p99']}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report render load test')
+    parser.add_argument('--mode', choices=('warm', 'spawn'), default='warm')
+    parser.add_argument('--rates', default='1', help='쉼표로 구분한 도착률 (건/초), 단계별로 차례로 측정')
+    parser.add_argument('--duration', type=float, default=30, help='단계별 도착 시간 (초)')
+    parser.add_argument('--burst', type=int, default=0, help='단계 시작 시점에 한꺼번에 도착하는 작업 수')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help='작업 종류별 비율')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='warm 모드 렌더 서버 자식 수')
+    parser.add_argument('--concurrency', type=int, default=32, help='동시에 보내는 최대 작업 수')
+    parser.add_argument('--timeout', type=float, default=600, help='작업 하나의 최대 대기 시간 (초)')
+    parser.add_argument('--chart-cache', action='store_true', help='차트 캐시 사용 (기본: 끔)')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    try:
+        mix = parse_mix(args.mix)
+        rates = [float(rate) for rate in args.rates.split(',') if rate.strip()]
+    except ValueError as e:
+        parser.error(str(e))
+
+    env = dict(os.environ)
+    env.setdefault('GEO_CHART_WORKERS', '1')
+    if not args.chart_cache:
+        env.update({'GEO_CHART_CACHE_MEM_MB': '0', 'GEO_CHART_CACHE_MAX_MB': '0'})
+
+    workdir = tempfile.mkdtemp(prefix='load-test-')
+    rng = random.Random(args.seed)
+    try:
+        if args.mode == 'warm':
+            runner = WarmRunner(workdir, max(args.workers, 1), env)
+        else:
+            runner = SpawnRunner(workdir, env)
+
+        try:
+            for job_type in mix:
+                runner.prepare(job_type)
+
+            stages = []
+            for rate in rates:
+                schedule = arrival_schedule(rate, args.duration, args.burst, mix, rng)
+                stage = summarize(rate, args.duration, run_stage(runner, schedule, max(args.concurrency, 1), args.timeout))
+                print_stage(stage)
+                stages.append(stage)
+        finally:
+            runner.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    saturation = find_saturation(stages)
+    if saturation is not None:
+        print(f"Saturated at {saturation} jobs/s")
+
+    report = {
+        'mode': args.mode,
+        'workers': args.workers if args.mode == 'warm' else None,
+        'concurrency': args.concurrency,
+        'mix': mix,
+        'duration': args.duration,
+        'burst': args.burst,
+        'saturatedAt': saturation,
+        'stages': stages,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+
+    print(json.dumps({
+        'success': all(stage['failed'] == 0 for stage in stages),
+        'saturatedAt': saturation,
+        'stages': [{key: value for key, value in stage.items() if key != 'timeline'} for stage in stages],
+    }))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+GEO Score Page Score Store
+크롤한 페이지의 점수(structure/schema/url/meta/content/total)를 점수 필드별 NumPy 배열로 보관하는 열 기반 저장소.
+
+- 라우트 인덱스가 한 번 순회하며 채운 열(점수 배열, 라우트 ID, 경로)을 라우트 순서로 재배열해 보관
+- 행 순서 = 라우트 그룹 순서 (그룹 안은 입력 순서), 같은 라우트의 행이 연속
+- 라우트는 정수 ID로 인터닝 (routes[route_id] = 라우트 경로)
+- 라우트별 평균/최저, 백분위수, 점수 히스토그램, 판정(PASS/WARN/FAIL) 개수를 모두 배열 연산으로 집계
+- 페이지 테이블의 행은 배열에서 필요한 구간만 꺼낸다 (rows)
+
+페이지 dict를 보관하거나 섹션마다 다시 순회하지 않으므로 10만 페이지 크롤에서도 집계 비용과 메모리가 작다.
+(점수 하나당 4바이트, 페이지 10만 개 x 6필드 = 약 2.4MB + 경로 문자열)
+"""
+
+import numpy as np
+
+import route_index
+
+# 저장하는 점수 필드 (카테고리 + total)
+SCORE_FIELDS = route_index.SCORE_FIELDS + ('total',)
+
+SCORE_DTYPE = np.float32
+
+# 히스토그램 구간 (0-9, 10-19, ..., 90-100)
+HISTOGRAM_EDGES = np.arange(0, 101, 10)
+
+# rows()가 한 번에 Python 값으로 바꾸는 행 수
+ROW_CHUNK = 1024
+
+
+class PageScores:
+    """점수 필드별 배열 + 라우트 ID 배열 + 경로 열"""
+
+    def __init__(self, columns: dict, route_ids, routes: list, paths: list):
+        self.columns = columns
+        self.route_ids = route_ids
+        self.routes = routes
+        self.paths = paths
+
+        # 라우트별 행 수와 시작 위치 (행이 라우트 순서로 연속)
+        self.route_counts = np.bincount(route_ids, minlength=len(routes))
+        self.route_starts = np.concatenate(([0], np.cumsum(self.route_counts)[:-1]))
+
+    @classmethod
+    def from_index(cls, index, depth: int = 1):
+        """라우트 인덱스의 열을 깊이 depth 그룹 순서로 재배열하여 저장소 구성 (URL을 다시 파싱하지 않음)"""
+        routes = list(index.groups(depth))
+        route_ids = np.frombuffer(index.route_ids[depth - 1], dtype=np.intc)
+
+        # 안정 정렬이므로 그룹 안은 입력 순서 유지
+        order = np.argsort(route_ids, kind='stable')
+        columns = {
+            field: np.frombuffer(index.columns[field], dtype=SCORE_DTYPE)[order]
+            for field in SCORE_FIELDS
+        }
+        paths = [index.paths[row] for row in order.tolist()]
+        return cls(columns, route_ids[order].astype(np.int32), routes, paths)
+
+    def __len__(self) -> int:
+        return len(self.route_ids)
+
+    def route_range(self, route_id: int) -> tuple:
+        """라우트의 행 구간 (start, stop)"""
+        start = int(self.route_starts[route_id])
+        return start, start + int(self.route_counts[route_id])
+
+    def rows(self, start: int = 0, stop: int = None):
+        """행 (경로, structure, schema, url, meta, content, total)을 구간 순서대로 생성
+
+        배열은 ROW_CHUNK개씩만 Python 값으로 바꾼다.
+        """
+        stop = len(self) if stop is None else stop
+        for chunk_start in range(start, stop, ROW_CHUNK):
+            chunk_stop = min(chunk_start + ROW_CHUNK, stop)
+            values = [self.columns[field][chunk_start:chunk_stop].tolist() for field in SCORE_FIELDS]
+            yield from zip(self.paths[chunk_start:chunk_stop], *values)
+
+    # -------------------------------------------------------------------------
+    # 집계
+    # -------------------------------------------------------------------------
+
+    def mean(self, field: str = 'total') -> float:
+        """전체 평균"""
+        column = self.columns[field]
+        return float(column.mean(dtype=np.float64)) if len(column) else 0.0
+
+    def category_means(self) -> dict:
+        """카테고리별 전체 평균"""
+        return {field: self.mean(field) for field in route_index.SCORE_FIELDS}
+
+    def route_means(self, field: str = 'total'):
+        """라우트별 평균 (routes 순서 배열)"""
+        sums = np.bincount(self.route_ids, weights=self.columns[field], minlength=len(self.routes))
+        return sums / np.maximum(self.route_counts, 1)
+
+    def route_mins(self, field: str = 'total'):
+        """라우트별 최저 점수 (routes 순서 배열, 행이 라우트별로 연속이므로 reduceat)"""
+        if not len(self):
+            return np.zeros(len(self.routes), SCORE_DTYPE)
+        return np.minimum.reduceat(self.columns[field], self.route_starts)
+
+    def percentiles(self, quantiles=(10, 25, 50, 75, 90), field: str = 'total') -> dict:
+        """백분위수 (q -> 점수)"""
+        values = np.percentile(self.columns[field], quantiles) if len(self) else np.zeros(len(quantiles))
+        return {q: float(value) for q, value in zip(quantiles, values)}
+
+    def histogram(self, field: str = 'total') -> list:
+        """점수 구간별 페이지 수 [(시작, 끝, 개수), ...] (마지막 구간은 100 포함)"""
+        counts, _ = np.histogram(self.columns[field], bins=HISTOGRAM_EDGES)
+        return [
+            (int(start), int(end) - 1 if index < len(counts) - 1 else int(end), int(count))
+            for index, (start, end, count) in enumerate(zip(HISTOGRAM_EDGES[:-1], HISTOGRAM_EDGES[1:], counts))
+        ]
+
+    def verdict_counts(self, pass_score: float, warn_score: float, field: str = 'total') -> dict:
+        """판정별 페이지 수 (pass_score 이상 PASS, warn_score 이상 WARN, 나머지 FAIL)"""
+        column = self.columns[field]
+        passed = int(np.count_nonzero(column >= pass_score))
+        warned = int(np.count_nonzero(column >= warn_score)) - passed
+        return {"PASS": passed, "WARN": warned, "FAIL": len(column) - passed - warned}
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""
+Payload Ingestion
+생성 스크립트 CLI와 배치 렌더러가 공유하는 JSON payload 로더.
+
+- gzip 입력 자동 감지 (매직 바이트 1f 8b, 파일/stdin 모두)
+- orjson이 설치되어 있으면 문서 전체 디코딩에 사용 (없으면 표준 json)
+- 큰 최상위 배열(GEO payload의 pages 등)은 원소 단위로 점진적으로 디코딩한다.
+  원본 텍스트 전체를 메모리에 올리지 않고, 원소마다 변환 함수를 적용해 렌더에 필요한 필드만 남길 수 있다.
+  (버퍼 크기 = 읽기 단위 + 가장 큰 원소 하나)
+
+Usage:
+    data = payload_io.load_payload('crawl.json.gz', payload_io.JOB_STREAMED_ARRAYS['geo_score_pdf'])
+"""
+
+import codecs
+import contextlib
+import gzip
+import io
+import json
+import re
+import sys
+
+import route_index
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 (없으면 표준 json)
+    orjson = None
+
+# =============================================================================
+# 전역 설정
+# =============================================================================
+
+# stdin을 뜻하는 경로
+STREAM = '-'
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+# 점진적 디코딩의 읽기 단위 (bytes)
+CHUNK_SIZE = 1 << 16
+
+# 작업 종류 -> 원소 단위로 읽을 최상위 배열 (키 -> 원소 변환 함수, None이면 그대로)
+# 변환 함수는 원소를 상수 키로 다시 만들어 키 문자열이 원소마다 중복되지 않게 한다.
+JOB_STREAMED_ARRAYS = {
+    'geo_score_pdf': {'pages': route_index.compact_page},
+    'insights_pdf': {'commonKeywords': None, 'categoryInsights': None},
+}
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def decoder_name() -> str:
+    """문서 전체 디코딩에 쓰는 디코더"""
+    return 'orjson' if orjson is not None else 'json'
+
+
+def loads(payload):
+    """JSON 문서 하나 디코딩 (bytes 또는 str, orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+class PrefixedStream(io.RawIOBase):
+    """이미 읽은 앞부분 바이트를 먼저 돌려준 뒤 원래 스트림을 이어 읽는 스트림 (원래 스트림은 닫지 않음)"""
+
+    def __init__(self, prefix: bytes, stream):
+        self.prefix = prefix
+        self.stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self.prefix:
+            size = min(len(buffer), len(self.prefix))
+            buffer[:size] = self.prefix[:size]
+            self.prefix = self.prefix[size:]
+            return size
+        return self.stream.readinto(buffer)
+
+
+def read_prefix(stream, size: int) -> bytes:
+    """스트림 앞부분 size 바이트 (파이프는 read가 짧게 돌아올 수 있으므로 EOF 전까지 반복)"""
+    prefix = b''
+    while len(prefix) < size:
+        chunk = stream.read(size - len(prefix))
+        if not chunk:
+            break
+        prefix += chunk
+    return prefix
+
+
+def sniff_prefix(raw, size: int):
+    """스트림을 소비하지 않고 앞부분 size 바이트 확인 -> (앞부분, 이어 읽을 스트림)
+
+    peek은 버퍼에 있는 만큼만 돌려주므로 파이프/stdin에서는 1바이트만 올 수 있다.
+    그때는 앞부분을 직접 읽고, 읽은 바이트를 먼저 돌려주는 스트림으로 감싼다.
+    """
+    prefix = raw.peek(size)[:size]
+    if len(prefix) == size:
+        return prefix, raw
+    prefix = read_prefix(raw, size)
+    return prefix, io.BufferedReader(PrefixedStream(prefix, raw))
+
+
+@contextlib.contextmanager
+def open_payload(input_path: str):
+    """payload 바이너리 스트림 열기 ('-'면 stdin, gzip이면 압축 해제 스트림)"""
+    if input_path == STREAM:
+        raw, owned = sys.stdin.buffer, False
+    else:
+        raw, owned = open(input_path, 'rb'), True
+
+    try:
+        prefix, raw_stream = sniff_prefix(raw, len(GZIP_MAGIC))
+        if prefix == GZIP_MAGIC:
+            with gzip.GzipFile(fileobj=raw_stream, mode='rb') as stream:
+                yield stream
+        else:
+            yield raw_stream
+    finally:
+        if owned:
+            raw.close()
+
+
+def load_payload(input_path: str, streamed: dict = None) -> dict:
+    """payload 로드 (streamed: 원소 단위로 읽을 최상위 배열 키 -> 원소 변환 함수)"""
+    with open_payload(input_path) as stream:
+        if not streamed:
+            return loads(stream.read())
+        return decode_streaming(stream, streamed)
+
+
+# =============================================================================
+# 점진적 디코딩
+# =============================================================================
+
+class JsonStream:
+    """바이너리 스트림을 조금씩 읽으며 JSON 값을 하나씩 디코딩"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.text = codecs.getincrementaldecoder('utf-8')()
+        self.decoder = json.JSONDecoder()
+        # 원소를 따로 디코딩하면 json의 키 메모가 원소마다 초기화되므로 키 문자열을 직접 공유
+        self.keys = {}
+        self.item_decoder = json.JSONDecoder(object_pairs_hook=self.share_keys)
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: int = CHUNK_SIZE) -> bool:
+        """size 바이트를 더 읽어 버퍼에 추가 (읽은 부분은 버림, 더 읽을 게 없으면 False)"""
+        if self.eof:
+            return False
+        chunk = self.stream.read(size)
+        if not chunk:
+            self.eof = True
+        self.buffer = self.buffer[self.pos:] + self.text.decode(chunk, final=self.eof)
+        self.pos = 0
+        return True
+
+    def share_keys(self, pairs: list) -> dict:
+        """같은 키 문자열을 모든 원소가 공유하는 dict 생성"""
+        keys = self.keys
+        return {keys.setdefault(key, key): value for key, value in pairs}
+
+    def error(self, message: str):
+        return ValueError(f"Invalid payload JSON: {message}")
+
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 문자 (끝이면 '')"""
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, chars: str) -> str:
+        """다음 문자가 chars 중 하나인지 확인하고 소비"""
+        char = self.peek()
+        if not char or char not in chars:
+            raise self.error(f"expected {' or '.join(repr(c) for c in chars)}, got {char or 'end of input'!r}")
+        self.pos += 1
+        return char
+
+    def value(self, decoder=None):
+        """다음 JSON 값 하나 디코딩 (버퍼가 모자라면 늘려 가며 다시 시도)"""
+        decoder = decoder or self.decoder
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                # 값이 버퍼 끝에서 잘렸을 수 있으므로 버퍼를 두 배로 늘려 다시 시도
+                if self.fill(max(CHUNK_SIZE, len(self.buffer) - self.pos)):
+                    continue
+                raise self.error(str(e)) from None
+            # 버퍼 끝에서 끝난 숫자는 뒤에 자릿수가 더 있을 수 있음
+            if end == len(self.buffer) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def items(self, transform=None):
+        """배열 원소를 하나씩 디코딩하여 반환
+
+        transform이 있으면 적용한다 (transform이 상수 키로 dict를 다시 만든다고 보고 키 공유를 생략).
+        """
+        decoder = self.decoder if transform else self.item_decoder
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            item = self.value(decoder)
+            yield transform(item) if transform else item
+            if self.expect(',]') == ']':
+                return
+
+
+def decode_streaming(stream, streamed: dict) -> dict:
+    """최상위 객체를 키 단위로 디코딩 (streamed 키의 배열은 원소 단위로 읽어 변환)"""
+    reader = JsonStream(stream)
+    result = {}
+
+    reader.expect('{')
+    if reader.peek() == '}':
+        reader.pos += 1
+    else:
+        while True:
+            key = reader.value()
+            if not isinstance(key, str):
+                raise reader.error(f"object key must be a string, got {key!r}")
+            reader.expect(':')
+            if key in streamed and reader.peek() == '[':
+                result[key] = list(reader.items(streamed[key]))
+            else:
+                result[key] = reader.value()
+            if reader.expect(',}') == '}':
+                break
+
+    if reader.peek():
+        raise reader.error("unexpected data after the top-level object")
+    return result
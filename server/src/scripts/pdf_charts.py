@@ -0,0 +1,466 @@
+# -*- coding: utf-8 -*-
+"""
+PDF Vector Charts
+리포트 차트 5종을 reportlab.graphics Drawing(벡터)으로 그리는 차트 백엔드.
+generate_report_charts(matplotlib PNG)와 같은 감사 문서 스타일(흑백 + 회색, 판단 지표만 색상)과 배치를 따른다.
+
+래스터화와 PNG 인코딩이 없어 렌더가 빠르고 PDF가 작으며, matplotlib/numpy를 import하지 않는다.
+한글 레이블은 PDF 본문과 같은 등록 폰트(pdf_fonts)로 그린다.
+
+차트는 matplotlib figure와 같은 크기(pt)로 그린 뒤 fit_drawing()으로 배치 폭에 맞춰 축소한다.
+"""
+
+from math import cos, radians, sin
+
+from reportlab.graphics.shapes import Circle, Drawing, Group, Line, Polygon, PolyLine, Rect, String, Wedge
+from reportlab.lib import colors
+from reportlab.lib.units import inch
+
+import pdf_fonts
+import render_stats
+from pdf_components import COLORS
+
+# =============================================================================
+# 스타일 설정
+# =============================================================================
+
+BLACK = colors.HexColor(COLORS['black'])
+WHITE = colors.HexColor(COLORS['white'])
+GRAY = colors.HexColor(COLORS['gray'])
+GRAY_DARK = colors.HexColor(COLORS['gray_dark'])
+GRAY_LIGHT = colors.HexColor(COLORS['gray_light'])
+GRAY_LIGHTER = colors.HexColor(COLORS['gray_lighter'])
+GRAY_LIGHTEST = colors.HexColor(COLORS['gray_lightest'])
+
+# 카테고리 분포 팔레트 (회색 톤)
+GRAY_PALETTE = [GRAY_DARK, GRAY, GRAY_LIGHT, GRAY_LIGHTER]
+
+# matplotlib '--' 선 패턴 (선 굵기 1 기준)
+DASH = [3.7, 1.6]
+
+# 눈금 길이 / 눈금과 레이블 사이 간격 (pt)
+TICK_LENGTH = 3.5
+TICK_PAD = 3.5
+
+ITALIC_FONT_NAME = 'Helvetica-Oblique'
+
+# 차트별 고정 여백 (generate_report_charts와 동일한 figure 비율)
+LINE_CHART_MARGINS = dict(left=0.08, right=0.97, top=0.88, bottom=0.12)
+HBAR_CHART_MARGINS = dict(left=0.1, right=0.9, top=0.88, bottom=0.12)
+PIE_CHART_MARGINS = dict(left=0.04, right=0.96, top=0.9, bottom=0.04)
+BAR_CHART_MARGINS = dict(left=0.08, right=0.97, top=0.88, bottom=0.22)
+
+
+def fonts() -> tuple:
+    """(일반, 굵게) 폰트 이름 (한글 폰트가 없으면 Helvetica)"""
+    return pdf_fonts.register_korean_fonts()
+
+
+def rate_color(rate):
+    """성과에 따른 판단 색상"""
+    if rate >= 50:
+        return colors.HexColor(COLORS['pass'])
+    if rate >= 30:
+        return colors.HexColor(COLORS['warning'])
+    return colors.HexColor(COLORS['fail'])
+
+
+# =============================================================================
+# 좌표계
+# =============================================================================
+
+class Axes:
+    """Drawing 안의 플롯 영역 (데이터 좌표 -> pt 변환)"""
+
+    def __init__(self, width: float, height: float, margins: dict, xlim: tuple, ylim: tuple):
+        self.x0 = width * margins['left']
+        self.y0 = height * margins['bottom']
+        self.x1 = width * margins['right']
+        self.y1 = height * margins['top']
+        self.xlim = xlim
+        self.ylim = ylim
+
+    def x(self, value) -> float:
+        low, high = self.xlim
+        return self.x0 + (value - low) / (high - low) * (self.x1 - self.x0)
+
+    def y(self, value) -> float:
+        low, high = self.ylim
+        return self.y0 + (value - low) / (high - low) * (self.y1 - self.y0)
+
+    @property
+    def center_x(self) -> float:
+        return (self.x0 + self.x1) / 2
+
+
+def category_limits(count: int, half_width: float = 0.0) -> tuple:
+    """범주형 축 범위 (matplotlib 기본 5% 여백)"""
+    low, high = -half_width, count - 1 + half_width
+    if high <= low:
+        return low - 0.5, high + 0.5
+    margin = (high - low) * 0.05
+    return low - margin, high + margin
+
+
+def add_frame(drawing: Drawing, axes: Axes):
+    """왼쪽/아래 축선 (위/오른쪽 축선 없음)"""
+    drawing.add(Line(axes.x0, axes.y0, axes.x1, axes.y0, strokeColor=GRAY_LIGHTER, strokeWidth=0.8))
+    drawing.add(Line(axes.x0, axes.y0, axes.x0, axes.y1, strokeColor=GRAY_LIGHTER, strokeWidth=0.8))
+
+
+def grid_line(x1, y1, x2, y2) -> Line:
+    """격자선"""
+    return Line(x1, y1, x2, y2, strokeColor=GRAY_LIGHTER, strokeWidth=0.5, strokeOpacity=0.5)
+
+
+def add_value_axis_y(drawing: Drawing, axes: Axes, font_name: str, ticks=range(0, 101, 20)):
+    """세로 값 축 (눈금, 레이블, 가로 격자선)"""
+    for tick in ticks:
+        y = axes.y(tick)
+        drawing.add(grid_line(axes.x0, y, axes.x1, y))
+        drawing.add(Line(axes.x0 - TICK_LENGTH, y, axes.x0, y, strokeColor=GRAY, strokeWidth=0.8))
+        drawing.add(String(axes.x0 - TICK_LENGTH - TICK_PAD, y - 3, str(tick),
+                           fontName=font_name, fontSize=9, fillColor=GRAY, textAnchor='end'))
+
+
+def add_value_axis_x(drawing: Drawing, axes: Axes, font_name: str, ticks=range(0, 101, 20)):
+    """가로 값 축 (눈금, 레이블, 세로 격자선)"""
+    for tick in ticks:
+        x = axes.x(tick)
+        drawing.add(grid_line(x, axes.y0, x, axes.y1))
+        drawing.add(Line(x, axes.y0 - TICK_LENGTH, x, axes.y0, strokeColor=GRAY, strokeWidth=0.8))
+        drawing.add(String(x, axes.y0 - TICK_LENGTH - TICK_PAD - 9, str(tick),
+                           fontName=font_name, fontSize=9, fillColor=GRAY, textAnchor='middle'))
+
+
+def add_title(drawing: Drawing, text: str, x: float, y: float, font_name: str, size: float = 11):
+    """굵은 제목 (가운데 정렬)"""
+    drawing.add(String(x, y, text, fontName=font_name, fontSize=size, fillColor=BLACK, textAnchor='middle'))
+
+
+def add_axis_titles(drawing: Drawing, axes: Axes, xlabel: str, ylabel: str, font_name: str,
+                    ylabel_offset: float = 30):
+    """축 제목 (x: 아래 가운데, y: 왼쪽 세로)"""
+    if xlabel:
+        drawing.add(String(axes.center_x, axes.y0 - TICK_LENGTH - TICK_PAD - 25, xlabel,
+                           fontName=font_name, fontSize=9, fillColor=GRAY, textAnchor='middle'))
+    if ylabel:
+        label = Group(String(0, 0, ylabel, fontName=font_name, fontSize=9, fillColor=GRAY, textAnchor='middle'))
+        label.translate(axes.x0 - ylabel_offset, (axes.y0 + axes.y1) / 2)
+        label.rotate(90)
+        drawing.add(label)
+
+
+def add_threshold(drawing: Drawing, x1, y1, x2, y2, opacity: float = 1.0):
+    """50% 기준선 (점선)"""
+    drawing.add(Line(x1, y1, x2, y2, strokeColor=GRAY_LIGHT, strokeWidth=1,
+                     strokeDashArray=DASH, strokeOpacity=opacity))
+
+
+def add_donut(drawing: Drawing, cx, cy, radius, inner_radius, values, fill_colors, edge_width=1.0):
+    """도넛 차트 조각 (12시 방향에서 반시계 방향), 조각별 (중심각, 비율) 반환"""
+    total = float(sum(values))
+    angles = []
+    start = 90.0
+    for index, value in enumerate(values):
+        sweep = 360.0 * value / total if total else 0
+        if sweep > 0:
+            drawing.add(Wedge(cx, cy, radius, start, start + sweep, radius1=inner_radius,
+                              fillColor=fill_colors[index % len(fill_colors)],
+                              strokeColor=WHITE, strokeWidth=edge_width))
+        angles.append((start + sweep / 2, value / total if total else 0))
+        start += sweep
+    return angles
+
+
+# =============================================================================
+# 차트 생성 함수
+# =============================================================================
+
+def create_citation_trend_drawing(data: dict) -> Drawing:
+    """인용률 트렌드 라인 차트 - 감사 문서 스타일"""
+    font_name, font_name_bold = fonts()
+
+    dates = data.get('dates', [])
+    citation_rates = data.get('citationRates', [])
+
+    if not dates or not citation_rates:
+        dates = ['Week 1', 'Week 2', 'Week 3', 'Week 4']
+        citation_rates = [45, 52, 48, 55]
+    if len(dates) != len(citation_rates):
+        raise ValueError(f"dates and citationRates must have the same length "
+                         f"({len(dates)} != {len(citation_rates)})")
+
+    width, height = 10 * inch, 5 * inch
+    drawing = Drawing(width, height)
+    axes = Axes(width, height, LINE_CHART_MARGINS, category_limits(len(dates)), (0, 100))
+
+    # 범주 격자선 + 눈금 레이블
+    for index, label in enumerate(dates):
+        x = axes.x(index)
+        drawing.add(grid_line(x, axes.y0, x, axes.y1))
+        drawing.add(Line(x, axes.y0 - TICK_LENGTH, x, axes.y0, strokeColor=GRAY, strokeWidth=0.8))
+        drawing.add(String(x, axes.y0 - TICK_LENGTH - TICK_PAD - 9, str(label),
+                           fontName=font_name, fontSize=9, fillColor=GRAY, textAnchor='middle'))
+    add_value_axis_y(drawing, axes, font_name)
+    add_frame(drawing, axes)
+
+    points = [(axes.x(index), axes.y(rate)) for index, rate in enumerate(citation_rates)]
+
+    # 영역 채우기: 연한 회색
+    area = [axes.x(0), axes.y(0)]
+    for x, y in points:
+        area.extend([x, y])
+    area.extend([points[-1][0], axes.y(0)])
+    drawing.add(Polygon(area, fillColor=GRAY, fillOpacity=0.1, strokeColor=None, strokeWidth=0))
+
+    # 50% 기준선 (PASS/FAIL 기준)
+    add_threshold(drawing, axes.x0, axes.y(50), axes.x1, axes.y(50), opacity=0.7)
+    drawing.add(String(points[-1][0], axes.y(52) + 1, 'PASS threshold',
+                       fontName=ITALIC_FONT_NAME, fontSize=7, fillColor=GRAY, textAnchor='end'))
+
+    # 라인 차트: 회색 톤 메인, 마커는 검정
+    drawing.add(PolyLine([coord for point in points for coord in point],
+                         strokeColor=GRAY_DARK, strokeWidth=2, strokeLineJoin=1))
+    for (x, y), rate in zip(points, citation_rates):
+        drawing.add(Circle(x, y, 4, fillColor=WHITE, strokeColor=BLACK, strokeWidth=2))
+        # 값 레이블
+        drawing.add(String(x, y + 12, f'{rate}%', fontName=font_name_bold, fontSize=9,
+                           fillColor=BLACK, textAnchor='middle'))
+
+    add_title(drawing, 'CITATION RATE TREND', axes.center_x, axes.y1 + 15, font_name_bold)
+    add_axis_titles(drawing, axes, 'Period', 'Citation Rate (%)', font_name)
+
+    return drawing
+
+
+def create_engine_performance_drawing(data: dict) -> Drawing:
+    """엔진별 성과 가로 막대 차트 - 감사 문서 스타일"""
+    font_name, font_name_bold = fonts()
+
+    engines = data.get('engines', ['GPT', 'Gemini', 'Claude', 'Perplexity'])
+    citation_rates = data.get('citationRates', [65, 58, 72, 45])
+
+    width, height = 10 * inch, 5 * inch
+    drawing = Drawing(width, height)
+    # 위에서 아래로 나열 (y축 반전)
+    low, high = category_limits(len(engines), 0.25)
+    axes = Axes(width, height, HBAR_CHART_MARGINS, (0, 100), (high, low))
+
+    add_value_axis_x(drawing, axes, font_name)
+    add_frame(drawing, axes)
+
+    for index, (engine, rate) in enumerate(zip(engines, citation_rates)):
+        y = axes.y(index)
+        bar_top, bar_bottom = axes.y(index - 0.25), axes.y(index + 0.25)
+        drawing.add(grid_line(axes.x0, y, axes.x1, y))
+        drawing.add(Rect(axes.x0, bar_bottom, axes.x(rate) - axes.x0, bar_top - bar_bottom,
+                         fillColor=rate_color(rate), strokeColor=WHITE, strokeWidth=1))
+        drawing.add(Line(axes.x0 - TICK_LENGTH, y, axes.x0, y, strokeColor=GRAY, strokeWidth=0.8))
+        drawing.add(String(axes.x0 - TICK_LENGTH - TICK_PAD, y - 3, str(engine).upper(),
+                           fontName=font_name, fontSize=9, fillColor=GRAY, textAnchor='end'))
+
+        # 값 레이블
+        verdict = "PASS" if rate >= 50 else "FAIL"
+        drawing.add(String(axes.x(rate + 2), y - 3, f'{rate}% ({verdict})',
+                           fontName=font_name_bold, fontSize=8, fillColor=BLACK, textAnchor='start'))
+
+    # 50% 기준선
+    add_threshold(drawing, axes.x(50), axes.y0, axes.x(50), axes.y1)
+
+    add_title(drawing, 'ENGINE PERFORMANCE', axes.center_x, axes.y1 + 15, font_name_bold)
+    add_axis_titles(drawing, axes, 'Citation Rate (%)', None, font_name)
+
+    return drawing
+
+
+def create_category_distribution_drawing(data: dict) -> Drawing:
+    """카테고리별 분포 도넛 차트 - 감사 문서 스타일"""
+    font_name, font_name_bold = fonts()
+
+    categories = data.get('categories', ['Product', 'Service', 'Technical', 'Other'])
+    values = data.get('values', [35, 28, 22, 15])
+
+    width, height = 6 * inch, 6 * inch
+    drawing = Drawing(width, height)
+    axes = Axes(width, height, PIE_CHART_MARGINS, (-1.25, 1.25), (-1.25, 1.25))
+
+    # 정원 비율 유지 (matplotlib pie 기본 범위 -1.25 ~ 1.25)
+    cx, cy = axes.center_x, (axes.y0 + axes.y1) / 2
+    radius = min(axes.x1 - axes.x0, axes.y1 - axes.y0) / 2.5
+
+    angles = add_donut(drawing, cx, cy, radius, radius * 0.4, values, GRAY_PALETTE, edge_width=2)
+
+    for (angle, share), label in zip(angles, categories):
+        dx, dy = cos(radians(angle)), sin(radians(angle))
+        # 퍼센트 (조각 안쪽)
+        drawing.add(String(cx + dx * radius * 0.75, cy + dy * radius * 0.75 - 3, f'{share * 100:.0f}%',
+                           fontName=font_name_bold, fontSize=9, fillColor=WHITE, textAnchor='middle'))
+        # 카테고리 레이블 (조각 바깥)
+        drawing.add(String(cx + dx * radius * 1.1, cy + dy * radius * 1.1 - 3, str(label),
+                           fontName=font_name, fontSize=9, fillColor=GRAY_DARK,
+                           textAnchor='start' if dx >= 0 else 'end'))
+
+    add_title(drawing, 'QUERY CATEGORY DISTRIBUTION', axes.center_x, axes.y1 + 15, font_name_bold)
+
+    return drawing
+
+
+def create_top_queries_drawing(data: dict) -> Drawing:
+    """상위 쿼리 성과 막대 차트 - 감사 문서 스타일"""
+    font_name, font_name_bold = fonts()
+
+    queries = data.get('queries', ['Query 1', 'Query 2', 'Query 3', 'Query 4', 'Query 5'])
+    citation_rates = data.get('citationRates', [85, 78, 72, 68, 65])
+
+    # 쿼리 텍스트 길이 제한
+    queries = [q[:18] + '...' if len(q) > 18 else q for q in queries]
+
+    width, height = 10 * inch, 5 * inch
+    drawing = Drawing(width, height)
+    axes = Axes(width, height, BAR_CHART_MARGINS, category_limits(len(queries), 0.3), (0, 100))
+
+    add_value_axis_y(drawing, axes, font_name)
+    add_frame(drawing, axes)
+
+    # 50% 기준선
+    add_threshold(drawing, axes.x0, axes.y(50), axes.x1, axes.y(50))
+
+    for index, (query, rate) in enumerate(zip(queries, citation_rates)):
+        x = axes.x(index)
+        left, right = axes.x(index - 0.3), axes.x(index + 0.3)
+        drawing.add(grid_line(x, axes.y0, x, axes.y1))
+        drawing.add(Rect(left, axes.y0, right - left, axes.y(rate) - axes.y0,
+                         fillColor=rate_color(rate), strokeColor=WHITE, strokeWidth=1))
+
+        # 값 레이블
+        drawing.add(String(x, axes.y(rate + 2), f'{rate}%', fontName=font_name_bold, fontSize=8,
+                           fillColor=BLACK, textAnchor='middle'))
+
+        # 20도 기울인 쿼리 레이블 (오른쪽 끝을 눈금에 맞춤)
+        drawing.add(Line(x, axes.y0 - TICK_LENGTH, x, axes.y0, strokeColor=GRAY, strokeWidth=0.8))
+        label = Group(String(0, 0, query, fontName=font_name, fontSize=8, fillColor=GRAY, textAnchor='end'))
+        label.translate(x + 3, axes.y0 - TICK_LENGTH - TICK_PAD - 6)
+        label.rotate(20)
+        drawing.add(label)
+
+    add_title(drawing, 'TOP QUERIES PERFORMANCE', axes.center_x, axes.y1 + 15, font_name_bold)
+    add_axis_titles(drawing, axes, None, 'Citation Rate (%)', font_name)
+
+    return drawing
+
+
+def create_metrics_summary_drawing(data: dict) -> Drawing:
+    """주요 지표 요약 차트 - 감사 문서 스타일"""
+    font_name, font_name_bold = fonts()
+
+    # data는 차트 데이터의 'metrics' 값 자체
+    metrics = data or {
+        'citationRate': 58,
+        'citationRateChange': 5.2,
+        'totalTests': 156,
+        'avgRank': 3.2,
+    }
+
+    width, height = 10 * inch, 8 * inch
+    drawing = Drawing(width, height)
+
+    # 2x2 패널 중심 (왼쪽 위, 오른쪽 위, 왼쪽 아래, 오른쪽 아래)
+    panel_width, panel_height = width * 0.96 / 2, height * 0.88 / 2
+    centers = [
+        (width * 0.02 + panel_width * (col + 0.5), height * 0.02 + panel_height * (1.5 - row))
+        for row in (0, 1) for col in (0, 1)
+    ]
+    radius = panel_height * 0.38
+
+    def panel_title(center, text):
+        add_title(drawing, text, center[0], center[1] + panel_height * 0.42, font_name_bold, size=10)
+
+    # 1. 인용률 게이지
+    cx, cy = centers[0]
+    value = metrics.get('citationRate', 58)
+    change = metrics.get('citationRateChange', 0)
+
+    color = colors.HexColor(COLORS['pass'] if value >= 50 else COLORS['fail'])
+    add_donut(drawing, cx, cy, radius, radius * 0.65, [value, 100 - value], [color, GRAY_LIGHTEST])
+
+    change_text = f'+{change}%p' if change > 0 else f'{change}%p'
+    change_color = colors.HexColor(COLORS['pass'] if change > 0 else COLORS['fail'])
+    verdict = "PASS" if value >= 50 else "FAIL"
+
+    drawing.add(String(cx, cy + radius * 0.1 - 8, f'{value}%', fontName=font_name_bold, fontSize=24,
+                       fillColor=BLACK, textAnchor='middle'))
+    drawing.add(String(cx, cy - radius * 0.15 - 3.5, verdict, fontName=font_name_bold, fontSize=10,
+                       fillColor=color, textAnchor='middle'))
+    drawing.add(String(cx, cy - radius * 0.35 - 3.5, change_text, fontName=font_name, fontSize=10,
+                       fillColor=change_color, textAnchor='middle'))
+    panel_title(centers[0], 'CITATION RATE')
+
+    # 2. 총 테스트 수
+    cx, cy = centers[1]
+    total_tests = metrics.get('totalTests', 156)
+    drawing.add(String(cx, cy + panel_height * 0.05 - 11, str(total_tests), fontName=font_name_bold,
+                       fontSize=32, fillColor=BLACK, textAnchor='middle'))
+    drawing.add(String(cx, cy - panel_height * 0.2 - 3.5, 'TESTS', fontName=font_name, fontSize=10,
+                       fillColor=GRAY, textAnchor='middle'))
+    panel_title(centers[1], 'TOTAL TESTS')
+
+    # 3. 평균 순위
+    cx, cy = centers[2]
+    avg_rank = metrics.get('avgRank', 3.2)
+    drawing.add(String(cx, cy + panel_height * 0.05 - 11, f'{avg_rank:.1f}' if avg_rank else '-',
+                       fontName=font_name_bold, fontSize=32, fillColor=BLACK, textAnchor='middle'))
+    drawing.add(String(cx, cy - panel_height * 0.2 - 3.5, 'RANK', fontName=font_name, fontSize=10,
+                       fillColor=GRAY, textAnchor='middle'))
+    panel_title(centers[2], 'AVG RANK')
+
+    # 4. SOV
+    cx, cy = centers[3]
+    sov = metrics.get('shareOfVoice', 42)
+    add_donut(drawing, cx, cy, radius, radius * 0.65, [sov, 100 - sov], [GRAY_DARK, GRAY_LIGHTEST])
+    drawing.add(String(cx, cy - 8, f'{sov}%', fontName=font_name_bold, fontSize=24,
+                       fillColor=BLACK, textAnchor='middle'))
+    panel_title(centers[3], 'SHARE OF VOICE')
+
+    add_title(drawing, 'KEY METRICS SUMMARY', width / 2, height * 0.97 - 8, font_name_bold, size=12)
+
+    return drawing
+
+
+# =============================================================================
+# 메인 함수
+# =============================================================================
+
+# 차트 이름, 차트 데이터 키, 생성 함수 (generate_report_charts.CHART_SPECS와 같은 순서)
+CHART_SPECS = [
+    ('citation_trend', 'trend', create_citation_trend_drawing),
+    ('engine_performance', 'enginePerformance', create_engine_performance_drawing),
+    ('category_distribution', 'categoryDistribution', create_category_distribution_drawing),
+    ('top_queries', 'topQueries', create_top_queries_drawing),
+    ('metrics_summary', 'metrics', create_metrics_summary_drawing),
+]
+
+
+@render_stats.timed('charts')
+def render_chart_drawings(data: dict) -> dict:
+    """5종 차트를 벡터 Drawing으로 생성 (차트 이름 -> Drawing, 실패한 차트는 제외)"""
+    drawings = {}
+
+    for name, key, create_drawing in CHART_SPECS:
+        try:
+            with render_stats.stage(f'chart.{name}'):
+                drawings[name] = create_drawing(data.get(key, {}))
+        except Exception as e:
+            print(f"Error creating {name}: {e}")
+
+    return drawings
+
+
+def fit_drawing(drawing: Drawing, width: float) -> Drawing:
+    """Drawing을 비율을 유지하며 주어진 폭으로 축소 (원본은 그대로 두고 새 Drawing 반환)"""
+    scale = width / drawing.width
+    group = Group(*drawing.contents)
+    group.scale(scale, scale)
+    fitted = Drawing(width, drawing.height * scale)
+    fitted.add(group)
+    return fitted
@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+"""
+PDF Report Components
+세 PDF 생성기가 공유하는 레이아웃 구성요소와 미리 만들어 둔 TableStyle.
+
+- 좌우 2단 레이아웃, 왼쪽 설명 컬럼, 상단 헤더 라인, 오른쪽 본문 컬럼
+- 검은 헤더 + 격자 + 줄무늬(ROWBACKGROUNDS) 데이터 테이블
+- 고정 행 높이 대용량 테이블(PagedTable): 페이지마다 헤더를 반복하며 선형 시간에 분할, 행은 페이지 분량씩 생성
+- 점진적 빌드: 섹션 생성기에서 Flowable을 필요한 만큼만 꺼내는 FlowableStream과
+  닫힌 페이지의 내용 스트림을 바로 압축하는 CompressingCanvas (문서 크기와 무관하게 메모리 유지)
+  둘 다 ReportLab 내부 동작에 의존하므로 확인한 버전(INCREMENTAL_BUILD_REPORTLAB)에서만 사용하고,
+  다른 버전에서는 일반 doc.build(list(...))로 빌드한다 (verify_incremental_build.py로 출력이 같은지 확인).
+- 렌더 시각: payload의 renderedAt이 있으면 모든 시각 값을 그 값에서 가져오는 결정적 모드
+  (표시 시간대는 GEO_REPORT_TZ, 없으면 서버 시간대로 통일)
+
+TableStyle은 모듈 로드 시(또는 옵션 조합별 첫 호출 시) 한 번만 만들어 모든 섹션/리포트가 재사용한다.
+Table.setStyle()은 명령 목록을 복사해 가므로 같은 TableStyle을 여러 테이블에 적용해도 안전하다.
+"""
+
+import os
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
+
+import reportlab
+from reportlab import rl_config
+from reportlab.lib import colors
+from reportlab.lib.units import cm
+from reportlab.pdfbase import pdfdoc
+from reportlab.pdfgen import canvas
+from reportlab.platypus import Flowable, Paragraph, Spacer, Table, TableStyle
+
+import render_stats
+
+# =============================================================================
+# 공통 설정
+# =============================================================================
+
+# 레이아웃 설정
+LEFT_COL_WIDTH = 5 * cm
+RIGHT_COL_WIDTH = 11.5 * cm
+PAGE_HEADER_WIDTHS = [8 * cm, 8.5 * cm]
+
+# 컬러 시스템: 흑백 + 회색 기반, 판단 지표만 색상 사용
+COLORS = {
+    'black': '#000000',
+    'dark': '#1a1a1a',
+    'gray_dark': '#343a40',
+    'gray': '#6c757d',
+    'gray_light': '#adb5bd',
+    'gray_lighter': '#dee2e6',
+    'gray_lightest': '#f8f9fa',
+    'white': '#ffffff',
+    # 판단 색상
+    'pass': '#28a745',
+    'fail': '#dc3545',
+    'warning': '#ffc107',
+}
+
+GRID_COLOR = colors.HexColor(COLORS['gray_lighter'])
+ZEBRA_COLORS = [colors.white, colors.HexColor(COLORS['gray_lightest'])]
+
+
+# =============================================================================
+# 미리 만든 TableStyle
+# =============================================================================
+
+# 좌우 2단 레이아웃 (여백 없음)
+LAYOUT_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+    ('TOPPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+])
+
+# 왼쪽 설명 컬럼 (오른쪽 여백 10)
+LEFT_COLUMN_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+    ('TOPPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+])
+
+# 오른쪽 본문 컬럼 (문단 나열, 왼쪽 여백 8)
+TEXT_COLUMN_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 8),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+    ('TOPPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+])
+
+# 상단 헤더 라인 (왼쪽 / 오른쪽 정렬)
+PAGE_HEADER_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+    ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+
+@lru_cache(maxsize=None)
+def data_table_style(header_color: str = COLORS['black'], header_text_color: str = COLORS['white'],
+                     padding: int = 8, left_padding: int = 8, valign: str = 'MIDDLE',
+                     zebra: bool = True, extra: tuple = ()) -> TableStyle:
+    """헤더 + 격자 데이터 테이블 스타일 (옵션 조합별로 한 번만 생성)
+
+    header_color가 None이면 헤더 배경을 extra 명령으로 직접 지정한다.
+    left_padding이 None이면 기본 여백을 사용한다.
+    extra: ALIGN 등 테이블별 추가 명령 (튜플)
+    """
+    commands = []
+    if header_color:
+        commands.append(('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_color)))
+    commands.append(('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor(header_text_color)))
+    commands.append(('VALIGN', (0, 0), (-1, -1), valign))
+    commands.append(('TOPPADDING', (0, 0), (-1, -1), padding))
+    commands.append(('BOTTOMPADDING', (0, 0), (-1, -1), padding))
+    if left_padding is not None:
+        commands.append(('LEFTPADDING', (0, 0), (-1, -1), left_padding))
+    commands.append(('GRID', (0, 0), (-1, -1), 0.5, GRID_COLOR))
+    if zebra:
+        commands.append(('ROWBACKGROUNDS', (0, 1), (-1, -1), ZEBRA_COLORS))
+    commands.extend(extra)
+    return TableStyle(commands)
+
+
+# 자주 쓰는 정렬 명령
+CENTER_ALL = (('ALIGN', (0, 0), (-1, -1), 'CENTER'),)
+CENTER_FIRST_COLUMN = (('ALIGN', (0, 0), (0, -1), 'CENTER'),)
+CENTER_AFTER_FIRST_COLUMN = (('ALIGN', (1, 0), (-1, -1), 'CENTER'),)
+
+# 기본 데이터 테이블 (검은 헤더 + 줄무늬)
+DATA_TABLE_STYLE = data_table_style()
+
+# 지표 요약 테이블 (가운데 정렬, 줄무늬 없음)
+METRIC_TABLE_STYLE = data_table_style(left_padding=None, zebra=False, extra=CENTER_ALL)
+
+
+# =============================================================================
+# 구성요소
+# =============================================================================
+
+def create_two_column_section(left_content, right_content):
+    """좌우 2단 레이아웃 생성"""
+    return Table(
+        [[left_content, right_content]],
+        colWidths=[LEFT_COL_WIDTH, RIGHT_COL_WIDTH],
+        style=LAYOUT_STYLE,
+    )
+
+
+def create_left_column(section_title, description, styles):
+    """왼쪽 컬럼 (제목 + 설명) 생성"""
+    content = [
+        Paragraph(f"<b>{section_title}</b>", styles['SectionTitle']),
+        Spacer(1, 4),
+        Paragraph(description, styles['SectionDesc']),
+    ]
+    return Table([[c] for c in content], colWidths=[LEFT_COL_WIDTH - 0.5*cm], style=LEFT_COLUMN_STYLE)
+
+
+def create_text_column(paragraphs: list):
+    """오른쪽 본문 컬럼 (문단을 세로로 나열)"""
+    return Table([[p] for p in paragraphs], colWidths=[RIGHT_COL_WIDTH - 0.5*cm], style=TEXT_COLUMN_STYLE)
+
+
+def create_page_header(left_text: str, right_text: str, style):
+    """상단 헤더 라인 (첫 페이지 및 페이지 나눔 후 반복)"""
+    return Table(
+        [[Paragraph(left_text, style), Paragraph(right_text, style)]],
+        colWidths=PAGE_HEADER_WIDTHS,
+        style=PAGE_HEADER_STYLE,
+    )
+
+
+def create_header_row(labels, styles) -> list:
+    """데이터 테이블 헤더 행"""
+    header_style = styles['TableHeader']
+    return [Paragraph(label, header_style) for label in labels]
+
+
+def create_data_table(table_data: list, col_widths: list, style=DATA_TABLE_STYLE, row_heights=None):
+    """데이터 테이블 생성 (미리 만든 TableStyle 적용)"""
+    return Table(table_data, colWidths=col_widths, rowHeights=row_heights, style=style)
+
+
+# =============================================================================
+# 대용량 테이블 (고정 행 높이, 페이지 단위 분할)
+# =============================================================================
+
+class PagedTable(Flowable):
+    """행 수가 많은 데이터 테이블을 페이지마다 헤더를 반복하며 그리는 Flowable
+
+    행 높이가 고정이라 남은 공간에 들어갈 행 수를 바로 계산할 수 있으므로,
+    분할할 때마다 그 페이지 분량의 행만 꺼내 Table로 만들고 나머지는 같은 행 이터레이터를 이어받는다.
+    (Table(repeatRows=1)을 통째로 분할하면 분할마다 남은 행과 스타일 명령을 전부 복사하므로 행 수의 제곱에 비례)
+    행은 이터레이터에서 페이지 분량씩만 만들어지므로 전체 행 목록을 메모리에 두지 않는다.
+
+    header: 헤더 행 (셀 목록), rows: 본문 행 (리스트 또는 이터레이터, 문자열 셀 권장)
+    count: 행 수 (rows가 len()을 지원하지 않으면 필수)
+    style: 헤더 + 본문에 공통 적용할 TableStyle
+    row_commands: (페이지 분량 행 목록) -> 그 조각에만 적용할 추가 스타일 명령 (셀별 색상 등), 생략 가능
+    """
+
+    def __init__(self, header: list, rows, col_widths: list, style, row_height: float,
+                 header_height: float, row_commands=None, count: int = None):
+        super().__init__()
+        self.header = header
+        self.rows = iter(rows)
+        self.count = len(rows) if count is None else count
+        self.col_widths = col_widths
+        self.style = style
+        self.row_height = row_height
+        self.header_height = header_height
+        self.row_commands = row_commands
+        self.taken = []
+        self.hAlign = 'CENTER'
+
+    def wrap(self, availWidth, availHeight):
+        self.width = sum(self.col_widths)
+        self.height = self.header_height + self.row_height * self.count
+        return self.width, self.height
+
+    def take(self, count: int) -> list:
+        """앞쪽 count개 행 (이미 꺼낸 행은 다시 만들지 않음)"""
+        if len(self.taken) < count:
+            self.taken.extend(islice(self.rows, count - len(self.taken)))
+        return self.taken[:count]
+
+    def split(self, availWidth, availHeight):
+        fit = int((availHeight - self.header_height) // self.row_height)
+        if fit < 1:
+            return []
+        if fit >= self.count:
+            return [self]
+
+        head = self.take(fit)
+        rest = PagedTable(self.header, self.rows, self.col_widths, self.style, self.row_height,
+                          self.header_height, self.row_commands, self.count - fit)
+        rest.taken = self.taken[fit:]
+        return [self.chunk(head), rest]
+
+    def chunk(self, rows: list) -> Table:
+        """rows + 헤더로 한 페이지 분량의 Table 생성"""
+        table = Table(
+            [self.header] + rows,
+            colWidths=self.col_widths,
+            rowHeights=[self.header_height] + [self.row_height] * len(rows),
+            style=self.style,
+        )
+        if self.row_commands:
+            table.setStyle(TableStyle(self.row_commands(rows)))
+        return table
+
+    def draw(self):
+        table = self.chunk(self.take(self.count))
+        table.wrapOn(self.canv, self.width, self.height)
+        table.drawOn(self.canv, 0, 0)
+
+
+# =============================================================================
+# 점진적 빌드
+# =============================================================================
+
+# FlowableStream이 미리 꺼내 두는 Flowable 수 (keepWithNext 묶음 판단용)
+FLOWABLE_LOOKAHEAD = 8
+
+# 점진적 빌드가 기대하는 내부 동작을 확인한 ReportLab 버전
+# (BaseDocTemplate.build의 len()/[0]/del 순회, Canvas._doc.Pages와 PDFPage.stream)
+# 새 버전은 verify_incremental_build.py로 일반 빌드와 출력이 같은지 확인한 뒤 추가한다.
+INCREMENTAL_BUILD_REPORTLAB = ('5.0.1',)
+
+
+class FlowableStream(list):
+    """doc.build()에 넘기는 지연 Flowable 목록
+
+    doc.build()는 남은 개수(len)를 확인하며 앞에서부터 하나씩 꺼내 배치하므로,
+    len()이 불릴 때 앞쪽 FLOWABLE_LOOKAHEAD개만 채워 두면 섹션 생성기가 필요한 만큼만 진행된다.
+    배치가 끝난 Flowable은 목록에서 빠지므로 문서 전체의 Flowable이 한꺼번에 메모리에 남지 않는다.
+    """
+
+    def __init__(self, flowables):
+        super().__init__()
+        self.source = iter(flowables)
+        self.pulled = 0
+
+    def __len__(self):
+        missing = FLOWABLE_LOOKAHEAD - list.__len__(self)
+        if missing > 0 and self.source is not None:
+            before = list.__len__(self)
+            self.extend(islice(self.source, missing))
+            added = list.__len__(self) - before
+            self.pulled += added
+            if added < missing:
+                self.source = None
+        return list.__len__(self)
+
+
+class CompressingCanvas(canvas.Canvas):
+    """페이지를 닫을 때 내용 스트림을 바로 압축해 두는 Canvas
+
+    ReportLab은 모든 페이지의 압축 전 내용 스트림을 저장(save) 시점까지 들고 있다가 한꺼번에 압축한다.
+    페이지마다 PDFPage.check_format()과 같은 필터를 미리 적용해 두면 압축된 바이트만 남고 출력은 같다.
+    """
+
+    def showPage(self):
+        super().showPage()
+        page = self._doc.Pages.pages[-1]
+        if not page.compression or not page.stream or page.Contents:
+            return
+
+        filters = [pdfdoc.PDFBase85Encode, pdfdoc.PDFZCompress] if rl_config.useA85 else [pdfdoc.PDFZCompress]
+        content = page.stream
+        for stream_filter in reversed(filters):
+            content = stream_filter.encode(content)
+
+        contents = pdfdoc.PDFStream(
+            pdfdoc.PDFDictionary({'Filter': pdfdoc.PDFArray([pdfdoc.PDFName(f.pdfname) for f in filters])}),
+            content,
+        )
+        contents.__Comment__ = "page stream"
+        page.Contents = contents
+        page.stream = None
+
+
+def incremental_build_enabled() -> bool:
+    """점진적 빌드 사용 여부 (GEO_PDF_INCREMENTAL_BUILD=0/1로 강제, 기본: 확인한 ReportLab 버전에서만)"""
+    setting = os.environ.get('GEO_PDF_INCREMENTAL_BUILD', '').lower()
+    if setting in ('0', 'false', 'no'):
+        return False
+    if setting in ('1', 'true', 'yes'):
+        return True
+    return reportlab.Version in INCREMENTAL_BUILD_REPORTLAB
+
+
+def build_document(doc, flowables):
+    """섹션 생성기로 문서 빌드 (점진적 빌드 + 페이지 단위 압축, 렌더 통계 기록)
+
+    점진적 빌드를 쓰지 않으면 Flowable을 모두 만든 뒤 일반 doc.build()로 빌드한다.
+    """
+    if not incremental_build_enabled():
+        story = list(flowables)
+        pulled = len(story)
+        with render_stats.stage('build'):
+            doc.build(story)
+        render_stats.record_document(doc, pulled)
+        return
+
+    stream = FlowableStream(flowables)
+    with render_stats.stage('build'):
+        doc.build(stream, canvasmaker=CompressingCanvas)
+    render_stats.record_document(doc, stream.pulled)
+
+
+# =============================================================================
+# 렌더 시각 (결정적 렌더링)
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def display_timezone():
+    """문서에 시각을 표시할 시간대 (GEO_REPORT_TZ, 없거나 알 수 없으면 서버 시간대)"""
+    name = os.environ.get('GEO_REPORT_TZ')
+    if name:
+        try:
+            from zoneinfo import ZoneInfo
+            return ZoneInfo(name)
+        except Exception:
+            pass
+    return datetime.now().astimezone().tzinfo
+
+
+def parse_render_time(data: dict):
+    """payload의 renderedAt(ISO 8601) 파싱 (없거나 형식이 잘못되면 None, 시간대가 없으면 UTC로 간주)"""
+    rendered_at = data.get('renderedAt')
+    if not rendered_at:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(rendered_at).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def get_render_time(data: dict) -> datetime:
+    """문서에 찍을 렌더 시각 (renderedAt이 없으면 현재 시각, 표시 시간대로 변환)"""
+    return (parse_render_time(data) or datetime.now(timezone.utc)).astimezone(display_timezone())
+
+
+def is_deterministic(data: dict) -> bool:
+    """같은 입력이 같은 PDF 바이트를 만드는 결정적 모드인지 여부
+
+    결정적 모드에서는 ReportLab invariant 모드로 생성일/문서 ID도 고정한다.
+    """
+    return parse_render_time(data) is not None
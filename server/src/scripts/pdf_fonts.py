@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+"""
+PDF Font Subsystem
+세 PDF 생성기가 공유하는 한글 폰트 탐색/등록 모듈.
+
+- Windows / Linux / macOS 경로와 fontconfig(fc-list)로 한글 TrueType 폰트를 찾는다.
+- TTF 파싱 결과(메트릭, cmap, 테이블 위치)를 파일 경로 + mtime + 크기 + ReportLab 버전 키로 디스크에 캐시하고,
+  다음 프로세스부터는 파싱 없이 캐시를 읽는다. 캐시는 순수 데이터(JSON)로 저장하므로
+  캐시 디렉토리에 쓸 수 있는 사용자가 워커에서 코드를 실행시킬 수 없다.
+  버전이 다르거나 필수 속성이 빠진 캐시는 버리고 일반 TTFont 파싱으로 대체한다.
+- 원본 폰트 바이트는 읽기 전용 mmap으로 열어 여러 워커 프로세스가 같은 페이지 캐시를 공유한다.
+
+환경 변수:
+    GEO_PDF_FONT / GEO_PDF_FONT_BOLD   폰트 파일 직접 지정
+    GEO_FONT_CACHE_DIR                 파싱 캐시 디렉토리 (기본: ~/.cache/geo-tracker/fonts)
+"""
+
+import base64
+import hashlib
+import json
+import mmap
+import os
+import subprocess
+import sys
+from fnmatch import fnmatch
+from weakref import WeakKeyDictionary
+
+import reportlab
+from reportlab import rl_config
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTEncoding, TTFNameBytes, TTFont, TTFontFace
+
+import payload_io
+import render_stats
+
+# =============================================================================
+# 전역 설정
+# =============================================================================
+
+DEFAULT_FONT_NAME = 'Helvetica'
+DEFAULT_FONT_NAME_BOLD = 'Helvetica-Bold'
+
+KOREAN_FONT_NAME = 'KoreanFont'
+KOREAN_FONT_NAME_BOLD = 'KoreanFontBold'
+
+# 캐시 파일 형식 버전 (저장 구조가 바뀌면 올린다)
+CACHE_FORMAT = 3
+
+# 복원한 TTFontFace에 반드시 있어야 하는 속성 (TTFont가 글자 폭 계산, 서브셋 임베딩에 쓰는 값)
+# 캐시는 TTFontFace 생성자를 거치지 않고 속성을 채우므로, 하나라도 없으면 캐시를 버리고 다시 파싱한다.
+REQUIRED_FACE_ATTRIBUTES = (
+    'name', 'subfontNameX', 'unitsPerEm', 'ascent', 'descent', 'capHeight', 'italicAngle', 'stemV',
+    'bbox', 'flags', 'defaultWidth', 'numGlyphs', 'charToGlyph', 'charWidths', 'glyphToChar',
+    'glyphPos', 'hmetrics', 'table',
+)
+
+# (일반, 굵게) 후보 경로 - 앞에 있을수록 우선
+FONT_CANDIDATES = [
+    # Windows
+    ("C:/Windows/Fonts/malgun.ttf", "C:/Windows/Fonts/malgunbd.ttf"),
+    ("C:/Windows/Fonts/NanumGothic.ttf", "C:/Windows/Fonts/NanumGothicBold.ttf"),
+    # Linux (Debian/Ubuntu fonts-nanum, Fedora/Arch nanum)
+    ("/usr/share/fonts/truetype/nanum/NanumGothic.ttf", "/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf"),
+    ("/usr/share/fonts/nanum/NanumGothic.ttf", "/usr/share/fonts/nanum/NanumGothicBold.ttf"),
+    ("/usr/share/fonts/TTF/NanumGothic.ttf", "/usr/share/fonts/TTF/NanumGothicBold.ttf"),
+    ("/usr/share/fonts/naver-nanum/NanumGothic.ttf", "/usr/share/fonts/naver-nanum/NanumGothicBold.ttf"),
+    ("/usr/share/fonts/truetype/unfonts-core/UnDotum.ttf", "/usr/share/fonts/truetype/unfonts-core/UnDotumBold.ttf"),
+    ("/usr/share/fonts/truetype/baekmuk/dotum.ttf", "/usr/share/fonts/truetype/baekmuk/dotum.ttf"),
+    # macOS
+    ("/Library/Fonts/NanumGothic.ttf", "/Library/Fonts/NanumGothicBold.ttf"),
+    ("/System/Library/Fonts/Supplemental/AppleGothic.ttf", "/System/Library/Fonts/Supplemental/AppleGothic.ttf"),
+]
+
+# 프로세스 내 등록 결과 (폰트 이름 쌍)
+_REGISTERED = None
+
+
+# =============================================================================
+# 폰트 탐색
+# =============================================================================
+
+def find_fontconfig_korean_font():
+    """fontconfig로 한글을 지원하는 TrueType 폰트 탐색 (없으면 None)"""
+    try:
+        proc = subprocess.run(
+            ['fc-list', ':lang=ko', 'file', 'style'],
+            capture_output=True, text=True, timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    regular, bold = None, None
+    for line in sorted(proc.stdout.splitlines()):
+        path, _, style = line.partition(':')
+        path = path.strip()
+        # ReportLab은 TrueType 윤곽선(.ttf)만 지원 (CFF 기반 .otf/.ttc 제외)
+        if not path.lower().endswith('.ttf'):
+            continue
+        if 'bold' in style.lower():
+            bold = bold or path
+        else:
+            regular = regular or path
+
+    if regular is None:
+        return None
+    return regular, bold or regular
+
+
+def find_korean_font():
+    """사용할 한글 폰트 (일반, 굵게) 경로 반환 (없으면 None)"""
+    regular = os.environ.get('GEO_PDF_FONT')
+    if regular and os.path.exists(regular):
+        bold = os.environ.get('GEO_PDF_FONT_BOLD')
+        return regular, bold if bold and os.path.exists(bold) else regular
+
+    for regular, bold in FONT_CANDIDATES:
+        if os.path.exists(regular):
+            return regular, bold if os.path.exists(bold) else regular
+
+    return find_fontconfig_korean_font()
+
+
+# =============================================================================
+# 파싱 캐시
+# =============================================================================
+
+def get_cache_dir() -> str:
+    """파싱 캐시 디렉토리"""
+    cache_dir = os.environ.get('GEO_FONT_CACHE_DIR')
+    if cache_dir:
+        return cache_dir
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'geo-tracker', 'fonts')
+
+
+def get_cache_path(font_path: str) -> str:
+    """폰트 파일 경로 + mtime + 크기 + ReportLab 버전으로 캐시 파일 경로 생성"""
+    stat = os.stat(font_path)
+    key = '|'.join([
+        os.path.realpath(font_path),
+        str(stat.st_mtime_ns),
+        str(stat.st_size),
+        reportlab.Version,
+        str(CACHE_FORMAT),
+    ])
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return os.path.join(get_cache_dir(), f'{digest}.json')
+
+
+def map_font_file(font_path: str):
+    """폰트 파일을 읽기 전용 mmap으로 열기 (프로세스 간 페이지 캐시 공유)"""
+    with open(font_path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+# JSON에 그대로 담을 수 없는 값의 표시 키:
+#   {"n": str}            TTFNameBytes (폰트 이름 문자열)
+#   {"b": base64}         bytes
+#   {"t": [...]}          tuple
+#   {"T": [[...], ...]}   숫자 tuple의 list (hmetrics)
+#   {"L": [[...], ...]}   숫자 list의 list (glyphToChar 값)
+#   {"i": [keys, values]} 정수 키 dict (cmap, 글리프 폭 등)
+#   {"d": {...}}          문자열 키 dict
+def encode_value(value):
+    """TTFontFace 상태 값을 JSON 값으로 변환 (지원하지 않는 타입이면 TypeError)"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, TTFNameBytes):
+        return {'n': value.decode('utf-8')}
+    if isinstance(value, bytes):
+        return {'b': base64.b64encode(value).decode('ascii')}
+    if isinstance(value, list):
+        # 큰 숫자 배열의 배열은 원소마다 표시 키를 달지 않고 통째로 저장 (읽을 때 복원 비용 절감)
+        if value and all(type(item) in (list, tuple) and all(type(x) in (int, float) for x in item)
+                         for item in value):
+            kinds = {type(item) for item in value}
+            if len(kinds) == 1:
+                return {'T' if tuple in kinds else 'L': [list(item) for item in value]}
+        return [encode_value(item) for item in value]
+    if isinstance(value, tuple):
+        return {'t': [encode_value(item) for item in value]}
+    if isinstance(value, dict):
+        if all(isinstance(key, int) for key in value):
+            return {'i': [list(value), encode_value(list(value.values()))]}
+        if all(isinstance(key, str) for key in value):
+            return {'d': {key: encode_value(item) for key, item in value.items()}}
+    raise TypeError(f"Unsupported font cache value: {type(value).__name__}")
+
+
+def decode_value(value):
+    """encode_value()의 역변환 (형식이 맞지 않으면 ValueError)"""
+    if isinstance(value, list):
+        # 숫자만 담긴 큰 배열(글리프 위치 등)은 그대로 사용
+        if any(isinstance(item, (list, dict)) for item in value):
+            return [decode_value(item) for item in value]
+        return value
+    if not isinstance(value, dict):
+        return value
+    if len(value) != 1:
+        raise ValueError("Invalid font cache value")
+
+    tag, data = next(iter(value.items()))
+    if tag == 'n':
+        return TTFNameBytes(data.encode('utf-8'))
+    if tag == 'b':
+        return base64.b64decode(data)
+    if tag == 't':
+        return tuple(decode_value(data))
+    if tag == 'T':
+        return list(map(tuple, data))
+    if tag == 'L':
+        return data
+    if tag == 'i':
+        keys, values = data
+        return dict(zip(keys, decode_value(values)))
+    if tag == 'd':
+        return {key: decode_value(item) for key, item in data.items()}
+    raise ValueError(f"Invalid font cache tag: {tag}")
+
+
+def save_face_cache(face: TTFontFace, cache_path: str):
+    """파싱된 폰트 정보를 캐시에 저장 (원본 바이트와 함수 객체 제외, 만든 ReportLab 버전 기록)"""
+    state = {
+        'reportlab': reportlab.Version,
+        'format': CACHE_FORMAT,
+        'face': {k: encode_value(v) for k, v in face.__dict__.items() if k not in ('_ttf_data', '_pdfScale')},
+    }
+
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, separators=(',', ':'))
+    # 병렬 워커가 반쯤 쓰인 파일을 읽지 않도록 원자적으로 교체
+    os.replace(tmp_path, cache_path)
+
+
+def load_face_cache(font_path: str, cache_path: str):
+    """캐시에서 TTFontFace 복원 (없거나, 다른 ReportLab 버전이 만들었거나, 필수 속성이 없으면 None)"""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = payload_io.loads(f.read())
+        if cached.get('reportlab') != reportlab.Version or cached.get('format') != CACHE_FORMAT:
+            return None
+        state = {key: decode_value(value) for key, value in cached['face'].items()}
+        if not isinstance(state.get('unitsPerEm'), int) or state['unitsPerEm'] <= 0:
+            return None
+    except (OSError, KeyError, ValueError, TypeError, AttributeError):
+        return None
+
+    missing = [name for name in REQUIRED_FACE_ATTRIBUTES if name not in state]
+    if missing or not all(isinstance(state[name], dict) for name in ('charToGlyph', 'charWidths', 'table')):
+        print(f"Invalid font cache for {font_path} (missing: {', '.join(missing) or '-'}); reparsing",
+              file=sys.stderr)
+        return None
+
+    try:
+        ttf_data = map_font_file(font_path)
+    except (OSError, ValueError):
+        return None
+
+    face = TTFontFace.__new__(TTFontFace)
+    face.__dict__.update(state)
+    face._ttf_data = ttf_data
+
+    units_per_em = face.unitsPerEm
+    if units_per_em == 1000:
+        face._pdfScale = lambda x: x
+    else:
+        scale = 1000 / units_per_em
+        face._pdfScale = lambda x: x * scale
+
+    return face
+
+
+class CachedTTFont(TTFont):
+    """미리 로드된 TTFontFace를 사용하는 TTFont (파싱 생략)"""
+
+    def __init__(self, name, face: TTFontFace):
+        # TTFont.__init__과 동일하되 TTFontFace(filename) 파싱 대신 주어진 face 사용
+        self.fontName = name
+        self.face = face
+        self.encoding = TTEncoding()
+        self.state = WeakKeyDictionary()
+        self._asciiReadable = rl_config.ttfAsciiReadable
+        self.shapable = not any(fnmatch(name, pattern) for pattern in rl_config.unShapedFontGlob)
+
+
+def load_font(name: str, font_path: str) -> TTFont:
+    """캐시를 사용해 TTFont 생성 (캐시가 없거나 복원에 실패하면 일반 TTFont로 파싱한 뒤 캐시 저장)"""
+    try:
+        cache_path = get_cache_path(font_path)
+    except OSError:
+        return TTFont(name, font_path)
+
+    face = load_face_cache(font_path, cache_path)
+    if face is not None:
+        try:
+            return CachedTTFont(name, face)
+        except Exception as e:
+            print(f"Font cache unavailable for {font_path}: {e}", file=sys.stderr)
+
+    font = TTFont(name, font_path)
+    try:
+        save_face_cache(font.face, cache_path)
+    except (OSError, TypeError) as e:
+        print(f"Font cache write skipped: {e}", file=sys.stderr)
+    return font
+
+
+# =============================================================================
+# 등록
+# =============================================================================
+
+@render_stats.timed('fonts')
+def register_korean_fonts() -> tuple:
+    """한글 폰트 등록 후 (일반, 굵게) 폰트 이름 반환 (프로세스당 한 번만 수행)"""
+    global _REGISTERED
+
+    if _REGISTERED is not None:
+        return _REGISTERED
+
+    _REGISTERED = (DEFAULT_FONT_NAME, DEFAULT_FONT_NAME_BOLD)
+
+    try:
+        paths = find_korean_font()
+        if paths:
+            regular, bold = paths
+            pdfmetrics.registerFont(load_font(KOREAN_FONT_NAME, regular))
+            pdfmetrics.registerFont(load_font(KOREAN_FONT_NAME_BOLD, bold))
+            _REGISTERED = (KOREAN_FONT_NAME, KOREAN_FONT_NAME_BOLD)
+    except Exception as e:
+        print(f"Font registration error: {e}")
+
+    return _REGISTERED
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+PDF Style Registry
+리포트 종류별 스타일시트를 폰트 설정마다 한 번만 생성하고, 변경할 수 없는 인스턴스를 공유한다.
+
+생성기는 모듈 로드 시 register_stylesheet()로 빌더 함수를 등록하고,
+렌더 시 get_stylesheet()로 (리포트 종류, 폰트, 굵은 폰트) 조합의 캐시된 스타일시트를 받는다.
+빌더는 폰트 이름을 인자로 받으므로 전역 폰트 설정에 의존하지 않는다.
+"""
+
+import threading
+from types import MappingProxyType
+
+from reportlab.lib.styles import ParagraphStyle
+
+import render_stats
+
+
+# =============================================================================
+# 변경 불가 스타일
+# =============================================================================
+
+class FrozenParagraphStyle(ParagraphStyle):
+    """생성 후 속성을 변경할 수 없는 ParagraphStyle (작업 간 공유용)"""
+
+    def __init__(self, name, parent=None, **kw):
+        super().__init__(name, parent, **kw)
+        self.__dict__['_frozen'] = True
+
+    def __setattr__(self, key, value):
+        if self.__dict__.get('_frozen'):
+            raise AttributeError(
+                f"Style '{self.name}' is shared and read-only; use clone() to derive a new style"
+            )
+        super().__setattr__(key, value)
+
+    def __delattr__(self, key):
+        if self.__dict__.get('_frozen'):
+            raise AttributeError(f"Style '{self.name}' is shared and read-only")
+        super().__delattr__(key)
+
+    def clone(self, name, parent=None, **kwds):
+        """이 스타일(또는 parent)을 부모로 하는 새 스타일 생성"""
+        return FrozenParagraphStyle(name, parent or self, **kwds)
+
+
+# =============================================================================
+# 레지스트리
+# =============================================================================
+
+# 리포트 종류 -> 빌더 함수 (font_name, font_name_bold) -> [FrozenParagraphStyle]
+_BUILDERS = {}
+
+# (리포트 종류, 폰트, 굵은 폰트) -> 읽기 전용 스타일시트
+_STYLESHEETS = {}
+
+_LOCK = threading.Lock()
+
+
+def register_stylesheet(report_type: str, builder):
+    """리포트 종류별 스타일 빌더 등록"""
+    _BUILDERS[report_type] = builder
+
+
+@render_stats.timed('styles')
+def get_stylesheet(report_type: str, font_name: str, font_name_bold: str):
+    """폰트 설정에 맞는 스타일시트 반환 (조합별로 한 번만 생성)"""
+    key = (report_type, font_name, font_name_bold)
+
+    stylesheet = _STYLESHEETS.get(key)
+    if stylesheet is not None:
+        return stylesheet
+
+    with _LOCK:
+        stylesheet = _STYLESHEETS.get(key)
+        if stylesheet is None:
+            styles = _BUILDERS[report_type](font_name, font_name_bold)
+            stylesheet = MappingProxyType({style.name: style for style in styles})
+            _STYLESHEETS[key] = stylesheet
+
+    return stylesheet
+
+
+def cached_stylesheets() -> list:
+    """생성되어 캐시된 (리포트 종류, 폰트, 굵은 폰트) 목록"""
+    return sorted(_STYLESHEETS)
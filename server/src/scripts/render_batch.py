@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+"""
+Report Batch Renderer
+JSONL 매니페스트의 렌더 작업을 한 프로세스에서 차례로 처리한다.
+모듈 import, 폰트 등록, 스타일시트, 차트 모듈은 render_worker.warm_up()으로 한 번 준비해 모든 작업이 공유한다.
+
+매니페스트 한 줄 = 작업 하나 (render_worker.py 요청 형식과 동일)
+    {"id": "brand-1-weekly", "job": "report", "data": {...}, "output": "/out/brand-1.pdf"}
+data 대신 "dataFile"로 입력 JSON 파일 경로를 지정할 수 있다 (작업을 처리할 때 읽으며, gzip 압축 파일도 받는다).
+
+결과: 작업마다 결과 JSON 한 줄 (--results 파일, 기본 stdout, 완료 순서), stdout 마지막 줄은 전체 요약
+(차트 캐시 적중률 chartCache 포함).
+체크포인트: 성공한 작업의 결과를 한 줄씩 기록(fsync)하고, 다시 실행하면 체크포인트에 있고
+출력 파일이 남아 있는 작업은 건너뛴다. 기본 경로는 <manifest>.checkpoint.
+
+병렬 실행 (POSIX): 부모가 준비를 마친 뒤 작업마다 자식 프로세스를 fork하여 최대 --workers 개를 동시에 처리한다.
+작업 시간이 --timeout 초를 넘거나 자식 RSS가 --max-rss-mb를 넘으면 자식을 종료하고 해당 작업만 실패로 기록한다.
+--workers 1 --timeout 0 --max-rss-mb 0 이거나 fork가 없는 환경에서는 한 프로세스에서 차례로 처리한다.
+
+Usage:
+    python render_batch.py <manifest.jsonl> [--checkpoint PATH] [--results PATH] [--lazy]
+                           [--workers N] [--timeout SEC] [--max-rss-mb N]
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import os
+import selectors
+import signal
+import sys
+import time
+
+import payload_io
+import render_server
+import render_stats
+import render_worker
+
+# 자식 프로세스 상태(RSS/시간 초과) 확인 주기 (초)
+POLL_INTERVAL = 0.2
+
+
+# =============================================================================
+# 매니페스트 / 체크포인트
+# =============================================================================
+
+def read_manifest(manifest_path: str):
+    """매니페스트를 한 줄씩 읽어 (줄 번호, 작업 dict 또는 None, 오류) 반환"""
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                job = json.loads(line)
+                if not isinstance(job, dict):
+                    raise ValueError("Job must be a JSON object")
+            except Exception as e:
+                yield line_no, None, f"Invalid manifest line {line_no}: {e}"
+            else:
+                yield line_no, job, None
+
+
+def load_checkpoint(checkpoint_path: str) -> dict:
+    """체크포인트 파일에서 완료된 작업 결과 로드 (id -> 결과)"""
+    done = {}
+    if not os.path.exists(checkpoint_path):
+        return done
+
+    with open(checkpoint_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                # 기록 중 중단된 마지막 줄은 무시
+                continue
+            if isinstance(result, dict) and result.get('id') is not None:
+                done[result['id']] = result
+    return done
+
+
+def result_paths(result: dict) -> list:
+    """결과에 포함된 출력 파일 경로 목록"""
+    paths = list(result.get('charts', []))
+    if result.get('path'):
+        paths.append(result['path'])
+    return paths
+
+
+def is_completed(result: dict) -> bool:
+    """체크포인트 결과가 유효한지 (성공했고 출력 파일이 모두 남아 있는지)"""
+    if not result or not result.get('success'):
+        return False
+    paths = result_paths(result)
+    return bool(paths) and all(os.path.exists(path) for path in paths)
+
+
+def resolve_job(job: dict) -> dict:
+    """dataFile로 지정된 입력 데이터를 읽어 요청 형식으로 변환"""
+    if 'data' in job or not job.get('dataFile'):
+        return job
+
+    # gzip 입력 지원, 큰 배열(GEO pages 등)은 원소 단위로 읽어 필요한 필드만 남긴다
+    data = payload_io.load_payload(job['dataFile'], payload_io.JOB_STREAMED_ARRAYS.get(job.get('job')))
+    request = {k: v for k, v in job.items() if k != 'dataFile'}
+    request['data'] = data
+    return request
+
+
+# =============================================================================
+# 결과 기록
+# =============================================================================
+
+class BatchRecorder:
+    """작업 결과를 결과 스트림과 체크포인트에 기록하고 요약을 집계"""
+
+    def __init__(self, results_stream, checkpoint):
+        self.results_stream = results_stream
+        self.checkpoint = checkpoint
+        self.summary = {'total': 0, 'rendered': 0, 'skipped': 0, 'failed': 0}
+        self.chart_cache = {'hits': 0, 'misses': 0}
+
+    def record(self, result: dict, skipped: bool = False):
+        self.summary['total'] += 1
+
+        if skipped:
+            self.summary['skipped'] += 1
+            result = {**result, 'skipped': True}
+        elif result.get('success'):
+            self.summary['rendered'] += 1
+            # 결과를 내보내기 전에 체크포인트를 디스크에 기록 (중단 후 재실행 시 건너뛰기)
+            self.checkpoint.write(json.dumps(result, ensure_ascii=False) + '\n')
+            self.checkpoint.flush()
+            os.fsync(self.checkpoint.fileno())
+        else:
+            self.summary['failed'] += 1
+
+        if not skipped and result.get('chartCache'):
+            self.chart_cache['hits'] += result['chartCache']['hits']
+            self.chart_cache['misses'] += result['chartCache']['misses']
+
+        self.results_stream.write(json.dumps(result, ensure_ascii=False) + '\n')
+        self.results_stream.flush()
+
+        if not skipped and 'elapsedMs' in result:
+            print(f"[{self.summary['total']}] {result['id']}: {'OK' if result.get('success') else 'FAIL'} "
+                  f"({result['elapsedMs']}ms)", file=sys.stderr)
+
+
+def pending_jobs(manifest_path: str, done: dict, recorder: BatchRecorder):
+    """렌더가 필요한 (작업 id, 작업) 생성 (잘못된 줄/중복/완료된 작업은 바로 기록)"""
+    seen_ids = set()
+
+    for line_no, job, error in read_manifest(manifest_path):
+        if job is None:
+            recorder.record({'id': None, 'line': line_no, 'success': False, 'error': error})
+            continue
+
+        job_id = job.get('id') or f'line-{line_no}'
+        if job_id in seen_ids:
+            recorder.record({'id': job_id, 'line': line_no, 'success': False,
+                             'error': f"Duplicate job id: {job_id}"})
+            continue
+        seen_ids.add(job_id)
+
+        if is_completed(done.get(job_id)):
+            recorder.record(done[job_id], skipped=True)
+            continue
+
+        yield job_id, {**job, 'id': job_id}
+
+
+def execute_job(job: dict) -> dict:
+    """작업 하나 실행 (dataFile 읽기 포함)"""
+    if job.get('output') == render_worker.STREAM_OUTPUT:
+        return {'id': job['id'], 'success': False, 'error': "Batch jobs need an output file path"}
+
+    try:
+        request = resolve_job(job)
+    except Exception as e:
+        return {'id': job['id'], 'success': False, 'error': f"Cannot read dataFile: {e}"}
+    return render_worker.run_job(request)
+
+
+# =============================================================================
+# 순차 실행
+# =============================================================================
+
+def run_serial(jobs, recorder: BatchRecorder):
+    """한 프로세스에서 작업을 차례로 처리"""
+    for job_id, job in jobs:
+        started = time.perf_counter()
+        result = execute_job(job)
+        result['elapsedMs'] = round((time.perf_counter() - started) * 1000, 1)
+        recorder.record(result)
+
+
+# =============================================================================
+# 병렬 실행 (작업별 자식 프로세스)
+# =============================================================================
+
+def spawn_job(job: dict):
+    """작업 하나를 처리할 자식 프로세스 fork (부모에는 (pid, 결과 파이프 fd) 반환)"""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid:
+        os.close(write_fd)
+        return pid, read_fd
+
+    code = 0
+    try:
+        os.close(read_fd)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        result = execute_job(job)
+        with os.fdopen(write_fd, 'wb') as writer:
+            writer.write(json.dumps(result, ensure_ascii=False).encode('utf-8'))
+    except BaseException:
+        code = 1
+    finally:
+        os._exit(code)
+
+
+def kill_job(pid: int):
+    """자식 프로세스 강제 종료 후 회수"""
+    with contextlib.suppress(ProcessLookupError):
+        os.kill(pid, signal.SIGKILL)
+    with contextlib.suppress(ChildProcessError):
+        os.waitpid(pid, 0)
+
+
+def collect_job(task: dict) -> dict:
+    """종료된 자식의 결과 수집 (결과 없이 종료되면 실패로 변환)"""
+    _, status = os.waitpid(task['pid'], 0)
+    try:
+        return json.loads(b''.join(task['chunks']).decode('utf-8'))
+    except ValueError:
+        return {'id': task['id'], 'success': False,
+                'error': f"Worker exited with code {os.waitstatus_to_exitcode(status)}"}
+
+
+def run_parallel(jobs, recorder: BatchRecorder, workers: int, timeout: float, max_rss: int):
+    """최대 workers 개의 자식 프로세스로 작업을 병렬 처리 (시간/메모리 한도 초과 시 종료)"""
+    # fork 이후 GC가 공유 페이지를 건드려 복사가 일어나지 않도록 준비된 객체를 고정
+    gc.collect()
+    gc.freeze()
+
+    # 작업 단위로 이미 코어를 나눠 쓰므로 작업 안의 차트 동시 렌더는 끈다 (환경 변수로 지정하면 우선)
+    if workers > 1:
+        os.environ.setdefault('GEO_CHART_WORKERS', '1')
+
+    selector = selectors.DefaultSelector()
+    running = {}  # 결과 파이프 fd -> 작업 상태
+    jobs = iter(jobs)
+    exhausted = False
+
+    def finish(fd: int, result: dict):
+        task = running.pop(fd)
+        selector.unregister(fd)
+        os.close(fd)
+        result['elapsedMs'] = round((time.monotonic() - task['started']) * 1000, 1)
+        recorder.record(result)
+
+    try:
+        while True:
+            while not exhausted and len(running) < workers:
+                item = next(jobs, None)
+                if item is None:
+                    exhausted = True
+                    break
+                job_id, job = item
+                pid, fd = spawn_job(job)
+                running[fd] = {'id': job_id, 'pid': pid, 'started': time.monotonic(), 'chunks': []}
+                selector.register(fd, selectors.EVENT_READ)
+
+            if not running:
+                break
+
+            for key, _ in selector.select(timeout=POLL_INTERVAL):
+                fd = key.fd
+                chunk = os.read(fd, 65536)
+                if chunk:
+                    running[fd]['chunks'].append(chunk)
+                else:
+                    finish(fd, collect_job(running[fd]))
+
+            now = time.monotonic()
+            for fd, task in list(running.items()):
+                error = None
+                if timeout and now - task['started'] > timeout:
+                    error = f"Timed out after {timeout:g}s"
+                elif max_rss and render_stats.current_rss(task['pid']) > max_rss:
+                    error = f"Exceeded memory limit ({max_rss // (1024 * 1024)}MB RSS)"
+                if error:
+                    kill_job(task['pid'])
+                    finish(fd, {'id': task['id'], 'success': False, 'error': error})
+    finally:
+        for task in running.values():
+            kill_job(task['pid'])
+        selector.close()
+
+
+# =============================================================================
+# 배치 실행
+# =============================================================================
+
+def run_batch(manifest_path: str, checkpoint_path: str, results_stream,
+              workers: int = 1, timeout: float = 0, max_rss_mb: int = 0) -> dict:
+    """매니페스트의 모든 작업을 처리하고 요약 반환"""
+    done = load_checkpoint(checkpoint_path)
+    started = time.perf_counter()
+    parallel = hasattr(os, 'fork') and (workers > 1 or timeout or max_rss_mb)
+
+    with open(checkpoint_path, 'a', encoding='utf-8') as checkpoint:
+        recorder = BatchRecorder(results_stream, checkpoint)
+        jobs = pending_jobs(manifest_path, done, recorder)
+        if parallel:
+            run_parallel(jobs, recorder, workers, timeout, max_rss_mb * 1024 * 1024)
+        else:
+            run_serial(jobs, recorder)
+
+    summary = recorder.summary
+    elapsed = time.perf_counter() - started
+    summary['workers'] = workers if parallel else 1
+    summary['elapsedSec'] = round(elapsed, 2)
+    summary['reportsPerSec'] = round(summary['rendered'] / elapsed, 2) if elapsed > 0 else 0
+    lookups = recorder.chart_cache['hits'] + recorder.chart_cache['misses']
+    summary['chartCache'] = {
+        **recorder.chart_cache,
+        'hitRate': round(recorder.chart_cache['hits'] / lookups, 3) if lookups else 0.0,
+    }
+    summary['success'] = summary['failed'] == 0
+    return summary
+
+
+def default_workers() -> int:
+    """사용 가능한 CPU 코어 수"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GEO report batch renderer')
+    parser.add_argument('manifest')
+    parser.add_argument('--checkpoint', help='체크포인트 파일 경로 (기본: <manifest>.checkpoint)')
+    parser.add_argument('--results', help='작업별 결과 JSONL 파일 경로 (기본: stdout)')
+    parser.add_argument('--lazy', action='store_true', help='warm-up 생략')
+    parser.add_argument('--workers', type=int, default=default_workers(), help='동시 처리 작업 수 (기본: CPU 코어 수)')
+    parser.add_argument('--timeout', type=float, default=300, help='작업당 제한 시간 초 (0 = 무제한)')
+    parser.add_argument('--max-rss-mb', type=int, default=1024, help='작업 프로세스 RSS 한도 MB (0 = 무제한)')
+    args = parser.parse_args()
+
+    checkpoint_path = args.checkpoint or f'{args.manifest}.checkpoint'
+
+    if not args.lazy:
+        render_worker.warm_up()
+        if hasattr(os, 'fork'):
+            render_server.prime_matplotlib()
+
+    def stop(signum, frame):
+        raise SystemExit(1)
+
+    # 종료 신호를 받으면 실행 중인 자식 프로세스를 정리하고 종료
+    signal.signal(signal.SIGTERM, stop)
+
+    with contextlib.ExitStack() as stack:
+        if args.results:
+            results_stream = stack.enter_context(open(args.results, 'a', encoding='utf-8'))
+        else:
+            results_stream = sys.stdout
+        summary = run_batch(args.manifest, checkpoint_path, results_stream,
+                            max(args.workers, 1), args.timeout, args.max_rss_mb)
+
+    print(json.dumps(summary, ensure_ascii=False))
+    if not summary['success']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+PDF Render Cache
+결정적 모드(payload에 renderedAt이 있는) 렌더 결과를 내용 주소(content-addressed) 방식으로 디스크에 캐시한다.
+같은 주간 리포트나 GEO 감사를 다시 내려받으면 렌더 없이 캐시된 PDF를 복사한다.
+
+키 = sha256(작업 종류 + 정규화된 payload JSON + 생성기 버전)
+payload의 renderedAt도 그대로 키에 들어가고 (표시 시간대로 바꾼 렌더 시각과 함께),
+캐시된 PDF는 항상 키의 입력으로 렌더한 것과 같은 바이트다.
+(같은 날 다시 내려받을 때 재사용하려면 호출 측이 renderedAt을 날짜 단위로 맞춰 보낸다)
+생성기 버전 = 생성 스크립트 소스 + ReportLab/matplotlib 버전 + 사용 폰트 파일 (경로, mtime, 크기)
+스크립트나 라이브러리, 폰트가 바뀌면 키가 달라지므로 별도의 무효화가 필요 없다.
+
+조회 시 항목의 mtime을 갱신하고, 저장 후 전체 크기가 한도를 넘으면 mtime이 오래된 항목부터 삭제한다
+(LRU, 크기 추적과 재조사 주기는 disk_cache 참고).
+renderedAt이 없는 payload는 현재 시각이 찍히므로 캐시하지 않는다.
+
+환경 변수:
+    GEO_PDF_CACHE_DIR      캐시 디렉토리 (기본: ~/.cache/geo-tracker/pdf)
+    GEO_PDF_CACHE_MAX_MB   캐시 최대 크기 MB (기본: 512, 0 = 캐시 사용 안 함)
+"""
+
+import hashlib
+import json
+import os
+from functools import lru_cache
+from importlib import metadata
+
+import reportlab
+
+import disk_cache
+import pdf_components
+import pdf_fonts
+
+# =============================================================================
+# 전역 설정
+# =============================================================================
+
+# 키 형식 버전 (키 구성이 바뀌면 올린다)
+CACHE_FORMAT = 3
+
+DEFAULT_MAX_MB = 512
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 모든 PDF 생성기가 공유하는 모듈
+COMMON_SOURCES = ['pdf_fonts.py', 'pdf_styles.py', 'pdf_components.py']
+
+# 캐시 가능한 작업 -> 출력에 영향을 주는 생성 스크립트
+# (report_pdf는 외부 차트 디렉토리에, report_charts는 여러 파일 출력에 의존하므로 제외)
+JOB_SOURCES = {
+    'report': ['generate_report.py', 'chart_data.py', 'generate_report_charts.py', 'pdf_charts.py', 'generate_pdf.py'],
+    'geo_score_pdf': ['generate_geo_score_pdf.py', 'route_index.py', 'page_scores.py'],
+    'insights_pdf': ['generate_insights_pdf.py'],
+}
+
+
+def get_cache_dir() -> str:
+    """PDF 캐시 디렉토리"""
+    return disk_cache.default_cache_dir('GEO_PDF_CACHE_DIR', 'pdf')
+
+
+def get_max_bytes() -> int:
+    """캐시 최대 크기 (bytes, 0 = 사용 안 함)"""
+    return disk_cache.env_megabytes('GEO_PDF_CACHE_MAX_MB', DEFAULT_MAX_MB)
+
+
+def is_enabled() -> bool:
+    """캐시 사용 여부 (GEO_PDF_CACHE_MAX_MB=0이면 사용 안 함)"""
+    return get_max_bytes() > 0
+
+
+# =============================================================================
+# 캐시 키
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def generator_version(job: str) -> str:
+    """작업 종류별 생성기 버전 (소스 + 라이브러리 + 폰트 식별자 해시, 프로세스당 한 번 계산)"""
+    digest = hashlib.sha256()
+    digest.update(f'format={CACHE_FORMAT}|reportlab={reportlab.Version}'.encode('utf-8'))
+
+    if job == 'report':
+        try:
+            digest.update(f"|matplotlib={metadata.version('matplotlib')}".encode('utf-8'))
+        except metadata.PackageNotFoundError:
+            pass
+
+    for name in COMMON_SOURCES + JOB_SOURCES[job]:
+        with open(os.path.join(SCRIPTS_DIR, name), 'rb') as f:
+            digest.update(name.encode('utf-8'))
+            digest.update(hashlib.sha256(f.read()).digest())
+
+    for path in pdf_fonts.find_korean_font() or ():
+        stat = os.stat(path)
+        digest.update(f'|{os.path.realpath(path)}|{stat.st_mtime_ns}|{stat.st_size}'.encode('utf-8'))
+
+    return digest.hexdigest()[:16]
+
+
+def display_time(data: dict) -> str:
+    """문서에 찍히는 렌더 시각 (같은 renderedAt이라도 표시 시간대가 다르면 PDF 바이트가 다르다)"""
+    render_time = pdf_components.get_render_time(data)
+    return f'{render_time.isoformat()}@{render_time.tzname()}'
+
+
+def cache_key(job: str, data: dict):
+    """작업 + payload의 캐시 키 (캐시할 수 없는 작업이나 비결정적 payload면 None)"""
+    if job not in JOB_SOURCES or not pdf_components.is_deterministic(data):
+        return None
+
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    digest = hashlib.sha256()
+    digest.update(f'{job}|{generator_version(job)}|{display_time(data)}|'.encode('utf-8'))
+    digest.update(payload.encode('utf-8'))
+    return digest.hexdigest()
+
+
+# =============================================================================
+# 조회 / 저장
+# =============================================================================
+
+def read(key: str):
+    """캐시된 PDF 바이트 (없으면 None)"""
+    path = disk_cache.entry_path(get_cache_dir(), key, '.pdf')
+    try:
+        with open(path, 'rb') as f:
+            payload = f.read()
+    except FileNotFoundError:
+        return None
+
+    disk_cache.touch(path)
+    return payload
+
+
+def write(key: str, payload: bytes):
+    """PDF 바이트를 캐시에 저장한 뒤 한도를 넘으면 오래된 항목 정리"""
+    max_bytes = get_max_bytes()
+    if not max_bytes or len(payload) > max_bytes:
+        return
+
+    disk_cache.write_atomic(disk_cache.entry_path(get_cache_dir(), key, '.pdf'), payload)
+    disk_cache.after_write(get_cache_dir(), max_bytes, '.pdf', len(payload))
+
+
+def lookup(key: str, output_path: str) -> bool:
+    """캐시 항목이 있으면 output_path로 복사하고 True 반환"""
+    payload = read(key)
+    if payload is None:
+        return False
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, 'wb') as f:
+        f.write(payload)
+    return True
+
+
+def store(key: str, output_path: str):
+    """렌더된 PDF 파일을 캐시에 저장"""
+    if os.path.getsize(output_path) > get_max_bytes():
+        return
+
+    with open(output_path, 'rb') as f:
+        write(key, f.read())
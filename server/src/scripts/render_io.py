@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Render Stream I/O
+생성 스크립트 CLI의 입출력 공통 처리.
+입력/출력 경로에 '-'를 주면 임시 파일 없이 stdin에서 payload를 읽고 완성된 PDF 바이트를 stdout으로 내보낸다.
+
+스트리밍 모드에서는 stdout이 PDF 전용이므로
+- 상태 JSON ({"success": true, "bytes": N} 등)은 fd 3이 열려 있으면 fd 3, 아니면 stderr로 출력하고
+- 생성 스크립트의 진행 로그는 stderr로 보낸다.
+PDF는 렌더가 끝난 뒤 한 번에 쓰므로 실패 시 stdout에는 아무것도 쓰지 않는다.
+입력은 payload_io로 읽으므로 gzip 압축 payload도 그대로 받는다.
+
+Usage:
+    python generate_geo_score_pdf.py - - < payload.json > report.pdf 3> status.json
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+
+import payload_io
+import render_stats
+
+# stdin / stdout을 뜻하는 경로
+STREAM = '-'
+
+# 스트리밍 모드의 상태 JSON 출력 fd
+STATUS_FD = 3
+
+
+def read_payload(input_path: str, job: str = None) -> dict:
+    """입력 JSON 로드 ('-'면 stdin, gzip 자동 감지, job의 큰 배열은 원소 단위로 읽음)"""
+    return payload_io.load_payload(input_path, payload_io.JOB_STREAMED_ARRAYS.get(job))
+
+
+def status_stream():
+    """스트리밍 모드의 상태 출력 스트림 (fd 3이 열려 있으면 fd 3, 아니면 stderr)"""
+    try:
+        os.fstat(STATUS_FD)
+    except OSError:
+        return sys.stderr
+    return open(STATUS_FD, 'w', encoding='utf-8', closefd=False)
+
+
+def emit_status(stream, result: dict):
+    """상태 JSON 한 줄 출력"""
+    stream.write(json.dumps(result, ensure_ascii=False) + '\n')
+    stream.flush()
+
+
+def render_to_stdout(render, data: dict) -> int:
+    """render(data, 버퍼)로 PDF를 메모리에 만든 뒤 stdout으로 내보내고 바이트 수 반환"""
+    buffer = io.BytesIO()
+    with contextlib.redirect_stdout(sys.stderr):
+        render(data, buffer)
+
+    payload = buffer.getvalue()
+    sys.stdout.flush()
+    sys.stdout.buffer.write(payload)
+    sys.stdout.buffer.flush()
+    return len(payload)
+
+
+def run_cli(input_path: str, output_path: str, render, job: str = None):
+    """CLI 공통 처리: payload 로드 -> render(data, output) -> 상태 JSON 출력 (실패 시 종료 코드 1)
+
+    render는 (data, output_path 또는 쓰기 가능한 버퍼)를 받아 PDF를 생성하는 함수.
+    job: 작업 종류 (payload_io.JOB_STREAMED_ARRAYS에 있으면 해당 배열을 원소 단위로 읽음)
+    성공 결과의 "stats"에 단계별 시간과 문서 통계(render_stats)를 싣는다.
+    """
+    streaming = output_path == STREAM
+    status = status_stream() if streaming else sys.stdout
+
+    with render_stats.collect() as stats:
+        try:
+            with render_stats.stage('load'):
+                data = read_payload(input_path, job)
+        except Exception as e:
+            emit_status(status, {
+                'success': False,
+                'error': f"Error loading JSON: {str(e)}"
+            })
+            sys.exit(1)
+
+        try:
+            if streaming:
+                result = {'success': True, 'bytes': render_to_stdout(render, data)}
+            else:
+                result = {'success': True, 'path': render(data, output_path)}
+        except Exception as e:
+            emit_status(status, {
+                'success': False,
+                'error': str(e)
+            })
+            sys.exit(1)
+
+    result['stats'] = stats.as_dict()
+    emit_status(status, result)
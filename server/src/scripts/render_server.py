@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Report Render Server (fork-server)
+부모 프로세스가 모듈 import, 폰트 등록, 스타일시트 생성, matplotlib 폰트 캐시 준비를
+한 번 수행한 뒤 자식 프로세스 풀을 fork한다. 자식은 copy-on-write로 준비된 상태를 공유하며
+Unix 소켓으로 들어오는 작업을 처리한다.
+
+프로토콜: 연결당 요청 하나. 요청 JSON 한 줄을 보내면 결과 JSON 한 줄을 받고 연결이 닫힌다
+("output": "-" 요청은 결과 줄 뒤에 PDF 바이트가 이어진다).
+요청/결과 형식은 render_worker.py와 동일하다.
+
+자식은 max_jobs 건을 처리하거나 RSS가 max_rss_mb를 넘으면 종료되고, 부모가 새 자식으로 교체한다.
+
+Usage:
+    python render_server.py <socket_path> [--workers N] [--max-jobs N] [--max-rss-mb N]
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import os
+import signal
+import socket
+import sys
+
+import render_stats
+import render_worker
+
+
+def prime_matplotlib():
+    """matplotlib 폰트 캐시와 Agg 렌더러를 미리 준비"""
+    from matplotlib import font_manager
+    import generate_report_charts
+
+    with contextlib.redirect_stdout(sys.stderr):
+        for family in generate_report_charts.matplotlib.rcParams['font.family']:
+            font_manager.findfont(family)
+
+        fig = generate_report_charts.new_figure((1, 1), {})
+        ax = fig.add_subplot()
+        ax.plot([0, 1], [0, 1])
+        ax.set_title('warm up')
+        generate_report_charts.encode_figure(fig)
+
+
+# =============================================================================
+# 자식 프로세스
+# =============================================================================
+
+def handle_connection(conn: socket.socket):
+    """연결 하나에서 요청 하나를 처리"""
+    with conn, conn.makefile('r', encoding='utf-8') as reader, conn.makefile('wb') as writer:
+        line = reader.readline()
+        if not line.strip():
+            return
+
+        try:
+            request = render_worker.decode_request(line)
+        except Exception as e:
+            result = {'id': None, 'success': False, 'error': f"Invalid request: {e}"}
+        else:
+            result = render_worker.run_job(request)
+
+        render_worker.write_result(writer, result)
+
+
+def child_loop(listener: socket.socket, max_jobs: int, max_rss: int):
+    """자식 프로세스: 재활용 한도에 도달할 때까지 작업 처리"""
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    jobs = 0
+    while True:
+        conn, _ = listener.accept()
+        try:
+            handle_connection(conn)
+        except OSError as e:
+            print(f"Connection error: {e}", file=sys.stderr)
+
+        jobs += 1
+        if max_jobs and jobs >= max_jobs:
+            return
+        if max_rss and render_stats.current_rss() >= max_rss:
+            print(f"Worker {os.getpid()} recycled at RSS {render_stats.current_rss() // (1024 * 1024)}MB",
+                  file=sys.stderr)
+            return
+
+
+def spawn_child(listener: socket.socket, max_jobs: int, max_rss: int) -> int:
+    """자식 프로세스 fork (부모에는 pid 반환)"""
+    pid = os.fork()
+    if pid:
+        return pid
+
+    code = 0
+    try:
+        child_loop(listener, max_jobs, max_rss)
+    except Exception:
+        code = 1
+    finally:
+        os._exit(code)
+
+
+# =============================================================================
+# 부모 프로세스
+# =============================================================================
+
+def serve(socket_path: str, workers: int, max_jobs: int, max_rss_mb: int):
+    """소켓을 열고 자식 풀을 유지"""
+    render_worker.warm_up()
+    prime_matplotlib()
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen(max(workers * 4, 16))
+
+    # fork 이후 GC가 공유 페이지를 건드려 복사가 일어나지 않도록 준비된 객체를 고정
+    gc.collect()
+    gc.freeze()
+
+    # 자식마다 요청을 동시에 처리하므로 요청 안의 차트 동시 렌더는 끈다 (환경 변수로 지정하면 우선)
+    if workers > 1:
+        os.environ.setdefault('GEO_CHART_WORKERS', '1')
+
+    max_rss = max_rss_mb * 1024 * 1024
+    children = set()
+
+    def stop(signum, frame):
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(workers):
+        children.add(spawn_child(listener, max_jobs, max_rss))
+
+    print(json.dumps({'ready': True, 'socket': socket_path, 'workers': workers}), flush=True)
+
+    try:
+        while True:
+            pid, status = os.wait()
+            children.discard(pid)
+            if os.waitstatus_to_exitcode(status) != 0:
+                print(f"Worker {pid} exited abnormally ({status})", file=sys.stderr)
+            children.add(spawn_child(listener, max_jobs, max_rss))
+    finally:
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        for pid in children:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+        for pid in children:
+            with contextlib.suppress(ChildProcessError):
+                os.waitpid(pid, 0)
+        listener.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(socket_path)
+
+
+# =============================================================================
+# 클라이언트
+# =============================================================================
+
+def send_request(socket_path: str, request: dict, timeout: float = None) -> dict:
+    """렌더 서버에 요청 하나를 보내고 결과를 반환
+
+    스트리밍 결과("output": "-")는 결과 줄 뒤의 PDF 바이트를 정확히 result["bytes"]만큼 읽어 result["pdf"]에 담는다.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        with sock.makefile('w', encoding='utf-8') as writer:
+            writer.write(json.dumps(request, ensure_ascii=False) + '\n')
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile('rb') as reader:
+            line = reader.readline()
+            if not line:
+                return {'id': request.get('id'), 'success': False, 'error': "Empty response from render server"}
+
+            result = json.loads(line)
+            if result.get('success') and result.get('bytes') is not None:
+                payload = reader.read(result['bytes'])
+                if len(payload) != result['bytes']:
+                    return {'id': result.get('id'), 'success': False,
+                            'error': f"Truncated PDF from render server ({len(payload)}/{result['bytes']} bytes)"}
+                result['pdf'] = payload
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GEO report fork-server render pool')
+    parser.add_argument('socket_path')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--max-jobs', type=int, default=200,
+                        help='자식 하나가 처리할 최대 작업 수 (0 = 무제한)')
+    parser.add_argument('--max-rss-mb', type=int, default=768,
+                        help='자식 재활용 RSS 한도 MB (0 = 무제한)')
+    args = parser.parse_args()
+
+    if not hasattr(os, 'fork'):
+        print(json.dumps({'success': False, 'error': 'fork-server mode requires a POSIX platform'}))
+        sys.exit(1)
+
+    serve(args.socket_path, max(args.workers, 1), args.max_jobs, args.max_rss_mb)
+
+
+if __name__ == '__main__':
+    main()
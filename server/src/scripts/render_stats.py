@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+"""
+Render Stats
+렌더 작업 하나의 단계별 소요 시간과 문서 통계를 모아 결과 JSON의 "stats"에 싣는다.
+
+단계 (stages, 처음 실행된 순서):
+    load            payload 로드 (CLI)
+    fonts           한글 폰트 등록
+    styles          스타일시트 조회/생성
+    charts          차트 렌더링 전체 (캐시 조회 포함)
+    chart.<이름>    차트 하나의 렌더 시간
+    create_*        섹션 빌더 (analyze_pages 등 섹션이 쓰는 집계 포함), flowables = 만든 Flowable 수
+    build           doc.build() (레이아웃 + 그리기 + 저장)
+
+- 단계 시간은 자기 시간(exclusive)이다. 안쪽 단계의 시간은 바깥 단계에서 빠지므로 합이 전체 시간과 맞는다.
+  섹션은 doc.build()가 배치하면서 차례로 만들기 때문에 build에는 섹션 빌더 시간이 들어가지 않는다.
+- 차트를 프로세스 풀에서 병렬로 그리면 chart.* 시간의 합이 charts 경과 시간보다 클 수 있다 (이때 charts 자기 시간은 0).
+- 문서 통계: pages (PDF 페이지 수), bytes (출력 크기), flowables (배치한 Flowable 수)
+- collect() 밖에서는 계측 함수가 원래 함수를 바로 호출하므로 평소 비용은 ContextVar 조회 한 번이다.
+
+메모리 계측 (선택, GEO_RENDER_MEMORY=1 또는 collect(memory=True)):
+    tracemalloc을 켜고 단계마다 "memory"를 기록한다 (MB).
+        rssBeforeMb / rssAfterMb    처음 시작 직전 / 마지막 종료 직후 프로세스 RSS
+        rssGrowthMb                 호출 한 번 동안 늘어난 RSS의 최대값 (종료 직후 - 시작 직전, 안쪽 단계 포함)
+                                    상주 워커에서도 이전 작업의 최대 RSS와 무관하게 이 단계가 늘린 양을 보여준다.
+        pyBeforeMb / pyAfterMb      tracemalloc 현재 할당량
+        pyPeakMb                    단계 실행 중 tracemalloc 최대 할당량 (안쪽 단계 포함)
+    문서 전체는 stats["memory"] (시작/끝 RSS와 그 차이, Python 최대 할당량).
+        processRssPeakMb는 프로세스가 시작된 뒤의 최대 RSS(getrusage)로, 상주 워커에서는 이전 작업의 값일 수 있다.
+    차트는 할당을 단계에 귀속시키기 위해 프로세스 풀 없이 현재 프로세스에서 그린다.
+    GEO_RENDER_MEMORY_TOP=N: 자기 시간이 가장 긴 단계 호출 하나의 시작-끝 사이에 늘어난 할당 위치 상위 N개를
+    stats["topAllocations"]에 싣는다. 단계마다 tracemalloc 스냅샷을 찍으므로 렌더가 몇 배 느려지고
+    스냅샷 자체가 Python 할당량에 포함된다 (최대 할당량 측정과는 따로 실행).
+
+Usage:
+    with render_stats.collect() as stats:
+        generate_pdf(data, output_path)
+    result['stats'] = stats.as_dict()
+"""
+
+import contextlib
+import functools
+import inspect
+import linecache
+import os
+import sys
+import time
+import tracemalloc
+from contextvars import ContextVar
+
+# 현재 작업의 수집기 (collect() 밖이면 None)
+_current = ContextVar('render_stats', default=None)
+
+MB = 1024 * 1024
+
+
+def memory_settings() -> tuple:
+    """(메모리 계측 여부, 할당 위치 상위 개수) (GEO_RENDER_MEMORY, GEO_RENDER_MEMORY_TOP)"""
+    try:
+        top = max(int(os.environ.get('GEO_RENDER_MEMORY_TOP', 0)), 0)
+    except ValueError:
+        top = 0
+    enabled = os.environ.get('GEO_RENDER_MEMORY', '').lower() in ('1', 'true', 'yes')
+    return enabled or top > 0, top
+
+
+def peak_rss() -> int:
+    """프로세스 최대 RSS (bytes, getrusage는 Linux KB / macOS bytes)"""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def current_rss(pid='self') -> int:
+    """프로세스의 RSS (bytes, 기본: 현재 프로세스)"""
+    try:
+        with open(f'/proc/{pid}/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+
+    if pid != 'self':
+        # /proc이 없는 환경 (macOS): ps로 조회 (KB), 종료된 프로세스는 0
+        import subprocess
+        proc = subprocess.run(['ps', '-o', 'rss=', '-p', str(pid)], capture_output=True, text=True)
+        return int(proc.stdout.strip() or 0) * 1024
+
+    # /proc이 없는 환경: 최대 RSS로 대체
+    return peak_rss()
+
+
+class MemoryTracker:
+    """단계별 RSS / tracemalloc 기록 (메모리 계측 모드)"""
+
+    def __init__(self, top: int = 0):
+        self.top = top
+        self.started_tracing = not tracemalloc.is_tracing()
+        if self.started_tracing:
+            tracemalloc.start()
+        # 진행 중인 단계마다 {'peak': 최대 할당량, 'snapshot': 시작 스냅샷}
+        self.frames = []
+        self.peak = 0
+        # 자기 시간이 가장 긴 단계 호출 (이름, ms, 시작 스냅샷, 끝 스냅샷)
+        self.slowest = None
+        self.summary = {'rssStartMb': current_rss() / MB}
+        self.allocations = None
+
+    def fold_peak(self) -> int:
+        """지금까지의 tracemalloc 최대값을 진행 중인 단계들에 반영하고 초기화 (현재 할당량 반환)"""
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak = max(self.peak, peak)
+        for frame in self.frames:
+            frame['peak'] = max(frame['peak'], peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def enter(self, stage: dict):
+        """단계 시작 직전 상태 기록"""
+        snapshot = tracemalloc.take_snapshot() if self.top else None
+        current = self.fold_peak()
+        rss = current_rss()
+        if stage.get('memory') is None:
+            stage['memory'] = {'rssBeforeMb': rss / MB, 'rssGrowthMb': None, 'pyBeforeMb': current / MB, 'pyPeakMb': 0.0}
+        self.frames.append({'peak': current, 'rss': rss, 'snapshot': snapshot})
+
+    def exit(self, name: str, stage: dict, ms: float):
+        """단계 종료 직후 상태 기록 (ms: 이번 호출의 자기 시간)"""
+        current = self.fold_peak()
+        frame = self.frames.pop()
+        memory = stage['memory']
+        rss = current_rss()
+        growth = (rss - frame['rss']) / MB
+        memory.update({
+            'rssAfterMb': rss / MB,
+            'rssGrowthMb': growth if memory['rssGrowthMb'] is None else max(memory['rssGrowthMb'], growth),
+            'pyAfterMb': current / MB,
+            'pyPeakMb': max(memory['pyPeakMb'], frame['peak'] / MB),
+        })
+        if self.top and (self.slowest is None or ms > self.slowest[1]):
+            self.slowest = (name, ms, frame['snapshot'], tracemalloc.take_snapshot())
+
+    def finish(self):
+        """수집 종료: 문서 전체 요약, 가장 느린 단계의 할당 위치 계산, tracemalloc 정리"""
+        self.fold_peak()
+        rss = current_rss()
+        self.summary.update({
+            'rssEndMb': rss / MB,
+            'rssGrowthMb': rss / MB - self.summary['rssStartMb'],
+            # 프로세스 전체 기준 (getrusage의 최대값은 늦게 갱신될 수 있으므로 현재 RSS와 비교)
+            'processRssPeakMb': max(peak_rss(), rss) / MB,
+            'pyPeakMb': self.peak / MB,
+        })
+        if self.slowest is not None:
+            name, ms, before, after = self.slowest
+            self.allocations = {'stage': name, 'ms': round(ms, 2), 'sites': top_sites(before, after, self.top)}
+            self.slowest = None
+        if self.started_tracing:
+            tracemalloc.stop()
+
+    def as_dict(self) -> dict:
+        return {key: round(value, 2) for key, value in self.summary.items()}
+
+
+def top_sites(before, after, limit: int) -> list:
+    """두 스냅샷 사이에 늘어난 할당 위치 상위 limit개 (tracemalloc/이 모듈 자신의 할당 제외)"""
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    differences = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), 'lineno')
+    sites = []
+    for difference in sorted(differences, key=lambda item: item.size_diff, reverse=True)[:limit]:
+        if difference.size_diff <= 0:
+            break
+        frame = difference.traceback[0]
+        sites.append({
+            'site': f'{frame.filename}:{frame.lineno}',
+            'code': linecache.getline(frame.filename, frame.lineno).strip(),
+            'sizeKb': round(difference.size_diff / 1024, 1),
+            'count': difference.count_diff,
+        })
+    return sites
+
+
+class RenderStats:
+    """작업 하나의 단계별 시간 + 문서 통계"""
+
+    def __init__(self, memory: bool = False, top: int = 0):
+        self.started = time.perf_counter()
+        self.stages = {}
+        # 진행 중인 단계마다 안쪽 단계에 쓴 시간 (ms)
+        self.nested = []
+        self.document = {}
+        self.memory = MemoryTracker(top) if memory else None
+
+    def enter(self, name: str) -> float:
+        """단계 시작 (시작 시각 반환, 단계 순서는 처음 시작한 순서)"""
+        stage = self.stages.setdefault(name, {'ms': 0.0, 'calls': 0})
+        if self.memory is not None:
+            self.memory.enter(stage)
+        self.nested.append(0.0)
+        return time.perf_counter()
+
+    def exit(self, name: str, started: float, flowables: int = None, calls: int = 1):
+        """단계 종료: 안쪽 단계 시간을 뺀 자기 시간을 기록하고 바깥 단계에 경과 시간을 알린다"""
+        elapsed = (time.perf_counter() - started) * 1000
+        own = max(elapsed - self.nested.pop(), 0.0)
+        self.add(name, own, flowables, calls)
+        if self.memory is not None:
+            self.memory.exit(name, self.stages[name], own)
+        if self.nested:
+            self.nested[-1] += elapsed
+
+    def add(self, name: str, ms: float, flowables: int = None, calls: int = 1):
+        """단계 시간 누적"""
+        stage = self.stages.setdefault(name, {'ms': 0.0, 'calls': 0})
+        stage['ms'] += ms
+        stage['calls'] += calls
+        if flowables is not None:
+            stage['flowables'] = stage.get('flowables', 0) + flowables
+
+    def iterate(self, name: str, generator):
+        """생성기 섹션: 원소를 하나 만들 때마다 그 시간을 단계에 누적"""
+        while True:
+            started = self.enter(name)
+            try:
+                item = next(generator)
+            except StopIteration:
+                self.exit(name, started, calls=0)
+                return
+            except BaseException:
+                self.exit(name, started, calls=0)
+                raise
+            self.exit(name, started, flowables=1, calls=0)
+            yield item
+
+    def as_dict(self) -> dict:
+        """결과 JSON용 요약 (ms, MB는 소수 둘째 자리)"""
+        stages = {}
+        for name, stage in self.stages.items():
+            memory = stage.get('memory')
+            stages[name] = {key: value for key, value in stage.items() if key != 'memory'}
+            stages[name]['ms'] = round(stage['ms'], 2)
+            if memory is not None:
+                stages[name]['memory'] = {key: round(value, 2) for key, value in memory.items()}
+
+        result = {
+            'totalMs': round((time.perf_counter() - self.started) * 1000, 2),
+            'stages': stages,
+            **self.document,
+        }
+        if self.memory is not None:
+            result['memory'] = self.memory.as_dict()
+            if self.memory.allocations is not None:
+                result['topAllocations'] = self.memory.allocations
+        return result
+
+
+@contextlib.contextmanager
+def collect(memory: bool = None, top: int = None):
+    """이 블록 안의 렌더 작업 통계 수집 (memory/top 생략 시 GEO_RENDER_MEMORY, GEO_RENDER_MEMORY_TOP)"""
+    env_memory, env_top = memory_settings()
+    top = env_top if top is None else top
+    memory = (env_memory if memory is None else memory) or top > 0
+
+    stats = RenderStats(memory, top)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+        if stats.memory is not None:
+            stats.memory.finish()
+
+
+def tracing_memory() -> bool:
+    """현재 작업이 메모리 계측 모드인지"""
+    stats = _current.get()
+    return stats is not None and stats.memory is not None
+
+
+@contextlib.contextmanager
+def stage(name: str):
+    """블록 하나를 단계로 계측"""
+    stats = _current.get()
+    if stats is None:
+        yield
+        return
+
+    started = stats.enter(name)
+    try:
+        yield
+    finally:
+        stats.exit(name, started)
+
+
+def timed(name: str = None):
+    """함수를 단계로 계측하는 데코레이터 (이름 생략 시 함수 이름)
+
+    list를 반환하면 그 길이를, 생성기를 반환하면 원소마다 걸린 시간과 개수를 기록한다.
+    """
+    def decorate(func):
+        stage_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            stats = _current.get()
+            if stats is None:
+                return func(*args, **kwargs)
+
+            started = stats.enter(stage_name)
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                stats.exit(stage_name, started)
+                raise
+
+            if inspect.isgenerator(result):
+                stats.exit(stage_name, started, flowables=0)
+                return stats.iterate(stage_name, result)
+            stats.exit(stage_name, started, len(result) if isinstance(result, list) else None)
+            return result
+
+        return wrapper
+
+    return decorate
+
+
+def record(name: str, ms: float):
+    """다른 곳(프로세스 풀 작업자 등)에서 잰 시간을 현재 단계 안의 단계로 기록"""
+    stats = _current.get()
+    if stats is None:
+        return
+    stats.add(name, ms)
+    if stats.nested:
+        stats.nested[-1] += ms
+
+
+def output_size(output) -> int:
+    """출력 경로 또는 버퍼의 크기 (알 수 없으면 None)"""
+    if isinstance(output, (str, os.PathLike)):
+        return os.path.getsize(output)
+    if hasattr(output, 'getbuffer'):
+        return output.getbuffer().nbytes
+    if hasattr(output, 'tell'):
+        return output.tell()
+    return None
+
+
+def record_document(doc, flowables: int = None):
+    """빌드가 끝난 문서의 페이지 수, 출력 크기, Flowable 수 기록"""
+    stats = _current.get()
+    if stats is None:
+        return
+    stats.document.update({
+        'pages': doc.page,
+        'bytes': output_size(doc.filename),
+        'flowables': flowables,
+    })
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+Report Render Worker
+상주 프로세스로 동작하며 JSON-lines 프로토콜로 렌더 요청을 처리한다.
+stdin 한 줄 = 요청 하나, stdout 한 줄 = 결과 하나.
+시작 준비(warm_up)가 끝나면 {"id": null, "ready": true} 한 줄을 먼저 보낸다 (호출 측은 이때부터 작업 시간을 잰다).
+모듈 import, 폰트 등록, 스타일시트를 작업 간에 재사용하여 콜드 스타트를 제거한다.
+생성 모듈은 처음 필요할 때 import하며, 기본적으로 시작 시 warm_up()으로 미리 준비한다.
+--lazy 옵션을 주면 미리 준비하지 않고 바로 요청을 받는다 (재시작/재활용 시간 단축).
+
+요청 형식:
+    {"id": "1", "job": "report", "data": {...}, "output": "/tmp/report.pdf"}
+    "output": "-" 이면 파일을 쓰지 않고 PDF 바이트를 결과 줄 바로 뒤에 보낸다 (report_charts 제외).
+    선택 필드:
+        "renderedAt": "2026-01-05T09:00:00Z"  문서에 찍을 렌더 시각 (data.renderedAt보다 우선, 결정적 모드,
+                                               PDF 캐시 키에 그대로 포함)
+        "cache": false                         PDF 캐시 사용 안 함
+        "memory": true | N                     메모리 계측 모드 (N이면 가장 느린 단계의 할당 위치 상위 N개,
+                                               생략 시 GEO_RENDER_MEMORY / GEO_RENDER_MEMORY_TOP)
+
+결과 형식:
+    {"id": "1", "success": true, "path": "/tmp/report.pdf"}
+    {"id": "1", "success": true, "path": "/tmp/report.pdf", "cached": true}   (render_cache 적중)
+    차트를 그리는 작업(report, report_charts)은 "chartCache"에 작업 단위 차트 캐시 적중률을 담는다.
+    렌더한 작업은 "stats"에 단계별 시간(ms)과 페이지 수/출력 크기/Flowable 수를 담는다 (render_stats.py).
+        {"stats": {"totalMs": 812.4, "stages": {"fonts": {"ms": 3.1, "calls": 1}, ...,
+                   "build": {"ms": 402.7, "calls": 1}}, "pages": 5, "bytes": 48211, "flowables": 64}}
+    메모리 계측 모드면 단계마다 "memory"(RSS / tracemalloc 전후, 최대값)와 문서 전체 "memory"가 추가된다.
+    {"id": "1", "success": false, "error": "..."}
+    스트리밍 결과: {"id": "1", "success": true, "bytes": 12345} 줄 다음에 PDF 바이트가 정확히 12345바이트 이어진다.
+"""
+
+import contextlib
+import importlib
+import io
+import json
+import sys
+import traceback
+
+
+# =============================================================================
+# 작업 핸들러
+# =============================================================================
+
+def run_report_charts(request: dict) -> dict:
+    """리포트 차트 생성 (output = 차트 디렉토리)"""
+    import generate_report_charts
+    since = generate_report_charts.CHART_CACHE.snapshot()
+    charts = generate_report_charts.generate_charts(request.get('data', {}), request['output'])
+    return {'charts': charts, 'chartCache': generate_report_charts.CHART_CACHE.stats(since)}
+
+
+def run_report_pdf(request: dict) -> dict:
+    """주간/월간 리포트 PDF 생성"""
+    import generate_pdf
+    path = generate_pdf.generate_pdf(
+        request.get('data', {}),
+        request.get('chartsDir', ''),
+        request['output'],
+    )
+    return {'path': path}
+
+
+def run_report(request: dict) -> dict:
+    """차트 + 리포트 PDF를 한 프로세스에서 생성 (차트는 메모리에서 바로 삽입)"""
+    import generate_report
+    data = request.get('data', {})
+    if generate_report.chart_backend(data) == 'vector':
+        return {'path': generate_report.generate_report(data, request['output'])}
+
+    import generate_report_charts
+    since = generate_report_charts.CHART_CACHE.snapshot()
+    path = generate_report.generate_report(data, request['output'])
+    return {'path': path, 'chartCache': generate_report_charts.CHART_CACHE.stats(since)}
+
+
+def run_geo_score_pdf(request: dict) -> dict:
+    """GEO Score 감사 PDF 생성"""
+    import generate_geo_score_pdf
+    path = generate_geo_score_pdf.generate_pdf(request.get('data', {}), request['output'])
+    return {'path': path}
+
+
+def run_insights_pdf(request: dict) -> dict:
+    """AI 인사이트 PDF 생성"""
+    import generate_insights_pdf
+    path = generate_insights_pdf.generate_pdf(request.get('data', {}), request['output'])
+    return {'path': path}
+
+
+# 출력 경로 대신 쓰면 PDF를 결과 줄 뒤에 바로 보내는 값
+STREAM_OUTPUT = '-'
+
+JOB_HANDLERS = {
+    'report_charts': run_report_charts,
+    'report_pdf': run_report_pdf,
+    'report': run_report,
+    'geo_score_pdf': run_geo_score_pdf,
+    'insights_pdf': run_insights_pdf,
+}
+
+
+def run_job(request: dict) -> dict:
+    """요청 하나를 처리하고 결과 dict를 반환 (예외는 결과로 변환)"""
+    result = {'id': request.get('id')}
+
+    job = request.get('job')
+    handler = JOB_HANDLERS.get(job)
+    if handler is None:
+        result.update({'success': False, 'error': f"Unknown job type: {job}"})
+        return result
+
+    if not request.get('output'):
+        result.update({'success': False, 'error': "Missing output target"})
+        return result
+
+    streaming = request['output'] == STREAM_OUTPUT
+    if streaming and job == 'report_charts':
+        result.update({'success': False, 'error': "report_charts does not support streamed output"})
+        return result
+
+    import render_cache
+    import render_stats
+
+    # 요청 단위 렌더 시각 지정 (payload의 renderedAt보다 우선)
+    if request.get('renderedAt'):
+        request = {**request, 'data': {**request.get('data', {}), 'renderedAt': request['renderedAt']}}
+
+    key = None
+    if request.get('cache', True) and render_cache.is_enabled():
+        try:
+            key = render_cache.cache_key(job, request.get('data', {}))
+            if key and streaming:
+                payload = render_cache.read(key)
+                if payload is not None:
+                    result.update({'success': True, 'bytes': len(payload), 'cached': True, 'pdf': payload})
+                    return result
+            elif key and render_cache.lookup(key, request['output']):
+                result.update({'success': True, 'path': request['output'], 'cached': True})
+                return result
+        except OSError as e:
+            print(f"PDF cache lookup skipped: {e}", file=sys.stderr)
+            key = None
+
+    # 스트리밍이면 파일 대신 메모리 버퍼에 렌더링
+    buffer = io.BytesIO() if streaming else None
+    if streaming:
+        request = {**request, 'output': buffer}
+
+    try:
+        # 요청 단위 메모리 계측 (true: RSS/tracemalloc, 정수 N: + 할당 위치 상위 N개)
+        memory = request.get('memory')
+        top = memory if isinstance(memory, int) and not isinstance(memory, bool) else None
+        # 생성 스크립트의 진행 로그가 프로토콜 스트림(stdout)을 오염시키지 않도록 분리
+        with contextlib.redirect_stdout(sys.stderr), \
+                render_stats.collect(bool(memory) if memory is not None else None, top) as stats:
+            result.update(handler(request))
+        result['success'] = True
+        result['stats'] = stats.as_dict()
+    except Exception as e:
+        traceback.print_exc(file=sys.stderr)
+        result.update({'success': False, 'error': str(e)})
+        return result
+
+    if streaming:
+        payload = buffer.getvalue()
+        result.pop('path', None)
+        result.update({'bytes': len(payload), 'pdf': payload})
+
+    if key:
+        try:
+            if streaming:
+                render_cache.write(key, payload)
+            else:
+                render_cache.store(key, request['output'])
+        except OSError as e:
+            print(f"PDF cache write skipped: {e}", file=sys.stderr)
+
+    return result
+
+
+def warm_up():
+    """생성 모듈 import, 폰트 등록, 스타일시트 생성을 미리 수행"""
+    # 이름을 쓰지 않고 import만 해 두는 모듈
+    for name in (
+        'generate_report',  # 리포트 파이프라인
+        'generate_report_charts',  # matplotlib 차트 백엔드
+        'pdf_charts',  # 벡터 차트 백엔드
+        'payload_io',  # 요청 디코딩 (orjson)
+    ):
+        importlib.import_module(name)
+
+    import generate_pdf
+    import generate_geo_score_pdf
+    import generate_insights_pdf
+
+    with contextlib.redirect_stdout(sys.stderr):
+        for module in (generate_pdf, generate_geo_score_pdf, generate_insights_pdf):
+            module.register_korean_fonts()
+            module.get_styles()
+
+
+# =============================================================================
+# 메인 루프
+# =============================================================================
+
+def decode_request(line: str) -> dict:
+    """요청 한 줄 디코딩 (orjson이 설치되어 있으면 사용)"""
+    import payload_io
+    request = payload_io.loads(line)
+    if not isinstance(request, dict):
+        raise ValueError("Request must be a JSON object")
+    return request
+
+
+def write_result(output_stream, result: dict):
+    """결과 한 줄 출력 (바이너리 스트림). 스트리밍 결과는 이어서 PDF 바이트를 그대로 쓴다"""
+    payload = result.pop('pdf', None)
+    output_stream.write((json.dumps(result, ensure_ascii=False) + '\n').encode('utf-8'))
+    if payload is not None:
+        output_stream.write(payload)
+    output_stream.flush()
+
+
+def serve(input_stream, output_stream):
+    """입력 스트림이 닫힐 때까지 요청을 한 줄씩 처리 (output_stream: 바이너리)"""
+    for line in input_stream:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = decode_request(line)
+        except Exception as e:
+            result = {'id': None, 'success': False, 'error': f"Invalid request: {e}"}
+        else:
+            result = run_job(request)
+
+        write_result(output_stream, result)
+
+
+def main():
+    input_stream = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8')
+
+    if '--lazy' not in sys.argv[1:]:
+        warm_up()
+    write_result(sys.stdout.buffer, {'id': None, 'ready': True})
+    serve(input_stream, sys.stdout.buffer)
+
+
+if __name__ == '__main__':
+    main()
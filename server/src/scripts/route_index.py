@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+GEO Score Route Index
+크롤한 페이지 목록을 한 번 순회하며 URL마다 한 번만 파싱하여 다단계 라우트 트리를 만든다.
+
+- 같은 순회에서 페이지를 열(column)로 채운다: 정규화된 경로, 점수 필드별 float32 배열,
+  깊이별 라우트 ID 배열 (페이지 dict는 보관하지 않고, 섹션마다 URL을 다시 파싱하지 않음)
+- 깊이 d의 그룹 = 경로의 앞 d개 세그먼트가 같은 페이지 (세그먼트가 d개보다 적으면 전체 경로)
+  깊이 1은 기존 라우트 그룹(/blog, /docs, ...)과 같다.
+- 그룹마다 페이지 수, scores.total 평균/최저, 카테고리별 평균을 누적 (rollup)
+- 깊이 d 그룹의 children = 그 그룹을 앞부분으로 갖는 깊이 d+1 그룹 (드릴다운)
+
+구축 비용은 페이지 수 x 최대 깊이에 비례한다.
+"""
+
+from array import array
+from urllib.parse import urlparse
+
+# 트리를 만드는 최대 깊이 (더 깊은 경로는 이 깊이의 그룹에 합산)
+DEFAULT_MAX_DEPTH = 3
+
+# rollup에서 평균을 내는 카테고리 점수
+SCORE_FIELDS = ('structure', 'schema', 'url', 'meta', 'content')
+
+
+def normalize_path(url: str) -> str:
+    """URL에서 라우트 경로 추출 (루트는 '/', 끝 슬래시 제거)"""
+    try:
+        path = urlparse(url).path
+    except ValueError:
+        return url
+    if not path or path == '/':
+        return '/'
+    return path.rstrip('/') or '/'
+
+
+# 페이지 점수 dict의 키 (카테고리 + total)
+PAGE_SCORE_KEYS = SCORE_FIELDS + ('total',)
+
+
+def compact_page(page):
+    """인덱스에 필요한 필드(url, scores)만 상수 키로 다시 만든 페이지 (큰 payload를 읽을 때 원소마다 적용)"""
+    if not isinstance(page, dict):
+        return page
+    scores = page.get('scores')
+    if isinstance(scores, dict):
+        scores = {key: scores[key] for key in PAGE_SCORE_KEYS if key in scores}
+    return {'url': page.get('url', ''), 'scores': scores or {}}
+
+
+def route_key(segments: tuple, depth: int) -> str:
+    """앞 depth개 세그먼트로 만든 그룹 키"""
+    if not segments:
+        return '/'
+    return '/' + '/'.join(segments[:depth])
+
+
+# =============================================================================
+# 라우트 그룹
+# =============================================================================
+
+class RouteGroup:
+    """라우트 트리의 노드 하나 (점수 rollup, 소속 페이지는 인덱스의 라우트 ID 열로 구분)"""
+
+    def __init__(self, route: str, depth: int, route_id: int = 0, parent=None):
+        self.route = route
+        self.depth = depth
+        self.route_id = route_id
+        self.parent = parent
+        self.children = {}
+
+        self.count = 0
+        self.total_sum = 0
+        self.total_min = None
+        self.category_sums = [0] * len(SCORE_FIELDS)
+
+    def add(self, total, categories: tuple):
+        """페이지 하나의 점수를 rollup에 더한다"""
+        self.count += 1
+        self.total_sum += total
+        if self.total_min is None or total < self.total_min:
+            self.total_min = total
+        for index, value in enumerate(categories):
+            self.category_sums[index] += value
+
+    @property
+    def mean_total(self) -> float:
+        return self.total_sum / self.count if self.count else 0.0
+
+    def category_means(self) -> dict:
+        """카테고리별 평균 점수"""
+        count = self.count or 1
+        return {field: total / count for field, total in zip(SCORE_FIELDS, self.category_sums)}
+
+    def rollup(self) -> dict:
+        """그룹 요약 (페이지 수, total 평균/최저, 카테고리 평균)"""
+        return {
+            'route': self.route,
+            'count': self.count,
+            'meanTotal': self.mean_total,
+            'minTotal': self.total_min or 0,
+            'categoryMeans': self.category_means(),
+        }
+
+
+# =============================================================================
+# 인덱스
+# =============================================================================
+
+class RouteIndex:
+    """페이지 목록의 다단계 라우트 인덱스 + 열 기반 페이지 데이터 (한 번 순회로 구축)
+
+    행 = 입력 순서의 페이지 하나:
+        paths[row]               정규화된 경로
+        columns[field][row]      점수 (PAGE_SCORE_KEYS, float32 array)
+        route_ids[depth-1][row]  깊이 depth 그룹의 라우트 ID (= levels[depth-1]의 삽입 순서)
+    """
+
+    def __init__(self, pages: list, max_depth: int = DEFAULT_MAX_DEPTH):
+        self.max_depth = max(max_depth, 1)
+        self.site = RouteGroup('/', 0)
+        self.levels = [{} for _ in range(self.max_depth)]
+
+        self.paths = []
+        self.columns = {field: array('f') for field in PAGE_SCORE_KEYS}
+        self.route_ids = [array('i') for _ in range(self.max_depth)]
+
+        for page in pages:
+            self.add(page)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def add(self, page: dict):
+        """페이지 하나를 파싱하여 열에 추가하고 사이트 전체와 깊이별 그룹 rollup 갱신"""
+        path = normalize_path(page.get('url', ''))
+        segments = tuple(path.strip('/').split('/')) if path != '/' else ()
+        scores = page.get('scores') or {}
+        total = scores.get('total', 0)
+        categories = tuple(scores.get(field, 0) for field in SCORE_FIELDS)
+
+        self.paths.append(path)
+        for field, value in zip(SCORE_FIELDS, categories):
+            self.columns[field].append(value)
+        self.columns['total'].append(total)
+
+        self.site.add(total, categories)
+        parent = self.site
+        for groups, route_ids in zip(self.levels, self.route_ids):
+            key = route_key(segments, parent.depth + 1)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = RouteGroup(key, parent.depth + 1, len(groups), parent)
+                parent.children[key] = group
+            group.add(total, categories)
+            route_ids.append(group.route_id)
+            parent = group
+
+    def groups(self, depth: int = 1) -> dict:
+        """깊이 depth의 그룹 (라우트 -> RouteGroup, 처음 나온 순서)"""
+        if not 1 <= depth <= self.max_depth:
+            raise ValueError(f"Route depth must be between 1 and {self.max_depth}: {depth}")
+        return self.levels[depth - 1]
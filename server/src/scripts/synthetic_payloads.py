@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""
+Synthetic Report Payloads
+벤치마크/부하 테스트용 합성 payload 생성기. 같은 (종류, 크기)는 항상 같은 payload를 만든다.
+
+종류:
+    report      ReportData (주간/월간 리포트, generate_report / generate_pdf)
+    charts      리포트 차트 데이터 (generate_report_charts 입력, report에서 build_chart_data로 구성)
+    geo_score   GeoScoreData (pages, categories.items, recommendations 크기 조절)
+    insights    InsightsData (키워드, 카테고리 인사이트, 액션, 콘텐츠 갭 크기 조절)
+
+크기: small / medium / large / huge (SIZE_PROFILES 참고)
+
+Usage:
+    python synthetic_payloads.py <kind> <size> [output_json|-]
+"""
+
+import json
+import random
+import sys
+
+from chart_data import build_chart_data
+
+SIZES = ('small', 'medium', 'large', 'huge')
+
+# 크기별 배열 길이 / 텍스트 길이
+# 2단 레이아웃의 오른쪽 셀은 페이지를 넘겨 나뉘지 않으므로 huge도 한 페이지에 들어가는 범위에서 정한다
+# (리포트 AI 요약/경쟁사 분석 text는 약 2500자, GEO 카테고리 items는 카테고리당 20개까지).
+SIZE_PROFILES = {
+    'report': {
+        'small': {'engines': 2, 'queries': 3, 'trend': 4, 'categories': 1, 'actions': 2, 'text': 200},
+        'medium': {'engines': 4, 'queries': 20, 'trend': 12, 'categories': 6, 'actions': 7, 'text': 800},
+        'large': {'engines': 6, 'queries': 200, 'trend': 26, 'categories': 20, 'actions': 20, 'text': 1500},
+        'huge': {'engines': 8, 'queries': 2000, 'trend': 52, 'categories': 100, 'actions': 100, 'text': 2500},
+    },
+    'geo_score': {
+        'small': {'pages': 10, 'items': 3, 'recommendations': 3},
+        'medium': {'pages': 500, 'items': 6, 'recommendations': 10},
+        'large': {'pages': 10000, 'items': 12, 'recommendations': 50},
+        'huge': {'pages': 100000, 'items': 20, 'recommendations': 500},
+    },
+    'insights': {
+        'small': {'keywords': 3, 'categories': 2, 'patterns': 2, 'actions': 2, 'gaps': 2},
+        'medium': {'keywords': 10, 'categories': 8, 'patterns': 6, 'actions': 6, 'gaps': 6},
+        'large': {'keywords': 50, 'categories': 30, 'patterns': 20, 'actions': 20, 'gaps': 20},
+        'huge': {'keywords': 500, 'categories': 200, 'patterns': 100, 'actions': 100, 'gaps': 100},
+    },
+}
+
+# 모든 payload에 같은 렌더 시각을 넣어 출력 PDF가 결정적이 되게 한다
+RENDERED_AT = '2026-01-05T09:00:00Z'
+
+WORDS = (
+    '인용률', '브랜드', '검색', '최적화', '콘텐츠', '스키마', '경쟁사', '추천', '응답', '개선',
+    'AI', 'GEO', 'FAQ', 'schema', 'citation', 'ranking', 'engine', 'query', 'page', 'meta',
+)
+ENGINES = ('gpt', 'gemini', 'claude', 'perplexity', 'copilot', 'grok', 'mistral', 'llama')
+SCORE_CATEGORIES = {
+    'structure': 25,
+    'schema': 25,
+    'url': 15,
+    'meta': 20,
+    'content': 15,
+}
+ROUTES = ('blog', 'product', 'docs', 'news', 'help', 'shop', 'about', 'careers')
+PRIORITIES = ('high', 'medium', 'low')
+
+
+def text(rng: random.Random, length: int) -> str:
+    """length자 정도의 합성 문장"""
+    words = []
+    size = 0
+    while size < length:
+        word = rng.choice(WORDS)
+        words.append(word)
+        size += len(word) + 1
+    return ' '.join(words)
+
+
+def profile(kind: str, size: str) -> dict:
+    """종류/크기의 배열 길이 설정 (알 수 없는 크기면 ValueError)"""
+    if size not in SIZES:
+        raise ValueError(f"Unknown payload size: {size} (expected one of {', '.join(SIZES)})")
+    return SIZE_PROFILES[kind][size]
+
+
+# =============================================================================
+# payload 생성
+# =============================================================================
+
+def report_payload(size: str) -> dict:
+    """ReportData"""
+    counts = profile('report', size)
+    rng = random.Random(f'report/{size}')
+
+    def queries(count: int) -> list:
+        return [{'query': text(rng, 30), 'citationRate': rng.randint(0, 100)} for _ in range(count)]
+
+    return {
+        'title': '월간 AI 가시성 리포트',
+        'type': 'monthly' if counts['queries'] > 3 else 'weekly',
+        'period': '2026. 1. 3. ~ 2026. 2. 2.',
+        'generatedAt': '2026-02-02',
+        'renderedAt': RENDERED_AT,
+        'metrics': {
+            'citationRate': 37.5, 'citationRateChange': 4.5,
+            'shareOfVoice': 22.1, 'shareOfVoiceChange': -1.2,
+            'avgRank': 2.4, 'avgRankChange': 0.3,
+            'totalTests': counts['queries'] * 4, 'totalTestsChange': counts['queries'],
+        },
+        'enginePerformance': [
+            {
+                'engine': ENGINES[index % len(ENGINES)],
+                'citationRate': rng.randint(0, 100),
+                'avgRank': rng.randint(1, 10),
+                'totalTests': counts['queries'],
+                'citations': rng.randint(0, counts['queries']),
+                'change': rng.randint(-20, 20),
+            }
+            for index in range(counts['engines'])
+        ],
+        'highlights': [text(rng, 40) for _ in range(counts['actions'])],
+        'topQueries': queries(counts['queries']),
+        'worstQueries': queries(counts['queries']),
+        'trend': {
+            'dates': [f'{index + 1}주차' for index in range(counts['trend'])],
+            'citationRates': [rng.randint(0, 100) for _ in range(counts['trend'])],
+        },
+        'aiAnalysis': {
+            'summary': text(rng, counts['text']),
+            'categoryAnalysis': [
+                {'category': text(rng, 6), 'insight': text(rng, 120), 'citationRate': rng.randint(0, 100)}
+                for _ in range(counts['categories'])
+            ],
+            'competitorAnalysis': text(rng, counts['text']),
+            'actionItems': [text(rng, 80) for _ in range(counts['actions'])],
+            'highlights': [text(rng, 60) for _ in range(counts['actions'])],
+        },
+    }
+
+
+def charts_payload(size: str) -> dict:
+    """리포트 차트 데이터 (generate_report_charts 입력)"""
+    return build_chart_data(report_payload(size))
+
+
+def geo_score_payload(size: str) -> dict:
+    """GeoScoreData"""
+    counts = profile('geo_score', size)
+    rng = random.Random(f'geo_score/{size}')
+
+    categories = {}
+    for name, max_score in SCORE_CATEGORIES.items():
+        items = []
+        for index in range(counts['items']):
+            item_max = rng.randint(3, 10)
+            item_score = rng.randint(0, item_max)
+            items.append({
+                'name': f'{name} {index + 1}',
+                'passed': item_score == item_max,
+                'score': item_score,
+                'maxScore': item_max,
+                'detail': text(rng, 60),
+            })
+        score = rng.randint(0, max_score)
+        categories[name] = {
+            'score': score,
+            'maxScore': max_score,
+            'percentage': round(score * 100 / max_score),
+            'items': items,
+        }
+
+    pages = []
+    for index in range(counts['pages']):
+        scores = {name: rng.randint(0, max_score) for name, max_score in SCORE_CATEGORIES.items()}
+        scores['total'] = sum(scores.values())
+        pages.append({
+            'url': f'https://example.com/{ROUTES[index % len(ROUTES)]}/item-{index}/detail',
+            'title': f'Item {index}',
+            'scores': scores,
+        })
+
+    total_score = sum(category['score'] for category in categories.values())
+    return {
+        'url': 'https://example.com/',
+        'analyzedAt': '2026-01-05T08:00:00Z',
+        'renderedAt': RENDERED_AT,
+        'totalScore': total_score,
+        'grade': 'A' if total_score >= 90 else 'B' if total_score >= 80 else 'C' if total_score >= 70 else 'D',
+        'categories': categories,
+        'pages': pages,
+        'recommendations': [
+            {
+                'priority': PRIORITIES[index % len(PRIORITIES)],
+                'category': rng.choice(tuple(SCORE_CATEGORIES)),
+                'issue': text(rng, 50),
+                'suggestion': text(rng, 120),
+                'impact': text(rng, 30),
+            }
+            for index in range(counts['recommendations'])
+        ],
+    }
+
+
+def insights_payload(size: str) -> dict:
+    """InsightsData"""
+    counts = profile('insights', size)
+    rng = random.Random(f'insights/{size}')
+
+    category_names = [f'카테고리 {index + 1}' for index in range(counts['categories'])]
+    return {
+        'id': f'synthetic-{size}',
+        'brandId': 'synthetic',
+        'brandName': '합성 브랜드',
+        'renderedAt': RENDERED_AT,
+        'commonKeywords': [
+            {
+                'keyword': text(rng, 8),
+                'count': rng.randint(1, 50),
+                'importance': PRIORITIES[index % len(PRIORITIES)],
+                'description': text(rng, 80),
+            }
+            for index in range(counts['keywords'])
+        ],
+        'categoryInsights': [
+            {'category': name, 'keyFactors': [text(rng, 12) for _ in range(3)], 'recommendation': text(rng, 100)}
+            for name in category_names
+        ],
+        'citationPatterns': {
+            'citedPatterns': [text(rng, 40) for _ in range(counts['patterns'])],
+            'uncitedPatterns': [text(rng, 40) for _ in range(counts['patterns'])],
+        },
+        'actionableInsights': [
+            {
+                'title': text(rng, 20),
+                'description': text(rng, 100),
+                'priority': PRIORITIES[index % len(PRIORITIES)],
+                'actionItems': [text(rng, 30) for _ in range(3)],
+            }
+            for index in range(counts['actions'])
+        ],
+        'contentGaps': [
+            {'area': text(rng, 10), 'currentState': text(rng, 40), 'recommendation': text(rng, 80)}
+            for _ in range(counts['gaps'])
+        ],
+        'metadata': {
+            'analyzedAt': '2026-01-05T08:00:00Z',
+            'totalResponses': counts['keywords'] * 10,
+            'citedResponses': counts['keywords'] * 3,
+            'categories': category_names,
+        },
+    }
+
+
+PAYLOADS = {
+    'report': report_payload,
+    'charts': charts_payload,
+    'geo_score': geo_score_payload,
+    'insights': insights_payload,
+}
+
+
+def build(kind: str, size: str) -> dict:
+    """종류/크기의 합성 payload (알 수 없는 종류면 ValueError)"""
+    builder = PAYLOADS.get(kind)
+    if builder is None:
+        raise ValueError(f"Unknown payload kind: {kind} (expected one of {', '.join(PAYLOADS)})")
+    return builder(size)
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: python synthetic_payloads.py <kind> <size> [output_json|-]")
+        sys.exit(1)
+
+    payload = build(sys.argv[1], sys.argv[2])
+    output_path = sys.argv[3] if len(sys.argv) > 3 else '-'
+    if output_path == '-':
+        json.dump(payload, sys.stdout, ensure_ascii=False)
+        sys.stdout.write('\n')
+        return
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Incremental Build Verification
+점진적 빌드(pdf_components의 FlowableStream + CompressingCanvas)가 일반 doc.build(list(...))와
+같은 PDF 바이트를 만드는지 확인한다.
+
+점진적 빌드는 ReportLab 내부 동작(BaseDocTemplate.build의 목록 순회, Canvas의 페이지 내용 스트림)에 의존하므로
+ReportLab을 올릴 때 이 스크립트로 확인한 뒤 pdf_components.INCREMENTAL_BUILD_REPORTLAB에 버전을 추가한다.
+
+합성 payload(synthetic_payloads.py)를 결정적 모드(renderedAt 고정)로 두 번씩 렌더한다:
+    GEO_PDF_INCREMENTAL_BUILD=1   점진적 빌드
+    GEO_PDF_INCREMENTAL_BUILD=0   일반 빌드
+기본 대상에는 페이지 1만 개 GEO 감사의 전체 페이지 목록(pageAnalysis=full, 약 170쪽)이 들어 있다.
+
+Usage:
+    python verify_incremental_build.py [--cases report_pdf/large,geo_score_pdf/large/full]
+
+출력이 다른 항목이 있으면 종료 코드 1을 반환한다.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import tempfile
+
+import reportlab
+
+import bench_generators
+import synthetic_payloads
+
+# 확인 항목: 대상/크기[/pageAnalysis]
+DEFAULT_CASES = (
+    'report_pdf/large',
+    'geo_score_pdf/large',
+    'geo_score_pdf/large/full',
+    'insights_pdf/huge',
+)
+
+RENDERED_AT = '2026-01-05T09:00:00Z'
+
+
+def render(run, output_path: str, incremental: bool) -> bytes:
+    """빌드 방식을 지정해 한 번 렌더하고 PDF 바이트 반환"""
+    os.environ['GEO_PDF_INCREMENTAL_BUILD'] = '1' if incremental else '0'
+    with contextlib.redirect_stdout(sys.stderr):
+        run()
+    with open(output_path, 'rb') as f:
+        return f.read()
+
+
+def verify_case(case: str, workdir: str) -> dict:
+    """항목 하나를 두 방식으로 렌더해 비교"""
+    target, size, *options = case.split('/')
+    data = synthetic_payloads.build(bench_generators.TARGETS[target], size)
+    data['renderedAt'] = RENDERED_AT
+    if options:
+        data['pageAnalysis'] = options[0]
+
+    with contextlib.redirect_stdout(sys.stderr):
+        run = bench_generators.prepare_target(target, data, workdir)
+    output_path = os.path.join(workdir, f'{target}.pdf')
+    incremental = render(run, output_path, True)
+    plain = render(run, output_path, False)
+    return {
+        'identical': incremental == plain,
+        'bytes': len(plain),
+        'pages': plain.count(b'/Type /Page\n'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Verify incremental PDF build output against plain doc.build()')
+    parser.add_argument('--cases', default=','.join(DEFAULT_CASES),
+                        help='쉼표로 구분한 대상/크기[/pageAnalysis] 목록')
+    args = parser.parse_args()
+
+    # 차트 캐시는 끄고 현재 프로세스에서 그린다 (두 빌드가 같은 차트 PNG를 쓰도록)
+    os.environ.setdefault('GEO_CHART_CACHE_MAX_MB', '0')
+    os.environ.setdefault('GEO_CHART_WORKERS', '1')
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for case in args.cases.split(','):
+            results[case] = result = verify_case(case, workdir)
+            status = 'OK' if result['identical'] else 'DIFFERENT'
+            print(f"{case:<28} {result['pages']:>5} pages {result['bytes']:>9} bytes  {status}")
+
+    mismatched = [case for case, result in results.items() if not result['identical']]
+    print(json.dumps({
+        'success': not mismatched,
+        'reportlab': reportlab.Version,
+        'mismatched': mismatched,
+        'results': results,
+    }))
+    sys.exit(1 if mismatched else 0)
+
+
+if __name__ == '__main__':
+    main()
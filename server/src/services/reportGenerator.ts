@@ -1,5 +1,5 @@
-import { spawn } from 'child_process';
-import fs from 'fs/promises';
+import { spawn, type ChildProcessWithoutNullStreams } from 'child_process';
+import os from 'os';
 import path from 'path';
 import { fileURLToPath } from 'url';
 
@@ -47,114 +47,350 @@ export interface ReportData {
     actionItems: string[];
     highlights: string[];
   } | null;
+  // 차트 백엔드: matplotlib(PNG, 기본값) 또는 vector(ReportLab 벡터, 더 빠르고 PDF가 작음)
+  chartBackend?: 'matplotlib' | 'vector';
 }
 
-async function runPythonScript(
-  scriptPath: string,
-  args: string[]
-): Promise<string> {
-  return new Promise((resolve, reject) => {
-    const python = spawn('python', [scriptPath, ...args], {
-      cwd: path.dirname(scriptPath),
+type RenderJobType = 'report' | 'report_charts' | 'report_pdf' | 'geo_score_pdf' | 'insights_pdf';
+
+interface RenderRequest {
+  job: RenderJobType;
+  data: unknown;
+  // 출력 PDF 경로, '-'이면 파일 없이 PDF 바이트를 결과 줄 뒤에 바로 받음
+  output: string;
+  chartsDir?: string;
+  // 문서에 찍을 렌더 시각 (지정하면 같은 입력이 같은 PDF 바이트를 만들고 render_cache에 캐시됨,
+  // 캐시 키에 그대로 들어가므로 같은 값으로 다시 요청하면 캐시된 PDF를 받음)
+  renderedAt?: string;
+  cache?: boolean;
+}
+
+// 렌더 통계 (render_stats.py): 단계별 자기 시간(ms)과 문서 통계
+// 메모리 계측 모드 (GEO_RENDER_MEMORY=1)에서만 포함, 단위 MB
+interface StageMemory {
+  rssBeforeMb: number;
+  rssAfterMb: number;
+  // 호출 한 번 동안 늘어난 RSS의 최대값
+  rssGrowthMb: number;
+  pyBeforeMb: number;
+  pyAfterMb: number;
+  pyPeakMb: number;
+}
+
+interface RenderStats {
+  totalMs: number;
+  stages: Record<string, { ms: number; calls: number; flowables?: number; memory?: StageMemory }>;
+  pages?: number;
+  bytes?: number;
+  flowables?: number;
+  // processRssPeakMb: 프로세스 시작 이후 최대 RSS (상주 워커에서는 이전 작업의 값일 수 있음)
+  memory?: { rssStartMb: number; rssEndMb: number; rssGrowthMb: number; processRssPeakMb: number; pyPeakMb: number };
+  // GEO_RENDER_MEMORY_TOP=N: 자기 시간이 가장 긴 단계 호출 동안 늘어난 할당 위치
+  topAllocations?: {
+    stage: string;
+    ms: number;
+    sites: { site: string; code: string; sizeKb: number; count: number }[];
+  };
+}
+
+interface RenderResult {
+  id: string;
+  success: boolean;
+  path?: string;
+  charts?: string[];
+  cached?: boolean;
+  // 렌더한 작업만 포함 (캐시 적중 시 없음)
+  stats?: RenderStats;
+  // 스트리밍 결과: 결과 줄 뒤에 이어지는 PDF 바이트 수와 그 내용
+  bytes?: number;
+  pdf?: Buffer;
+  error?: string;
+  // 워커 시작 준비(warm_up) 완료 알림 줄 (id 없음)
+  ready?: boolean;
+}
+
+interface PendingJob {
+  resolve: (result: RenderResult) => void;
+  reject: (error: Error) => void;
+}
+
+interface QueuedJob extends PendingJob {
+  request: RenderRequest;
+}
+
+// 렌더 워커 수 (RENDER_WORKERS, 기본: CPU 코어 수)
+const RENDER_WORKERS = Math.max(1, Number(process.env.RENDER_WORKERS) || os.cpus().length || 1);
+
+// 작업 하나의 최대 렌더 시간 (RENDER_JOB_TIMEOUT_MS, 기본 120초). 넘기면 그 워커를 종료하고 새로 띄운다.
+// 새 워커의 시작 준비(warm_up)는 작업 시간에 넣지 않고 같은 한도로 따로 잰다.
+const RENDER_JOB_TIMEOUT_MS = Number(process.env.RENDER_JOB_TIMEOUT_MS) || 120_000;
+
+// 상주 Python 렌더 워커 (render_worker.py)
+// 프로세스를 한 번만 띄우고 JSON-lines로 작업을 주고받아 매 요청의 인터프리터/import/폰트 등록 비용을 제거한다.
+// output이 '-'인 작업은 결과 줄({"bytes": N}) 뒤에 PDF 바이트 N개가 이어지므로 stdout을 바이트 단위로 읽는다.
+// 워커는 시작 준비가 끝나면 {"ready": true} 줄을 보내고, 그때 ready가 완료된다.
+class RenderWorker {
+  private proc: ChildProcessWithoutNullStreams;
+  readonly ready: Promise<void>;
+  private markReady!: () => void;
+  private failReady!: (error: Error) => void;
+  private pending = new Map<string, PendingJob>();
+  private nextId = 0;
+  private stderrTail = '';
+  // 아직 처리하지 않은 stdout 조각 (결과 줄 또는 PDF 바이트)
+  private chunks: Buffer[] = [];
+  private buffered = 0;
+  // PDF 바이트를 기다리는 결과 (결과 줄은 읽었고 본문이 아직 덜 도착한 상태)
+  private awaitingBody: RenderResult | null = null;
+  alive = true;
+
+  constructor(scriptsDir: string, env: NodeJS.ProcessEnv) {
+    this.ready = new Promise((resolve, reject) => {
+      this.markReady = resolve;
+      this.failReady = reject;
+    });
+    // 준비 전에 종료되어도 기다리는 쪽이 없으면 처리되지 않은 거부로 남지 않게 한다
+    this.ready.catch(() => {});
+
+    this.proc = spawn('python', [path.join(scriptsDir, 'render_worker.py')], {
+      cwd: scriptsDir,
+      env,
     });
 
-    let stdout = '';
-    let stderr = '';
+    this.proc.stdout.on('data', (chunk: Buffer) => this.handleData(chunk));
 
-    python.stdout.on('data', (data) => {
-      stdout += data.toString();
+    this.proc.stderr.on('data', (data) => {
+      this.stderrTail = (this.stderrTail + data.toString()).slice(-4000);
     });
 
-    python.stderr.on('data', (data) => {
-      stderr += data.toString();
+    this.proc.stdin.on('error', (err) => {
+      this.fail(new Error(`Render worker stdin error: ${err.message}`));
     });
 
-    python.on('close', (code) => {
-      if (code === 0) {
-        resolve(stdout);
-      } else {
-        reject(new Error(`Python script failed: ${stderr || stdout}`));
+    this.proc.on('error', (err) => {
+      this.fail(new Error(`Failed to start Python: ${err.message}`));
+    });
+
+    this.proc.on('close', (code) => {
+      this.fail(new Error(`Render worker exited (code ${code}): ${this.stderrTail}`));
+    });
+  }
+
+  // 강제 종료 (진행 중인 작업은 error로 실패 처리)
+  kill(error: Error) {
+    this.fail(error);
+    this.proc.kill('SIGKILL');
+  }
+
+  run(request: RenderRequest): Promise<RenderResult> {
+    return new Promise((resolve, reject) => {
+      if (!this.alive) {
+        reject(new Error('Render worker is not running'));
+        return;
       }
+
+      const id = String(++this.nextId);
+      this.pending.set(id, { resolve, reject });
+      this.proc.stdin.write(JSON.stringify({ id, ...request }) + '\n');
     });
+  }
+
+  private handleData(chunk: Buffer) {
+    this.chunks.push(chunk);
+    this.buffered += chunk.length;
+
+    // PDF 본문이 다 도착할 때까지는 합치지 않는다 (큰 PDF를 조각마다 다시 복사하지 않도록)
+    if (this.awaitingBody && this.buffered < (this.awaitingBody.bytes ?? 0)) return;
+
+    let data = Buffer.concat(this.chunks, this.buffered);
+    for (;;) {
+      if (this.awaitingBody) {
+        const size = this.awaitingBody.bytes ?? 0;
+        if (data.length < size) break;
+
+        const result = this.awaitingBody;
+        result.pdf = data.subarray(0, size);
+        data = data.subarray(size);
+        this.awaitingBody = null;
+        this.settle(result);
+        continue;
+      }
+
+      const newline = data.indexOf(0x0a);
+      if (newline < 0) break;
+
+      const line = data.subarray(0, newline).toString('utf-8');
+      data = data.subarray(newline + 1);
+      this.handleLine(line);
+    }
+
+    this.chunks = data.length ? [data] : [];
+    this.buffered = data.length;
+  }
+
+  private handleLine(line: string) {
+    let result: RenderResult;
+    try {
+      result = JSON.parse(line);
+    } catch {
+      console.error('Invalid render worker output:', line);
+      return;
+    }
+
+    if (result.ready) {
+      this.markReady();
+      return;
+    }
+
+    if (result.success && result.bytes !== undefined) {
+      this.awaitingBody = result;
+      return;
+    }
+    this.settle(result);
+  }
+
+  private settle(result: RenderResult) {
+    const job = this.pending.get(String(result.id));
+    if (!job) return;
+
+    this.pending.delete(String(result.id));
+    job.resolve(result);
+  }
+
+  private fail(error: Error) {
+    this.alive = false;
+    this.failReady(error);
+    for (const job of this.pending.values()) {
+      job.reject(error);
+    }
+    this.pending.clear();
+  }
+}
+
+// 렌더 워커 풀: 워커마다 한 번에 작업 하나만 맡겨 큰 작업이 다른 사용자의 요청을 막지 않게 한다.
+// 워커는 필요할 때 size개까지 띄우고, 시간 초과나 종료된 워커는 버린 뒤 다음 작업에서 새로 띄운다.
+// 워커 여러 개가 동시에 작업하므로 작업 안의 차트 동시 렌더는 끈다 (render_server.py와 같은 기준, GEO_CHART_WORKERS를 지정하면 우선).
+class RenderPool {
+  private workers = new Set<RenderWorker>();
+  private idle: RenderWorker[] = [];
+  private queue: QueuedJob[] = [];
+  private scriptsDir: string;
+  private size: number;
+  private timeoutMs: number;
+  private env: NodeJS.ProcessEnv;
+
+  constructor(scriptsDir: string, size: number, timeoutMs: number) {
+    this.scriptsDir = scriptsDir;
+    this.size = size;
+    this.timeoutMs = timeoutMs;
+    this.env = size > 1
+      ? { ...process.env, GEO_CHART_WORKERS: process.env.GEO_CHART_WORKERS || '1' }
+      : process.env;
+  }
 
-    python.on('error', (err) => {
-      reject(new Error(`Failed to start Python: ${err.message}`));
+  run(request: RenderRequest): Promise<RenderResult> {
+    return new Promise((resolve, reject) => {
+      this.queue.push({ request, resolve, reject });
+      this.dispatch();
     });
-  });
+  }
+
+  private dispatch() {
+    while (this.queue.length) {
+      let worker = this.idle.pop();
+      if (worker && !worker.alive) {
+        this.workers.delete(worker);
+        continue;
+      }
+      if (!worker) {
+        if (this.workers.size >= this.size) return;
+        worker = new RenderWorker(this.scriptsDir, this.env);
+        this.workers.add(worker);
+      }
+      this.execute(worker, this.queue.shift()!);
+    }
+  }
+
+  // timeoutMs 안에 끝나지 않으면 워커를 종료한다
+  private deadline(worker: RenderWorker, message: string) {
+    return setTimeout(() => {
+      worker.kill(new Error(`${message} after ${this.timeoutMs} ms`));
+    }, this.timeoutMs);
+  }
+
+  private async execute(worker: RenderWorker, job: QueuedJob) {
+    let timer = this.deadline(worker, 'Render worker did not become ready');
+
+    try {
+      await worker.ready;
+      clearTimeout(timer);
+      timer = this.deadline(worker, 'Render job timed out');
+      job.resolve(await worker.run(job.request));
+    } catch (error) {
+      job.reject(error instanceof Error ? error : new Error(String(error)));
+    } finally {
+      clearTimeout(timer);
+      if (worker.alive) {
+        this.idle.push(worker);
+      } else {
+        this.workers.delete(worker);
+      }
+      this.dispatch();
+    }
+  }
 }
 
-export async function generateReportPdf(
-  reportData: ReportData
-): Promise<{ success: boolean; pdfPath?: string; error?: string }> {
-  // scripts 폴더는 src/scripts 또는 dist/scripts에 위치
-  const scriptsDir = path.join(__dirname, '..', 'scripts');
-  const tempDir = path.join(__dirname, '..', '..', 'temp', `report_${Date.now()}`);
-  const chartsDir = path.join(tempDir, 'charts');
-  const jsonPath = path.join(tempDir, 'report_data.json');
-  const pdfPath = path.join(tempDir, 'report.pdf');
+const renderPool = new RenderPool(path.join(__dirname, '..', 'scripts'), RENDER_WORKERS, RENDER_JOB_TIMEOUT_MS);
 
-  try {
-    // 임시 디렉토리 생성
-    await fs.mkdir(chartsDir, { recursive: true });
-
-    // 차트 데이터 준비
-    const chartData = {
-      trend: reportData.trend || {
-        dates: ['1주차', '2주차', '3주차', '4주차'],
-        citationRates: [
-          reportData.metrics.citationRate - 10,
-          reportData.metrics.citationRate - 5,
-          reportData.metrics.citationRate - 2,
-          reportData.metrics.citationRate,
-        ],
-      },
-      enginePerformance: {
-        engines: reportData.enginePerformance.map((e) => e.engine),
-        citationRates: reportData.enginePerformance.map((e) => e.citationRate),
-      },
-      categoryDistribution: reportData.categoryDistribution || {
-        categories: ['제품 추천', '서비스 비교', '기술 문의', '기타'],
-        values: [35, 28, 22, 15],
-      },
-      topQueries: {
-        queries: reportData.topQueries.slice(0, 5).map((q) => q.query),
-        citationRates: reportData.topQueries.slice(0, 5).map((q) => q.citationRate),
-      },
-      metrics: {
-        citationRate: reportData.metrics.citationRate,
-        citationRateChange: reportData.metrics.citationRateChange,
-        totalTests: reportData.metrics.totalTests,
-        avgRank: reportData.metrics.avgRank,
-        shareOfVoice: reportData.metrics.shareOfVoice,
-      },
-    };
+async function runRenderJob(request: RenderRequest): Promise<RenderResult> {
+  const result = await renderPool.run(request);
+  if (!result.success) {
+    throw new Error(`Python script failed: ${result.error}`);
+  }
+  if (result.stats) {
+    console.log(`Render stats: ${JSON.stringify({ job: request.job, ...result.stats })}`);
+  }
+  return result;
+}
 
-    // JSON 데이터 저장
-    await fs.writeFile(jsonPath, JSON.stringify(chartData, null, 2), 'utf-8');
+// 서비스가 찍는 렌더 시각: 오늘 날짜의 시작 (UTC)
+// 같은 날 같은 입력을 다시 내려받으면 같은 renderedAt이 되어 render_cache의 PDF를 그대로 사용한다.
+function renderDay(now = new Date()): string {
+  return `${now.toISOString().split('T')[0]}T00:00:00Z`;
+}
 
-    // 차트 생성 스크립트 실행
-    const chartsScript = path.join(scriptsDir, 'generate_report_charts.py');
-    console.log('Generating charts...');
-    await runPythonScript(chartsScript, [jsonPath, chartsDir]);
+// 렌더 워커에서 PDF 바이트를 직접 받아 반환 (임시 파일/디렉토리 없음)
+async function renderPdf(request: Omit<RenderRequest, 'output'>): Promise<Buffer> {
+  const result = await runRenderJob({ ...request, output: '-' });
+  if (!result.pdf) {
+    throw new Error('Render worker returned no PDF data');
+  }
+  return result.pdf;
+}
 
+export async function generateReportPdf(
+  reportData: ReportData
+): Promise<{ success: boolean; pdf?: Buffer; error?: string }> {
+  try {
     // PDF용 전체 데이터 준비
+    const renderedAt = renderDay();
     const pdfData = {
       ...reportData,
-      generatedAt: new Date().toISOString().split('T')[0],
+      generatedAt: renderedAt.split('T')[0],
     };
-    await fs.writeFile(jsonPath, JSON.stringify(pdfData, null, 2), 'utf-8');
 
-    // PDF 생성 스크립트 실행
-    const pdfScript = path.join(scriptsDir, 'generate_pdf.py');
-    console.log('Generating PDF...');
-    await runPythonScript(pdfScript, [jsonPath, chartsDir, pdfPath]);
-
-    // PDF 파일 존재 확인
-    await fs.access(pdfPath);
+    // 차트 + PDF 생성 (차트 데이터 구성과 삽입은 generate_report.py에서 한 번에 처리)
+    console.log('Generating report PDF with charts...');
+    // 렌더 날짜를 찍고, 같은 날 다시 내려받으면 캐시된 PDF를 사용
+    const pdf = await renderPdf({
+      job: 'report',
+      data: pdfData,
+      renderedAt,
+    });
 
     return {
       success: true,
-      pdfPath,
+      pdf,
     };
   } catch (error) {
     console.error('PDF generation error:', error);
@@ -165,15 +401,6 @@ export async function generateReportPdf(
   }
 }
 
-export async function cleanupTempFiles(pdfPath: string): Promise<void> {
-  try {
-    const tempDir = path.dirname(pdfPath);
-    await fs.rm(tempDir, { recursive: true, force: true });
-  } catch (error) {
-    console.error('Cleanup error:', error);
-  }
-}
-
 // GEO Score PDF 생성
 export interface GeoScoreData {
   url: string;
@@ -213,34 +440,28 @@ export interface GeoScoreData {
     suggestion: string;
     impact: string;
   }>;
+  // 페이지 분석 표시 방식 (생략 시 routes, full은 전체 페이지 목록이라 큰 사이트에서 수천 쪽이 될 수 있음)
+  pageAnalysis?: 'routes' | 'full';
+  // 라우트 그룹 깊이 (1~3, 기본 1 = 첫 번째 경로 세그먼트)
+  routeDepth?: number;
 }
 
 export async function generateGeoScorePdf(
   scoreData: GeoScoreData
-): Promise<{ success: boolean; pdfPath?: string; error?: string }> {
-  const scriptsDir = path.join(__dirname, '..', 'scripts');
-  const tempDir = path.join(__dirname, '..', '..', 'temp', `geo_score_${Date.now()}`);
-  const jsonPath = path.join(tempDir, 'score_data.json');
-  const pdfPath = path.join(tempDir, 'geo_score_report.pdf');
-
+): Promise<{ success: boolean; pdf?: Buffer; error?: string }> {
   try {
-    // 임시 디렉토리 생성
-    await fs.mkdir(tempDir, { recursive: true });
-
-    // JSON 데이터 저장
-    await fs.writeFile(jsonPath, JSON.stringify(scoreData, null, 2), 'utf-8');
-
-    // PDF 생성 스크립트 실행
-    const pdfScript = path.join(scriptsDir, 'generate_geo_score_pdf.py');
+    // PDF 생성
     console.log('Generating GEO Score PDF...');
-    await runPythonScript(pdfScript, [jsonPath, pdfPath]);
-
-    // PDF 파일 존재 확인
-    await fs.access(pdfPath);
+    // 렌더 날짜를 찍고, 같은 날 같은 감사를 다시 내려받으면 캐시된 PDF를 사용
+    const pdf = await renderPdf({
+      job: 'geo_score_pdf',
+      data: scoreData,
+      renderedAt: renderDay(),
+    });
 
     return {
       success: true,
-      pdfPath,
+      pdf,
     };
   } catch (error) {
     console.error('GEO Score PDF generation error:', error);
@@ -292,30 +513,20 @@ export interface InsightsData {
 
 export async function generateInsightsPdf(
   insightsData: InsightsData
-): Promise<{ success: boolean; pdfPath?: string; error?: string }> {
-  const scriptsDir = path.join(__dirname, '..', 'scripts');
-  const tempDir = path.join(__dirname, '..', '..', 'temp', `insights_${Date.now()}`);
-  const jsonPath = path.join(tempDir, 'insights_data.json');
-  const pdfPath = path.join(tempDir, 'insights_report.pdf');
-
+): Promise<{ success: boolean; pdf?: Buffer; error?: string }> {
   try {
-    // 임시 디렉토리 생성
-    await fs.mkdir(tempDir, { recursive: true });
-
-    // JSON 데이터 저장
-    await fs.writeFile(jsonPath, JSON.stringify(insightsData, null, 2), 'utf-8');
-
-    // PDF 생성 스크립트 실행
-    const pdfScript = path.join(scriptsDir, 'generate_insights_pdf.py');
+    // PDF 생성
     console.log('Generating AI Insights PDF...');
-    await runPythonScript(pdfScript, [jsonPath, pdfPath]);
-
-    // PDF 파일 존재 확인
-    await fs.access(pdfPath);
+    // 렌더 날짜를 찍고, 같은 날 같은 인사이트를 다시 내려받으면 캐시된 PDF를 사용
+    const pdf = await renderPdf({
+      job: 'insights_pdf',
+      data: insightsData,
+      renderedAt: renderDay(),
+    });
 
     return {
       success: true,
-      pdfPath,
+      pdf,
     };
   } catch (error) {
     console.error('AI Insights PDF generation error:', error);